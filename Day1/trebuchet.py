@@ -34,57 +34,256 @@ Your puzzle answer was 54208.
 """
 
 
+import os
 import re
+from collections import deque
+from functools import lru_cache, partial
+from itertools import islice
+from aoc.inputs import Records, default_input, ensure_parsed, line_chunks, mapped, split_records
+from aoc.parallel import parallel_map
 
 digits = {
-    "one": "1",
-    "two": "2",
-    "three": "3",
-    "four": "4",
-    "five": "5",
-    "six": "6",
-    "seven": "7",
-    "eight": "8",
-    "nine": "9",
+    b"one": b"1",
+    b"two": b"2",
+    b"three": b"3",
+    b"four": b"4",
+    b"five": b"5",
+    b"six": b"6",
+    b"seven": b"7",
+    b"eight": b"8",
+    b"nine": b"9",
 }
 
+# Words that stand for digits in the second puzzle, by name. A vocabulary can also be given as a
+# mapping of words (str or bytes) to values, e.g. {**VOCABULARIES["english"], "zero": 0}.
+VOCABULARIES = {
+    "english": {word: int(digit) for word, digit in digits.items()},
+    "german": {"eins": 1, "zwei": 2, "drei": 3, "vier": 4, "fünf": 5, "sechs": 6, "sieben": 7, "acht": 8, "neun": 9},
+    "spanish": {"uno": 1, "dos": 2, "tres": 3, "cuatro": 4, "cinco": 5, "seis": 6, "siete": 7, "ocho": 8, "nueve": 9},
+}
+DEFAULT_VOCABULARY = "english"
+# Compiled matchers kept per process, the least recently used one is dropped beyond this
+MATCHER_CACHE_SIZE = 16
+
+# Every byte but the digits and the newlines, deleted by the bulk scan of the first puzzle
+NOT_DIGITS = bytes(byte for byte in range(256) if byte not in b"0123456789\n")
+# The document is scanned in chunks of this size, so its size does not matter, and the chunks
+# are shared out between the workers of aoc.parallel when there are several
+CHUNK_SIZE = 1 << 24
+
+def as_bytes(line):
+    """ A line as bytes, text lines are encoded as UTF-8 like the words of the vocabularies. """
+    return line.encode() if isinstance(line, str) else line
+
 def first_puzzle_solution(line):
     """
     Solves the first puzzle by extracting the first and last digit from the line and forming a two-digit number.
     """
-    digits = re.findall(r'\d', line)
+    digits = re.findall(rb'\d', as_bytes(line))
 
     return int(digits[0] + digits[-1])
 
-def second_puzzle_solution(line):
+def calibration_sum(lines):
+    """
+    Solves the first puzzle for a whole chunk of lines at once. Deleting everything but the
+    digits and the newlines leaves every line as its digits alone, so the first digits are the
+    ones that follow a newline and the last digits the ones that precede a newline, which
+    bytes.count tallies digit by digit without a Python object per line. Like the line by line
+    solution, it raises an error for a line without any digit (ValueError here).
+    """
+    digits_only = b"\n" + lines.translate(None, NOT_DIGITS) + b"\n"
+    total = lines_with_digits = 0
+    for digit in range(10):
+        byte = bytes([ord("0") + digit])
+        firsts = digits_only.count(b"\n" + byte)
+        lines_with_digits += firsts
+        total += digit * (10 * firsts + digits_only.count(byte + b"\n"))
+    # Every record has a first digit, except that a final newline does not start a record
+    if lines_with_digits != lines.count(b"\n") + (not lines.endswith(b"\n")):
+        # A line without digits is left empty, find it to report it
+        index = digits_only.count(b"\n", 0, digits_only.find(b"\n\n") + 1) - 1
+        line = next(islice(split_records(lines), index, None))
+        raise ValueError(f"no digit in the line {line!r}")
+    return total
+
+def build_automaton(words):
+    """
+    Builds an Aho-Corasick automaton over the (word, value) pairs, as a list of transition dicts
+    (state -> {byte: next state}) and a list of outputs. Following the failure links at build
+    time makes the transitions complete: a byte missing from a state leads back to the root.
+    The output of a state is the (length, value) of the longest word ending there, or None.
+    """
+    transitions, outputs, failures = [{}], [None], [0]
+    for word, value in words:
+        state = 0
+        for byte in word:
+            if byte not in transitions[state]:
+                transitions.append({})
+                outputs.append(None)
+                failures.append(0)
+                transitions[state][byte] = len(transitions) - 1
+            state = transitions[state][byte]
+        outputs[state] = (len(word), value)
+
+    # Breadth-first, so the failure state of a state is complete before the state itself
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        failure = failures[state]
+        if outputs[state] is None:
+            outputs[state] = outputs[failure]
+        for byte, target in transitions[state].items():
+            failures[target] = transitions[failure].get(byte, 0)
+            queue.append(target)
+        # Bytes that cannot extend the state continue from its failure state instead
+        for byte, target in transitions[failure].items():
+            transitions[state].setdefault(byte, target)
+    return transitions, outputs
+
+def scan(automaton, data, longest):
+    """
+    Value of the word that starts first in the data (the shortest one if several start there),
+    or None. Scanning stops once no longer word can start before the first match found, so the
+    rest of a line is never read.
+    """
+    transitions, outputs = automaton
+    state, first_start, first_value = 0, None, None
+    for position, byte in enumerate(data):
+        state = transitions[state].get(byte, 0)
+        output = outputs[state]
+        if output is not None and (first_start is None or position - output[0] + 1 < first_start):
+            first_start, first_value = position - output[0] + 1, output[1]
+        if first_start is not None and position >= first_start + longest - 2:
+            break
+    return first_value
+
+class DigitMatcher:
+    """
+    Finds the first and the last digit of a line among words that stand for digits, with an
+    automaton over the words for the first one and an automaton over the reversed words,
+    scanning the line from its end, for the last one. Overlapping words such as "eightwo"
+    give 8 as the first digit and 2 as the last.
+    """
+
+    def __init__(self, words):
+        self.forward = build_automaton(words.items())
+        self.backward = build_automaton((word[::-1], value) for word, value in words.items())
+        self.longest = max(map(len, words))
+
+    def first(self, line):
+        """ Value of the first digit of a line (bytes or text), None if it has none. """
+        return scan(self.forward, as_bytes(line), self.longest)
+
+    def last(self, line):
+        """ Value of the last digit of a line (bytes or text), None if it has none. """
+        return scan(self.backward, reversed(as_bytes(line)), self.longest)
+
+    def calibration_value(self, line):
+        line = as_bytes(line)
+        first = self.first(line)
+        if first is None:
+            raise ValueError(f"no digit in the line {line!r}")
+        return first * 10 + self.last(line)
+
+def vocabulary_key(vocabulary):
+    """
+    The words of a vocabulary (a name of VOCABULARIES or a mapping) as sorted (bytes, value)
+    pairs, with the ten digits themselves added. Equal vocabularies get equal keys.
+    """
+    if isinstance(vocabulary, str):
+        if vocabulary not in VOCABULARIES:
+            raise ValueError(f"unknown vocabulary: {vocabulary!r}")
+        vocabulary = VOCABULARIES[vocabulary]
+    words = {bytes([byte]): byte - ord("0") for byte in b"0123456789"}
+    for word, value in vocabulary.items():
+        word = word.encode() if isinstance(word, str) else bytes(word)
+        if not word:
+            raise ValueError("a vocabulary cannot have an empty word")
+        words[word] = int(value)
+    return tuple(sorted(words.items()))
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def compiled_matcher(key):
+    """ The matcher of a key of vocabulary_key. """
+    return DigitMatcher(dict(key))
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def named_matcher(name):
+    """ The matcher of a vocabulary of VOCABULARIES, found from its name alone after its first use. """
+    return compiled_matcher(vocabulary_key(name))
+
+def digit_matcher(vocabulary=DEFAULT_VOCABULARY):
+    """
+    The matcher of a vocabulary, built on its first use and then taken from a bounded cache. A
+    DigitMatcher is returned as is, a name or a key of vocabulary_key is looked up directly,
+    and only a mapping is normalized into its key on every call, so hold on to its matcher.
+    """
+    if isinstance(vocabulary, DigitMatcher):
+        return vocabulary
+    if isinstance(vocabulary, str):
+        return named_matcher(vocabulary)
+    if isinstance(vocabulary, tuple):
+        return compiled_matcher(vocabulary)
+    return compiled_matcher(vocabulary_key(vocabulary))
+
+def second_puzzle_solution(line, vocabulary=DEFAULT_VOCABULARY):
     """
     Solves the second puzzle by identifying spelled-out numbers and digits, and forming a two-digit number from the first and last digit found.
+    The vocabulary can be a DigitMatcher already built by digit_matcher.
+    """
+    return digit_matcher(vocabulary).calibration_value(line)
+
+def document_chunks(lines):
+    """
+    The chunks of whole lines of a document: (path, start, end) for a file, which the workers
+    map themselves so only the offsets are sent to them, and the bytes of the chunk for a text.
     """
-    pattern = '|'.join(digits.keys())
-    regex = re.compile(pattern)
+    with mapped(lines.source) as buffer:
+        bounds = list(line_chunks(buffer, CHUNK_SIZE))
+        if isinstance(lines.source, os.PathLike):
+            return [(lines.source, start, end) for start, end in bounds]
+        return [buffer[start:end] for start, end in bounds]
 
-    extracted_digits = []
+def chunk_sums(parts, vocabulary, chunk):
+    """ The partial sums of the calibration values of the parts over the lines of one chunk. """
+    if not isinstance(chunk, bytes):
+        path, start, end = chunk
+        with mapped(path) as buffer:
+            chunk = buffer[start:end]
+    matcher = digit_matcher(vocabulary)
+    return [calibration_sum(chunk) if part == 1 else sum(second_puzzle_solution(line, matcher) for line in split_records(chunk))
+            for part in parts]
 
-    i = 0
-    while i < len(line):
-        match = regex.match(line, i)
-        if match:
-            extracted_digits.append(digits[match.group()])
-            i = match.start() + 1
-        else:
-            if line[i].isdigit():
-                extracted_digits.append(line[i])
-            i += 1
+def calibrate(puzzle, parts=(1, 2), vocabulary=DEFAULT_VOCABULARY):
+    """
+    Sums of the calibration values of the parts, solved chunk by chunk (in parallel when there
+    are workers) and added up. Both parts together read the document once. The vocabulary of
+    the second part is sent to the workers as its name or its key (or as the matcher itself),
+    and each worker compiles it once.
+    """
+    lines = ensure_parsed(puzzle, parse)
+    if isinstance(vocabulary, str):
+        digit_matcher(vocabulary)  # an unknown name fails here rather than in every worker
+    elif not isinstance(vocabulary, DigitMatcher):
+        vocabulary = vocabulary_key(vocabulary)
+    partial_sums = parallel_map(partial(chunk_sums, parts, vocabulary), document_chunks(lines))
+    return [sum(column) for column in zip(*partial_sums)] or [0] * len(parts)
 
-    return int(extracted_digits[0] + extracted_digits[-1])
+def parse(source):
+    """ The lines of the calibration document, read one at a time. """
+    return Records(source)
 
-with open("input.txt") as file:
-    lines = file.readlines()
+def part1(puzzle):
+    """ Sum of the calibration values built from the digits only. """
+    return calibrate(puzzle, (1,))[0]
 
+def part2(puzzle, vocabulary=DEFAULT_VOCABULARY):
+    """ Sum of the calibration values built from digits and spelled-out digits. """
+    return calibrate(puzzle, (2,), vocabulary)[0]
 
-    sum_first_puzzle = sum([first_puzzle_solution(line) for line in lines])
-    sum_second_puzzle = sum([second_puzzle_solution(line) for line in lines])
 
-    print("First puzzle solution:", sum_first_puzzle)
-    print("Second puzzle solution:", sum_second_puzzle)
+if __name__ == "__main__":
+    lines = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(lines))
+    print("Second puzzle solution:", part2(lines))
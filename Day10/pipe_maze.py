@@ -1,138 +1,109 @@
+from collections import deque
+
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+
+GROUND, START = ord('.'), ord('S')
+
+
 def parse_layout(layout):
     """
-    Parse the layout into a grid and return the grid and the starting position.
+    Parse the layout into a grid bordered by ground and return the grid and the index of the
+    starting position.
     """
-    grid = [list(line) for line in layout.split('\n')]
-    start_pos = None
-
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == 'S':
-                start_pos = (x, y)
-                break
-        if start_pos:
-            break
-
-    return grid, start_pos
+    grid = Grid.from_text(layout, border=GROUND)
+    return grid, grid.find(START)
 
 
 # Define the connections for each pipe type
 connections = {
-    '|': [(0, 1), (0, -1)],
-    '-': [(1, 0), (-1, 0)],
-    'L': [(1, 0), (0, -1)],
-    'J': [(-1, 0), (0, -1)],
-    '7': [(-1, 0), (0, 1)],
-    'F': [(1, 0), (0, 1)],
+    ord('|'): [(0, 1), (0, -1)],
+    ord('-'): [(1, 0), (-1, 0)],
+    ord('L'): [(1, 0), (0, -1)],
+    ord('J'): [(-1, 0), (0, -1)],
+    ord('7'): [(-1, 0), (0, 1)],
+    ord('F'): [(1, 0), (0, 1)],
 }
 
+def pipe_offsets(grid):
+    """
+    The connections of each pipe type as offsets between flat indices of the grid.
+    """
+    return {pipe: [dx + dy * grid.stride for dx, dy in directions] for pipe, directions in connections.items()}
+
 def infer_start_tile(grid, start_pos):
     """
     Infer the starting tile type from the connections of its neighbors.
     """
-    x, y = start_pos
-    for pipe_type, directions in connections.items():
-        connected_neighbors = 0
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < len(grid[0]) and 0 <= ny < len(grid) and grid[ny][nx] not in ['.', 'S']:
-                neighbor_directions = connections.get(grid[ny][nx], [])
-                if (-dx, -dy) in neighbor_directions:
-                    connected_neighbors += 1
+    offsets = pipe_offsets(grid)
+    for pipe_type, directions in offsets.items():
+        # Ground, the border and the start itself connect to nothing
+        connected_neighbors = sum(1 for offset in directions if -offset in offsets.get(grid[start_pos + offset], []))
         # The correct tile type should connect to exactly two neighbors
         if connected_neighbors == 2:
             return pipe_type
     return None
 
-def get_neighbors(pos, grid):
+def get_neighbors(pos, grid, offsets):
     """
     Get the neighbors of a given position that are part of the pipe.
     """
-    x, y = pos
-    neighbors = []
+    return [pos + offset for offset in offsets.get(grid[pos], []) if grid[pos + offset] in offsets]
 
-    # Check each direction
-    for dx, dy in connections.get(grid[y][x], []):
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < len(grid[0]) and 0 <= ny < len(grid) and grid[ny][nx] in connections:
-            neighbors.append((nx, ny))
 
-    return neighbors
-
-
-def find_loop_length(grid, start_pos, start_tile_type):
+def find_loop_length(grid, start_pos):
     """
     Find the length of the loop starting at the starting position.
     """
-
-    # Replace 'S' with its inferred type for the traversal
-    x, y = start_pos
-    grid[y][x] = start_tile_type
-
+    offsets = pipe_offsets(grid)
     visited = set()
-    to_visit = [(start_pos, 0)]
+    to_visit = deque([(start_pos, 0)])
     max_distance = 0
 
     while to_visit:
-        current_pos, distance = to_visit.pop(0)
+        current_pos, distance = to_visit.popleft()
         if current_pos in visited:
             continue
 
         visited.add(current_pos)
         max_distance = max(max_distance, distance)
 
-        for neighbor in get_neighbors(current_pos, grid):
+        for neighbor in get_neighbors(current_pos, grid, offsets):
             if neighbor not in visited:
                 to_visit.append((neighbor, distance + 1))
 
     return max_distance
 
 
-def find_loop_boundaries(grid, start_pos, start_tile_type):
+def find_loop_boundaries(grid, start_pos):
     """
-    Find the boundaries of the loop and return them as a dictionary.
+    Find the cells of the loop and return their flat indices.
     """
-    # Replace 'S' with its inferred type for traversal
-    x, y = start_pos
-    grid[y][x] = start_tile_type
-
+    offsets = pipe_offsets(grid)
     visited = set()
-    to_visit = [(start_pos, 0)]
-    boundaries = {}
+    to_visit = [start_pos]
 
     while to_visit:
-        current_pos, _ = to_visit.pop(0)
+        current_pos = to_visit.pop()
         if current_pos in visited:
             continue
 
         visited.add(current_pos)
-        x, y = current_pos
-
-        # Add the X-coordinate to the list of boundaries for this Y-coordinate
-        if y not in boundaries:
-            boundaries[y] = []
-        boundaries[y].append(x)
-
-        for neighbor in get_neighbors(current_pos, grid):
+        for neighbor in get_neighbors(current_pos, grid, offsets):
             if neighbor not in visited:
-                to_visit.append((neighbor, 0))
-
-    # Sort the X-coordinates for each Y-coordinate
-    for y in boundaries:
-        boundaries[y].sort()
+                to_visit.append(neighbor)
 
-    return boundaries
+    return visited
 
 
 def clean_layout(grid, boundaries):
     """
     Clean the layout to keep only the pipes that are part of the loop.
     """
-    cleaned_grid = [['.' for _ in range(len(grid[0]))] for _ in range(len(grid))]
+    cleaned_grid = Grid(grid.width, grid.height, grid.pad, border=GROUND)  # all ground
 
-    for y in boundaries:
-        for x in boundaries[y]:
-            cleaned_grid[y][x] = grid[y][x]
+    for index in boundaries:
+        cleaned_grid[index] = grid[index]
 
     return cleaned_grid
 
@@ -141,36 +112,47 @@ def count_enclosed_tiles(grid):
     Count the number of tiles enclosed within the loop.
     """
     enclosed_tiles = 0
+    crossings = b'|LJ'
 
-    for row in grid:
+    for row in grid.rows():
         inside_loop = False
         for tile in row:
-            if tile in ['|', 'L', 'J']:
+            if tile in crossings:
                 inside_loop = not inside_loop
-            elif inside_loop and tile == '.':
+            elif inside_loop and tile == GROUND:
                 enclosed_tiles += 1
 
     return enclosed_tiles
 
+def parse(source):
+    """
+    Parse the layout and replace the starting position with its inferred tile type.
+    Returns the grid, the starting position and the starting tile type.
+    """
+    grid, start_pos = parse_layout(read_bytes(source))
+    start_tile_type = infer_start_tile(grid, start_pos)
+    grid[start_pos] = start_tile_type
+    return grid, start_pos, start_tile_type
 
+def part1(puzzle):
+    """ Number of steps to the farthest point of the loop. """
+    grid, start_pos, start_tile_type = ensure_parsed(puzzle, parse)
+    return find_loop_length(grid, start_pos)
 
-with open("input.txt") as file:
-    pipe_layout = file.read()
-
-    # Parse the layout and find the loop length
-    grid, start_pos = parse_layout(pipe_layout)
-    # Infer the starting tile type
-    start_tile_type = infer_start_tile(grid, start_pos)
-    # Find the loop length
-    loop_length = find_loop_length(grid, start_pos, start_tile_type)
+def part2(puzzle):
+    """ Number of tiles enclosed by the loop. """
+    grid, start_pos, start_tile_type = ensure_parsed(puzzle, parse)
 
     # Find the boundaries of the loop
-    boundaries = find_loop_boundaries(grid, start_pos, start_tile_type)
+    boundaries = find_loop_boundaries(grid, start_pos)
     # Clean the layout to keep only the pipes that are part of the loop
     cleaned_grid = clean_layout(grid, boundaries)
     # Count the number of tiles enclosed within the loop
-    enclosed_tiles = count_enclosed_tiles(cleaned_grid)
+    return count_enclosed_tiles(cleaned_grid)
+
 
-    print("First puzzle solution:", loop_length)
-    print("Second puzzle solution:", enclosed_tiles)
+if __name__ == "__main__":
+    maze = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(maze))
+    print("Second puzzle solution:", part2(maze))
@@ -1,37 +1,43 @@
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+
+EMPTY = b'.'
+
+
 def parse_map(input_data):
-    """ Parses the input data into a map format """
-    return [list(line) for line in input_data.splitlines()]
+    """ Parses the input data into a grid """
+    return Grid.from_text(input_data)
+
+def is_empty(line):
+    """ Checks if a row or column of the map holds no galaxy """
+    return not line.strip(EMPTY)
 
 def expand_universe(map):
     """ Expands the universe by adding empty rows and columns adjacent to each empty row or column """
-    expanded_map = []
-
     # Add an empty row below each empty row
-    for row in map:
-        expanded_map.append(row)
-        if all(cell == '.' for cell in row):
-            expanded_map.append(['.'] * len(row))
-
-    # Transpose to add columns
-    transposed_map = list(zip(*expanded_map))
-    expanded_transposed_map = []
-
-    # Add an empty column to the right of each empty column
-    for col in transposed_map:
-        expanded_transposed_map.append(col)
-        if all(cell == '.' for cell in col):
-            expanded_transposed_map.append(tuple('.' for _ in col))
+    expanded_rows = []
+    for row in map.rows():
+        expanded_rows.append(row)
+        if is_empty(row):
+            expanded_rows.append(row)
+
+    # Add an empty column to the right of each empty column, as rows of the transposed map
+    expanded_columns = []
+    for col in Grid.from_lines(expanded_rows).columns():
+        expanded_columns.append(col)
+        if is_empty(col):
+            expanded_columns.append(col)
 
     # Transpose back to original format
-    return [list(row) for row in zip(*expanded_transposed_map)]
+    return Grid.from_lines(expanded_columns).transposed()
 
 def identify_galaxies(map):
     """ Identifies galaxies and stores their coordinates """
     galaxies = {}
     galaxy_number = 1
-    for y, row in enumerate(map):
+    for y, row in enumerate(map.rows()):
         for x, cell in enumerate(row):
-            if cell != '.':
+            if cell not in EMPTY:
                 galaxies[galaxy_number] = (x, y)
                 galaxy_number += 1
     return galaxies
@@ -53,13 +59,13 @@ def get_scaled_coordinates(galaxies, map, scaling_factor):
     scaled_galaxies = {}
 
     # Count the number of empty rows and columns before each point in the map
-    empty_rows_count = [0] * len(map)
-    for i in range(1, len(map)):
-        empty_rows_count[i] = empty_rows_count[i - 1] + (1 if all(cell == '.' for cell in map[i - 1]) else 0)
+    empty_rows_count = [0] * map.height
+    for i, row in enumerate(map.rows()[:-1], 1):
+        empty_rows_count[i] = empty_rows_count[i - 1] + is_empty(row)
 
-    empty_cols_count = [0] * len(map[0])
-    for j in range(1, len(map[0])):
-        empty_cols_count[j] = empty_cols_count[j - 1] + (1 if all(map[i][j - 1] == '.' for i in range(len(map))) else 0)
+    empty_cols_count = [0] * map.width
+    for j, col in enumerate(map.columns()[:-1], 1):
+        empty_cols_count[j] = empty_cols_count[j - 1] + is_empty(col)
 
     # Scale the coordinates of each galaxy
     for galaxy, (x, y) in galaxies.items():
@@ -69,29 +75,35 @@ def get_scaled_coordinates(galaxies, map, scaling_factor):
 
     return scaled_galaxies
 
+def parse(source):
+    """ Parse the image into a map """
+    return parse_map(read_bytes(source))
 
-
-with open("input.txt") as file:
-    # Parse the map
-    galaxy_map = parse_map(file.read())
+def part1(puzzle):
+    """ Sum of the distances between all pairs of galaxies in the expanded universe """
+    galaxy_map = ensure_parsed(puzzle, parse)
 
     # Expand the universe
     expanded_map = expand_universe(galaxy_map)
     # Identify galaxies and store their coordinates
     galaxies = identify_galaxies(expanded_map)
     # Calculate the sum of distances between all pairs of galaxies
-    sum_of_distances = calculate_distances(galaxies)
+    return calculate_distances(galaxies)
 
+def part2(puzzle, scaling_factor=1000000):
+    """ Sum of the distances between all pairs of galaxies when every empty row and column is scaled """
+    galaxy_map = ensure_parsed(puzzle, parse)
 
     # Identify galaxies and store their coordinates in the original map
     galaxies_original = identify_galaxies(galaxy_map)
-    # Scaling factor is 1 million
-    scaling_factor = 1000000
     # Scale the coordinates of each galaxy
     scaled_galaxies = get_scaled_coordinates(galaxies_original, galaxy_map, scaling_factor)
     # Calculate the sum of distances between all pairs of galaxies using scaled coordinates
-    scaled_sum_of_distances = calculate_distances(scaled_galaxies)
+    return calculate_distances(scaled_galaxies)
+
 
+if __name__ == "__main__":
+    galaxy_map = parse(default_input(__file__))
 
-    print("First puzzle solution:", sum_of_distances)
-    print("Second puzzle solution:", scaled_sum_of_distances)
\ No newline at end of file
+    print("First puzzle solution:", part1(galaxy_map))
+    print("Second puzzle solution:", part2(galaxy_map))
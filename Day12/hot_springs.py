@@ -83,6 +83,14 @@ Unfold your condition records; what is the new sum of possible arrangement count
 
 Your puzzle answer was 17485169859432.
 """
+from functools import partial
+
+from aoc.inputs import Records, default_input, ensure_parsed
+from aoc.parallel import parallel_map
+
+# Memoization table of recursive_count, aoc.metrics swaps it for a dict that counts hits and misses
+Memo = dict
+
 # Define constants for the different spring conditions
 EMPTY = '.'
 SPRING = '#'
@@ -92,6 +100,8 @@ def parse_input(line, unfold=False):
     """
     Parse a single line of the input file and optionally unfold it.
     """
+    if isinstance(line, bytes):
+        line = line.decode()
     parts = line.strip().split(' ')
     springs = parts[0]
     groups = parts[1]
@@ -119,7 +129,7 @@ def count_arrangements(springs, groups):
       2. Skipping the current position (considering it empty) and trying the next one.
       """
     # Cache for memoization to optimize recursive calls
-    cache = {}
+    cache = Memo()
 
     # Calculate the required space for each group
     required_space = [0] * len(groups)
@@ -163,14 +173,36 @@ def count_arrangements(springs, groups):
     # Start the recursive process from the beginning
     return recursive_count(0, 0)
 
+def count_line_arrangements(line, unfold=False):
+    """
+    Count the arrangements of a single line of the condition records, optionally unfolded.
+    """
+    return count_arrangements(*parse_input(line, unfold))
+
+def parse(source):
+    """
+    The lines of the condition records, read one at a time. Each line is parsed (and optionally
+    unfolded) by parse_input when it is counted.
+    """
+    return Records(source)
+
+def part1(puzzle):
+    """
+    Part One: Count arrangements without unfolding
+    """
+    lines = ensure_parsed(puzzle, parse)
+    return sum(parallel_map(count_line_arrangements, lines))
+
+def part2(puzzle):
+    """
+    Part Two: Count arrangements with unfolding
+    """
+    lines = ensure_parsed(puzzle, parse)
+    return sum(parallel_map(partial(count_line_arrangements, unfold=True), lines))
 
-with open('input.txt') as file:
-    lines = file.readlines()
 
-    # Part One: Count arrangements without unfolding
-    arrangement_counts_part_one = sum([count_arrangements(*parse_input(line)) for line in lines])
-    print("Part One solution:", arrangement_counts_part_one)
+if __name__ == '__main__':
+    lines = parse(default_input(__file__))
 
-    # Part Two: Count arrangements with unfolding
-    arrangement_counts_part_two = sum([count_arrangements(*parse_input(line, unfold=True)) for line in lines])
-    print("Part Two solution:", arrangement_counts_part_two)
\ No newline at end of file
+    print("Part One solution:", part1(lines))
+    print("Part Two solution:", part2(lines))
@@ -101,60 +101,53 @@ In each pattern, fix the smudge and find the different line of reflection. What
 
 Your puzzle answer was 34224.
 """
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+from aoc.parallel import parallel_map
 
-def is_vertical_reflection(pattern, col):
+def is_mirrored(lines, index):
     """
-    Check if there is a vertical reflection at the given column.
+    Check if a sequence of rows or columns reads the same in both directions from between
+    index and index + 1.
     """
-    num_rows = len(pattern)
-    num_cols = len(pattern[0])
-
-    for row in range(num_rows):
-        left = col
-        right = col + 1
-        while left >= 0 and right < num_cols:
-            if pattern[row][left] != pattern[row][right]:
-                return False
-            left -= 1
-            right += 1
+    if lines[index] != lines[index + 1]:
+        return False  # most candidates already differ right at the line
+    size = min(index + 1, len(lines) - index - 1)
+    return lines[index - size + 1:index + 1] == lines[index + size:index:-1]
 
-    return True
+def is_vertical_reflection(columns, col):
+    """
+    Check if there is a vertical reflection at the given column.
+    """
+    return is_mirrored(columns, col)
 
-def is_horizontal_reflection(pattern, row):
+def is_horizontal_reflection(rows, row):
     """
     Check if there is a horizontal reflection at the given row.
     """
-    num_rows = len(pattern)
-    num_cols = len(pattern[0])
-
-    for col in range(num_cols):
-        top = row
-        bottom = row + 1
-        while top >= 0 and bottom < num_rows:
-            if pattern[top][col] != pattern[bottom][col]:
-                return False
-            top -= 1
-            bottom += 1
-
-    return True
+    return is_mirrored(rows, row)
 
 def find_reflection_line(pattern, original_reflection_line=None):
     """
     Find the reflection line in the pattern.
     """
-    num_rows = len(pattern)
-    num_cols = len(pattern[0])
+    return find_reflection_in_lines(pattern.rows(), pattern.columns(), original_reflection_line)
+
 
-    for col in range(num_cols - 1):
-        if is_vertical_reflection(pattern, col):
+def find_reflection_in_lines(rows, columns, original_reflection_line=None):
+    """
+    Find the reflection line of a pattern given as its rows and its columns.
+    """
+    for col in range(len(columns) - 1):
+        if is_vertical_reflection(columns, col):
             if original_reflection_line is not None and original_reflection_line[0] == 'vertical' and original_reflection_line[1] == col:
                 continue
             return ('vertical', col)
 
 
     # Check for horizontal reflection
-    for row in range(num_rows - 1):
-        if is_horizontal_reflection(pattern, row):
+    for row in range(len(rows) - 1):
+        if is_horizontal_reflection(rows, row):
             if original_reflection_line is not None and original_reflection_line[0] == 'horizontal' and original_reflection_line[1] == row:
                 continue
             return ('horizontal', row)
@@ -188,38 +181,36 @@ def get_patterns(input_lines):
             current_pattern.append(line)
         else:
             if current_pattern:
-                patterns.append(current_pattern)
+                patterns.append(Grid.from_lines(current_pattern))
                 current_pattern = []
 
     # Add the last pattern if not empty
     if current_pattern:
-        patterns.append(current_pattern)
+        patterns.append(Grid.from_lines(current_pattern))
 
     return patterns
 
-def flip_character(char):
+def flip_character(line, index):
     """
-    Flips the character from '.' to '#' or vice versa.
+    Flips the character at index of a row or column from '.' to '#' or vice versa.
     """
-    return '#' if char == '.' else '.'
+    return line[:index] + (b'#' if line[index:index + 1] == b'.' else b'.') + line[index + 1:]
 
 def find_smudge_and_fix(pattern):
     """
     Locate the smudge in the pattern and determine the new, different reflection line.
     This involves iterating over rows and columns to find a flip that results in a different reflection.
     """
-    num_rows = len(pattern)
-    num_cols = len(pattern[0])
+    rows, columns = pattern.rows(), pattern.columns()
+    original_reflection_line = find_reflection_in_lines(rows, columns)
 
-    original_reflection_line = find_reflection_line(pattern)
-
-    for row in range(num_rows):
-        for col in range(num_cols):
-            # Flip one character at a time
-            modified_pattern = [list(r) for r in pattern]
-            modified_pattern[row][col] = flip_character(modified_pattern[row][col])
-
-            new_reflection_line = find_reflection_line([''.join(r) for r in modified_pattern], original_reflection_line)
+    for row in range(pattern.height):
+        for col in range(pattern.width):
+            # Flip one character at a time, only its row and its column change
+            original_row, original_column = rows[row], columns[col]
+            rows[row], columns[col] = flip_character(original_row, col), flip_character(original_column, row)
+            new_reflection_line = find_reflection_in_lines(rows, columns, original_reflection_line)
+            rows[row], columns[col] = original_row, original_column
 
             # Check if the new reflection line is different from the original and valid
             if new_reflection_line[0] is not None and new_reflection_line != original_reflection_line:
@@ -227,21 +218,31 @@ def find_smudge_and_fix(pattern):
 
     return original_reflection_line  # Return the original if no new line is found
 
+def parse(source):
+    """
+    Extract the patterns from the input.
+    """
+    return get_patterns(read_bytes(source).splitlines())
 
-with open('input.txt', 'r') as file:
-    input_data = file.readlines()
-    patterns = get_patterns(input_data)
-
-    # Finding the reflection lines for each pattern
+def part1(puzzle):
+    """
+    Summary number of the reflection lines of every pattern.
+    """
+    patterns = ensure_parsed(puzzle, parse)
     reflection_lines = [find_reflection_line(pattern) for pattern in patterns]
-    # Calculating the summary number for each pattern
-    summary_number = calculate_summary_number(reflection_lines)
+    return calculate_summary_number(reflection_lines)
+
+def part2(puzzle):
+    """
+    Summary number of the new reflection lines once the smudge of every pattern is fixed.
+    """
+    patterns = ensure_parsed(puzzle, parse)
+    new_reflection_lines_with_smudge = parallel_map(find_smudge_and_fix, patterns)
+    return calculate_summary_number(new_reflection_lines_with_smudge)
 
-    # Finding the new reflection lines with the smudge fixed for each pattern
-    new_reflection_lines_with_smudge = [find_smudge_and_fix(pattern) for pattern in patterns]
-    # Calculating the summary number for the modified patterns
-    summary_number_with_new_reflection = calculate_summary_number(new_reflection_lines_with_smudge)
 
-    print("First puzzle solution: ", summary_number)
-    print("Second puzzle solution: ", summary_number_with_new_reflection)
+if __name__ == '__main__':
+    patterns = parse(default_input(__file__))
 
+    print("First puzzle solution: ", part1(patterns))
+    print("Second puzzle solution: ", part2(patterns))
@@ -95,101 +95,67 @@ Run the spin cycle for 1000000000 cycles. Afterward, what is the total load on t
 
 Your puzzle answer was 99641.
 """
-def calculate_total_load(grid):
-    # Replacing the newline characters and converting the grid into a list of lists for easier manipulation
-    grid = [list(row.strip()) for row in grid]
-    num_rows = len(grid)
-    num_cols = len(grid[0])
-
-    # Function to move all rounded rocks north as far as they will go
-    def move_rocks_north(grid):
-        num_rows = len(grid)
-        num_cols = len(grid[0])
-
-        for col in range(num_cols):
-            for row in range(1, num_rows):
-                if grid[row][col] == 'O' and grid[row - 1][col] == '.':
-                    # Find the furthest empty space above this rock
-                    empty_space = row - 1
-                    while empty_space > 0 and grid[empty_space - 1][col] == '.':
-                        empty_space -= 1
-                    # Move the rock to the empty space
-                    grid[empty_space][col] = 'O'
-                    grid[row][col] = '.'
-
-    move_rocks_north(grid)
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+
+# Container of the grid states seen so far, aoc.metrics swaps it for a counting list
+States = list
+
+ROUNDED, EMPTY, CUBE = b'O', b'.', b'#'
+
+def roll(line, towards_start):
+    """
+    Roll the rounded rocks of a row to its start or its end. Between two cube-shaped rocks,
+    only the number of rounded rocks matters.
+    """
+    segments = []
+    for segment in line.split(CUBE):
+        rocks = segment.count(ROUNDED)
+        space = len(segment) - rocks
+        segments.append(ROUNDED * rocks + EMPTY * space if towards_start else EMPTY * space + ROUNDED * rocks)
+    return CUBE.join(segments)
+
+def move_rocks_west(grid, towards_start=True, rolled=None):
+    """
+    Roll the rocks of every row west, or east, in place. The same rows come back cycle after
+    cycle, so ``rolled`` can keep the rolled rows by (row, direction).
+    """
+    rolled = {} if rolled is None else rolled
+    for row, line in enumerate(grid.rows()):
+        key = (line, towards_start)
+        if key not in rolled:
+            rolled[key] = roll(line, towards_start)
+        grid.set_row(row, rolled[key])
+
+def move_rocks_north(grid, towards_start=True, rolled=None):
+    """ Roll the rocks north, or south, as rows of the transposed grid. Returns a new grid. """
+    transposed = grid.transposed()
+    move_rocks_west(transposed, towards_start, rolled)
+    return transposed.transposed()
+
+def north_load(grid):
+    """ The load is equal to the number of rows from the rock to the south edge, including the rock's row """
+    return sum(row.count(ROUNDED) * (grid.height - idx) for idx, row in enumerate(grid.rows()))
 
+def calculate_total_load(grid):
     # Calculate the total load on the north support beams
-    total_load = 0
-    for row in range(num_rows):
-        for col in range(num_cols):
-            if grid[row][col] == 'O':
-                # The load is equal to the number of rows from the rock to the south edge, including the rock's row
-                total_load += (num_rows - row)
-
-    return total_load
+    return north_load(move_rocks_north(grid))
 
 
 def spin_cycle(grid, cycles):
-    def move_rocks_north():
-        for col in range(num_cols):
-            for row in range(1, num_rows):
-                if grid[row][col] == 'O' and grid[row - 1][col] == '.':
-                    empty_space = row - 1
-                    while empty_space > 0 and grid[empty_space - 1][col] == '.':
-                        empty_space -= 1
-                    grid[empty_space][col] = 'O'
-                    grid[row][col] = '.'
-
-    def move_rocks_west():
-        for row in range(num_rows):
-            for col in range(1, num_cols):
-                if grid[row][col] == 'O' and grid[row][col - 1] == '.':
-                    empty_space = col - 1
-                    while empty_space > 0 and grid[row][empty_space - 1] == '.':
-                        empty_space -= 1
-                    grid[row][empty_space] = 'O'
-                    grid[row][col] = '.'
-
-    def move_rocks_south():
-        for col in range(num_cols):
-            for row in range(num_rows - 2, -1, -1):
-                if grid[row][col] == 'O' and grid[row + 1][col] == '.':
-                    empty_space = row + 1
-                    while empty_space < num_rows - 1 and grid[empty_space + 1][col] == '.':
-                        empty_space += 1
-                    grid[empty_space][col] = 'O'
-                    grid[row][col] = '.'
-
-    def move_rocks_east():
-        for row in range(num_rows):
-            for col in range(num_cols - 2, -1, -1):
-                if grid[row][col] == 'O' and grid[row][col + 1] == '.':
-                    empty_space = col + 1
-                    while empty_space < num_cols - 1 and grid[row][empty_space + 1] == '.':
-                        empty_space += 1
-                    grid[row][empty_space] = 'O'
-                    grid[row][col] = '.'
-
-    # If the grid is already converted to a list of lists, this is unnecessary
-    num_rows = len(grid)
-    num_cols = len(grid[0])
-    previous_states = []
+    previous_states = States()
     cycle_count = 0
+    rolled = {}
 
     while cycle_count < cycles:
-        # Perform a cycle
-        move_rocks_north()
-        move_rocks_west()
-        move_rocks_south()
-        move_rocks_east()
-
-
-        # Calculate the total load on the north support beams
-        total_load = sum(row.count('O') * (num_rows - idx) for idx, row in enumerate(grid))
-
-        # Create a string representation of the grid to check for repeats
-        grid_str = ''.join(''.join(row) for row in grid)
+        # Perform a cycle: north, west, south and east
+        grid = move_rocks_north(grid, True, rolled)
+        move_rocks_west(grid, True, rolled)
+        grid = move_rocks_north(grid, False, rolled)
+        move_rocks_west(grid, False, rolled)
+
+        # Use the bytes of the grid to check for repeats
+        grid_str = bytes(grid.cells)
         if grid_str in previous_states:
             # A repeat has been found, break out and calculate based on periodicity
             cycle_length = cycle_count - list(previous_states).index(grid_str)
@@ -197,26 +163,29 @@ def spin_cycle(grid, cycles):
             return spin_cycle(grid, remaining_cycles)
         else:
             previous_states.append(grid_str)
-            previous_states = list(dict.fromkeys(previous_states))
+            previous_states = States(dict.fromkeys(previous_states))
 
         cycle_count += 1
 
     # Calculate the total load on the north support beams
-    total_load = sum(row.count('O') * (num_rows - idx) for idx, row in enumerate(grid))
-
-    return total_load
+    return north_load(grid)
 
+def parse(source):
+    """ Read the platform into a grid. """
+    return Grid.from_text(read_bytes(source))
 
-with open('input.txt', 'r') as file:
-    puzzle_input = file.readlines()
-    grid = [list(row.strip()) for row in puzzle_input]
+def part1(puzzle):
+    """ Total load on the north support beams after tilting the platform north. """
+    return calculate_total_load(ensure_parsed(puzzle, parse))
 
-    # Calculating the total load for the given puzzle input
-    total_load = calculate_total_load(puzzle_input)
+def part2(puzzle, cycles=1000000000):
+    """ Total load on the north support beams after running the spin cycles. """
+    # spin_cycle moves the rocks in place, so it gets its own copy of the grid
+    return spin_cycle(ensure_parsed(puzzle, parse).copy(), cycles)
 
-    # Calculating the total load after 1000000000 cycles
-    total_load_cycles = spin_cycle(grid, 1000000000)
 
-    print("First puzzle solution:", total_load)
-    print("Second puzzle solution:", total_load_cycles)
+if __name__ == '__main__':
+    rows = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(rows))
+    print("Second puzzle solution:", part2(rows))
@@ -137,11 +137,13 @@ With the help of an over-enthusiastic reindeer in a hard hat, follow the initial
 
 Your puzzle answer was 244461.
 """
+from aoc.inputs import Records, default_input, ensure_parsed
+
 def hash_algorithm(step):
-    """ Apply the HASH algorithm to a given string step. """
+    """ Apply the HASH algorithm to a given step, as bytes or as a string. """
     current_value = 0
-    for char in step:
-        ascii_code = ord(char)  # ASCII code of the character
+    # Iterating over bytes gives the ASCII code of each character
+    for ascii_code in step.encode() if isinstance(step, str) else step:
         current_value = (current_value + ascii_code) * 17 % 256
     return current_value
 
@@ -169,28 +171,37 @@ def process_step(boxes, step):
 
     return boxes
 
-
-with open('input.txt') as f:
-    initialization_sequence = f.read()
-    # Splitting the initialization sequence into individual steps
-    steps = initialization_sequence.split(',')
-    # Applying the HASH algorithm on each step and summing the results
-    sum_of_hashes = sum(hash_algorithm(step) for step in steps)
-
-
-    # Re-initialize 256 empty boxes
-    boxes = [[] for _ in range(256)]
-    # Re-process each step in the initialization sequence
-    for step in steps:
-        boxes = process_step(boxes, step)
-    # Recalculate the focusing power of the resulting lens configuration
+def calculate_focusing_power(boxes):
+    """ Calculate the focusing power of the resulting lens configuration. """
     focusing_power = 0
     for box_index, lenses in enumerate(boxes):
         for slot_index, lens in enumerate(lenses, start=1):
             label, focal_length = lens.split()
             focal_length = int(focal_length)
             focusing_power += (box_index + 1) * slot_index * focal_length
+    return focusing_power
+
+def parse(source):
+    """ The steps of the initialization sequence, read one at a time. """
+    return Records(source, b',')
+
+def part1(puzzle):
+    """ Sum of the HASH algorithm results of every step. """
+    steps = ensure_parsed(puzzle, parse)
+    return sum(hash_algorithm(step) for step in steps)
+
+def part2(puzzle):
+    """ Focusing power of the lens configuration after running every step. """
+    steps = ensure_parsed(puzzle, parse)
+    # Initialize 256 empty boxes
+    boxes = [[] for _ in range(256)]
+    for step in steps:
+        boxes = process_step(boxes, step.decode())
+    return calculate_focusing_power(boxes)
+
 
+if __name__ == '__main__':
+    steps = parse(default_input(__file__))
 
-    print("First puzzle solution: ", sum_of_hashes)
-    print("Second puzzle solution: ", focusing_power)
\ No newline at end of file
+    print("First puzzle solution: ", part1(steps))
+    print("Second puzzle solution: ", part2(steps))
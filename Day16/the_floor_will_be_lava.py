@@ -1,111 +1,90 @@
-def simulate_beam(grid):
-    rows = len(grid)
-    cols = len(grid[0].strip())  # Removing potential newline characters
-    energized_tiles = set()  # Using a set to avoid duplicates
-
-    def traverse(x, y, dx, dy):
-        while 0 <= x < cols and 0 <= y < rows:
-            if (x, y, dx, dy) in energized_tiles:
+from functools import partial
+
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+from aoc.parallel import parallel_map
+
+
+def beam_turns(grid):
+    """
+    For every tile and direction of an incoming beam (a flat index offset), the directions of the
+    beams that leave the tile.
+    """
+    up, right, down, left = grid.directions
+    turns = {
+        # Continue in the same direction
+        ord('.'): {direction: (direction,) for direction in grid.directions},
+        # Reflect the beam
+        ord('/'): {right: (up,), up: (right,), left: (down,), down: (left,)},
+        ord('\\'): {right: (down,), down: (right,), left: (up,), up: (left,)},
+        # Pass through the pointy end of a splitter, or split the beam
+        ord('|'): {up: (up,), down: (down,), right: (down, up), left: (up, down)},
+        ord('-'): {right: (right,), left: (left,), up: (left, right), down: (right, left)},
+    }
+    return turns
+
+
+def energize(grid, turns, start, direction):
+    """
+    Follow a beam entering the grid at a flat index and count the tiles it energizes. Split beams
+    wait on a stack instead of recursing, and the beam stops at the border.
+    """
+    cells = grid.cells
+    bits = {direction: 1 << bit for bit, direction in enumerate(grid.directions)}
+    # Directions of the beams seen on each cell so far, as bits
+    energized = bytearray(len(cells))
+    beams = [(start, direction)]
+
+    while beams:
+        index, direction = beams.pop()
+        while cells[index] != grid.border:
+            bit = bits[direction]
+            if energized[index] & bit:
                 # If the beam returns to a previously energized tile with the same direction, stop to avoid infinite loops
                 break
+            energized[index] |= bit
 
-            energized_tiles.add((x, y, dx, dy))
-
-            current_tile = grid[y][x]
-
-            if current_tile == '.':
-                # Continue in the same direction
-                x += dx
-                y += dy
-            elif current_tile == '/':
-                # Reflect the beam
-                dx, dy = -dy, -dx
-                x += dx
-                y += dy
-            elif current_tile == '\\':
-                # Reflect the beam
-                dx, dy = dy, dx
-                x += dx
-                y += dy
-            elif current_tile in '|-':
-                if (dx == 0 and current_tile == '|') or (dy == 0 and current_tile == '-'):
-                    # Beam passes through the pointy end of a splitter
-                    x += dx
-                    y += dy
-                else:
-                    # Split the beam
-                    traverse(x, y, -dy, dx)  # Reflect horizontally
-                    traverse(x, y, dy, -dx)  # Reflect vertically
-                    break
-
-    # Start the simulation from top-left corner, heading right
-    traverse(0, 0, 1, 0)
+            directions = turns[cells[index]][direction]
+            for split in directions[1:]:
+                beams.append((index + split, split))
+            direction = directions[0]
+            index += direction
 
     # Count unique tiles that were energized, regardless of the direction of the beam
-    unique_tiles_energized = {tile[:2] for tile in energized_tiles}
-    return len(unique_tiles_energized)
+    return len(energized) - energized.count(0)
+
+
+def simulate_beam(grid):
+    # Start the simulation from top-left corner, heading right
+    return energize(grid, beam_turns(grid), grid.index(0, 0), grid.right)
 
 def find_specific_max_energized_tiles(grid):
-    rows = len(grid)
-    cols = len(grid[0].strip())
-    max_energized = 0
-    best_start = None
+    turns = beam_turns(grid)
+    rows, cols = grid.height, grid.width
 
     # Define the starting points and directions for the beam on all edges
-    starting_points = [(0, i, 0, 1) for i in range(cols)] + \
-                      [(rows - 1, i, 0, -1) for i in range(cols)] + \
-                      [(i, 0, 1, 0) for i in range(rows)] + \
-                      [(i, cols - 1, -1, 0) for i in range(rows)]
-
-    for y, x, dx, dy in starting_points:
-        energized_tiles = set()
-
-        def traverse(x, y, dx, dy):
-            while 0 <= x < cols and 0 <= y < rows:
-                if (x, y, dx, dy) in energized_tiles:
-                    break
-
-                energized_tiles.add((x, y, dx, dy))
-
-                current_tile = grid[y][x]
-
-                if current_tile == '.':
-                    x += dx
-                    y += dy
-                elif current_tile == '/':
-                    dx, dy = -dy, -dx
-                    x += dx
-                    y += dy
-                elif current_tile == '\\':
-                    dx, dy = dy, dx
-                    x += dx
-                    y += dy
-                elif current_tile in '|-':
-                    if (dx == 0 and current_tile == '|') or (dy == 0 and current_tile == '-'):
-                        x += dx
-                        y += dy
-                    else:
-                        traverse(x, y, -dy, dx)
-                        traverse(x, y, dy, -dx)
-                        break
-
-        traverse(x, y, dx, dy)
-
-        unique_tiles_energized = {tile[:2] for tile in energized_tiles}
-        energized_count = len(unique_tiles_energized)
-        if energized_count > max_energized:
-            max_energized = energized_count
-
-    return max_energized
-
-with open('input.txt') as f:
-    grid_input = f.readlines()
+    starting_points = [(grid.index(0, i), grid.down) for i in range(cols)] + \
+                      [(grid.index(rows - 1, i), grid.up) for i in range(cols)] + \
+                      [(grid.index(i, 0), grid.right) for i in range(rows)] + \
+                      [(grid.index(i, cols - 1), grid.left) for i in range(rows)]
+
+    starts, directions = zip(*starting_points)
+    return max(parallel_map(partial(energize, grid, turns), starts, directions))
 
+def parse(source):
+    return Grid.from_text(read_bytes(source))
+
+def part1(puzzle):
     # Applying the simulation on the input grid
-    energized_tiles_count = simulate_beam(grid_input)
+    return simulate_beam(ensure_parsed(puzzle, parse))
+
+def part2(puzzle):
     # Applying the simulation on the input grid, but starting from all edges
-    max_energized_tiles = find_specific_max_energized_tiles(grid_input)
+    return find_specific_max_energized_tiles(ensure_parsed(puzzle, parse))
+
 
+if __name__ == '__main__':
+    grid_input = parse(default_input(__file__))
 
-    print("First puzzle solution:", energized_tiles_count)
-    print("Second puzzle solution:", max_energized_tiles)
\ No newline at end of file
+    print("First puzzle solution:", part1(grid_input))
+    print("Second puzzle solution:", part2(grid_input))
@@ -95,74 +95,86 @@ Directing the ultra crucible from the lava pool to the machine parts factory, wh
 
 Your puzzle answer was 1215.
 """
-from collections import defaultdict
-import heapq
+from aoc.graph import Graph, shortest_distance
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
 
-def is_valid_position(y, x, grid):
-    """ Check if the position is within the grid boundaries. """
-    return 0 <= y < len(grid) and 0 <= x < len(grid[0])
+# Buckets of the distance queue, aoc.metrics swaps it for a list that counts the pushes
+Bucket = list
 
-def get_neighbors(y, x, grid):
-    """ Get neighboring positions of a cell in the grid. """
-    for dy, dx in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
-        ny, nx = y + dy, x + dx
-        if is_valid_position(ny, nx, grid):
-            yield ny, nx
+# Turns the digits of the map into heat loss values
+HEAT_LOSS = bytes.maketrans(b'0123456789', bytes(range(10)))
 
-def calculate_heuristic(y, x, score, grid):
-    """ Calculate the heuristic value for A* search. """
-    return (len(grid) - y) + (len(grid[0]) - x) + score
+# Border of the map, a byte that no heat loss value takes since a cell can cost 0
+WALL = 0xFF
+
+def is_valid_position(index, grid):
+    """ Check if the position is within the grid boundaries rather than on the border. """
+    return grid.cells[index] != grid.border
+
+def build_moves_graph(grid, min_step_number, max_step_number):
+    """
+    Build the graph of the moves of the crucible. A node is a cell and the orientation of the
+    move that reached it, 2 * index for a horizontal move and 2 * index + 1 for a vertical one.
+    Every move goes between 'min_step_number' and 'max_step_number' cells straight ahead and must
+    turn, so its edges go to the cells in the other orientation, weighted by the heat loss of the
+    cells on the way.
+    """
+    cells = grid.cells
+    turns = ((grid.left, grid.right), (grid.up, grid.down))
+    neighbours = [[] for _ in range(2 * len(cells))]
+    weights = [[] for _ in range(2 * len(cells))]
+
+    for index in grid.indices():
+        for turn, offsets in enumerate(turns):
+            # Moves in this orientation leave from cells reached in the other one
+            node = 2 * index + 1 - turn
+            for offset in offsets:
+                heat_loss = 0
+                for size in range(1, max_step_number + 1):
+                    position = index + size * offset
+                    if not is_valid_position(position, grid):
+                        break
+                    heat_loss += cells[position]
+                    if size >= min_step_number:
+                        neighbours[node].append(2 * position + turn)
+                        weights[node].append(heat_loss)
+
+    return Graph(neighbours, weights)
 
 def find_path(grid, min_step_number, max_step_number):
     """
-    Find the minimum heat loss path in a grid using the A* search algorithm.
-
-    This function implements the A* search algorithm to find a path from the
-    top-left corner to the bottom-right corner of a grid. The path is chosen
-    such that it minimizes the sum of the values (representing heat loss) of
-    the cells it passes through. The path can only move horizontally or vertically.
-    The path must be between 'min_step_number' and 'max_step_number' cells in length in each direction
-    before it can change direction.
+    Find the minimum heat loss path in a grid from the top-left corner to the bottom-right corner.
+
+    The path is chosen such that it minimizes the sum of the values (representing heat loss) of
+    the cells it passes through. The path can only move horizontally or vertically. The path must be
+    between 'min_step_number' and 'max_step_number' cells in length in each direction before it
+    can change direction. The heat losses are small integers, so the shortest distance is found
+    with a bucket queue instead of a heap.
     """
-    visited = defaultdict(lambda: float('inf'))
-    queue = [(calculate_heuristic(0, 0, 0, grid), 0, (0, 0), 2)]
-    target = (len(grid) - 1, len(grid[0]) - 1)
-
-    while queue:
-        _, score, (y, x), direction = heapq.heappop(queue)
-        if (y, x) == target:
-            return score
-
-        for j, i in get_neighbors(y, x, grid):
-            dy, dx = j - y, i - x
-            if (dy == 0 and direction == 0) or (dx == 0 and direction == 1):
-                continue
-
-            new_score = 0
-            for size in range(1, max_step_number + 1):
-                ny, nx = y + size * dy, x + size * dx
-                if not is_valid_position(ny, nx, grid):
-                    break
-                new_score += grid[ny][nx]
-                total_score = score + new_score
-                heuristic_value = calculate_heuristic(ny, nx, total_score, grid) + total_score
-                position = ((ny, nx), 0 if dy == 0 else 1)
-
-                if size >= min_step_number and heuristic_value < visited[position]:
-                    heapq.heappush(queue, (heuristic_value, total_score, (ny, nx), 0 if dy == 0 else 1))
-                    visited[position] = heuristic_value
-
-with open('input.txt', 'r') as file:
-    input_data = file.read()
-    # Parsing the input data into a list of strings
-    grid_lines = input_data.strip().split('\n')
-    # Parsing the input data into a list of lists
-    grid_list = [list(map(int, line)) for line in grid_lines]
-
-    # Finding the minimum heat loss paths
-    min_heat_los_no_numpy = find_path(grid_list, 1, 3)
-    min_heat_loss_ultra_crucible = find_path(grid_list, 4, 10)
-
-    print("First puzzle solution is: {0}".format(min_heat_los_no_numpy))
-    print("Second puzzle solution is: {0}".format(min_heat_loss_ultra_crucible))
+    graph = build_moves_graph(grid, min_step_number, max_step_number)
+    start = grid.index(0, 0)
+    target = grid.index(grid.height - 1, grid.width - 1)
+    # The crucible can start in either orientation and arrive in either one
+    return shortest_distance(graph, (2 * start, 2 * start + 1), (2 * target, 2 * target + 1), Bucket)
+
+def parse(source):
+    """ Parse the map into a grid of heat loss values. """
+    grid = Grid.from_text(read_bytes(source), border=WALL)
+    grid.cells = grid.cells.translate(HEAT_LOSS)
+    return grid
+
+def part1(puzzle):
+    """ Minimum heat loss for the regular crucible. """
+    return find_path(ensure_parsed(puzzle, parse), 1, 3)
+
+def part2(puzzle):
+    """ Minimum heat loss for the ultra crucible. """
+    return find_path(ensure_parsed(puzzle, parse), 4, 10)
+
+
+if __name__ == '__main__':
+    grid_list = parse(default_input(__file__))
 
+    print("First puzzle solution is: {0}".format(part1(grid_list)))
+    print("Second puzzle solution is: {0}".format(part2(grid_list)))
@@ -80,6 +80,7 @@ Convert the hexadecimal color codes into the correct instructions; if the Elves
 Your puzzle answer was 68548301037382.
 """
 from collections import deque, OrderedDict
+from aoc.inputs import default_input, ensure_parsed, read_text
 
 def parse_instructions(input_data):
 
@@ -261,17 +262,23 @@ def calculate_lava_volume_hex(hex_instructions):
     # The total volume of lava the lagoon can hold
     return int(interior_points + border_points)
 
-with open('input.txt', 'r') as f:
-    input_data = f.read()
-    # Parse the input data into a list of instructions
-    instructions, hex_instructions = parse_instructions(input_data)
+def parse(source):
+    """ Parse the dig plan into the plain and the hex encoded instructions. """
+    return parse_instructions(read_text(source))
 
-    # # Calculate the volume of lava
-    lava_volume = calculate_lava_volume(instructions)
+def part1(puzzle):
+    """ Volume of lava the lagoon can hold, following the plain instructions. """
+    instructions, _ = ensure_parsed(puzzle, parse)
+    return calculate_lava_volume(instructions)
 
-    # Calculate the volume of lava using hex codes
-    lava_volume_hex = calculate_lava_volume_hex(hex_instructions)
+def part2(puzzle):
+    """ Volume of lava the lagoon can hold, following the hex encoded instructions. """
+    _, hex_instructions = ensure_parsed(puzzle, parse)
+    return calculate_lava_volume_hex(hex_instructions)
 
-    print("First puzzle solution:", lava_volume)
-    print("Second puzzle solution:", lava_volume_hex)
 
+if __name__ == '__main__':
+    dig_plan = parse(default_input(__file__))
+
+    print("First puzzle solution:", part1(dig_plan))
+    print("Second puzzle solution:", part2(dig_plan))
@@ -66,6 +66,12 @@ Your puzzle answer was 130090458884662.
 """
 
 import re
+from aoc.inputs import default_input, ensure_parsed, read_text
+from aoc.intervals import box_volume, split_box
+
+# Axes of the boxes of rating combinations, each rating goes from 1 to 4000
+RATINGS = 'xmas'
+ALL_RATINGS = tuple((1, 4001) for _ in RATINGS)
 
 def parse_workflows(content):
     """
@@ -200,25 +206,83 @@ def count_combinations_in_intervals(intervals):
 
     return total_combinations
 
+def compile_workflows(workflows):
+    """
+    Turns the conditions of the rules into (axis, threshold, below) tuples: the condition holds for
+    the ratings below the threshold on that axis if below is True, and at or above it otherwise.
+    """
+    compiled = {}
+    for workflow_name, rules in workflows.items():
+        compiled[workflow_name] = []
+        for condition, destination in rules:
+            if condition is not None:
+                attribute, operator, value = re.match(r'(\w)([<>])(\d+)', condition).groups()
+                if operator == '<':
+                    condition = (RATINGS.index(attribute), int(value), True)
+                else:
+                    condition = (RATINGS.index(attribute), int(value) + 1, False)
+            compiled[workflow_name].append((condition, destination))
+    return compiled
+
+def accepted_boxes(workflow_name, workflows, box=ALL_RATINGS):
+    """
+    Splits a box of rating combinations along the rules of a compiled workflow and returns the boxes
+    that end up accepted. Each rule splits off at most one box, and the rest of the box moves on
+    to the next rule, so the boxes are disjoint and the empty ones are dropped right away.
+    """
+    boxes = []
+    for condition, destination in workflows[workflow_name]:
+        if condition is None:
+            matched, box = box, None
+        else:
+            axis, threshold, below = condition
+            lower, upper = split_box(box, axis, threshold)
+            matched, box = (lower, upper) if below else (upper, lower)
+
+        if matched is not None:
+            if destination == 'A':
+                boxes.append(matched)
+            elif destination != 'R':
+                boxes.extend(accepted_boxes(destination, workflows, matched))
+        if box is None:
+            break
+    return boxes
+
+def count_accepted_combinations(workflows):
+    """
+    Counts the rating combinations accepted by the workflows. The accepted boxes are disjoint, so
+    their volumes add up.
+    """
+    return sum(map(box_volume, accepted_boxes('in', compile_workflows(workflows))))
 
-with open("input.txt") as f:
-    content = f.read()
-    # Parse the content of the file
-    workflows, parts = parse_workflows(content)
+def parse(source):
+    """
+    Parses the workflows and the part ratings.
+    """
+    return parse_workflows(read_text(source))
 
-    # Re-process each part through the workflows
+def part1(puzzle):
+    """
+    Sum of the ratings of every accepted part.
+    """
+    workflows, parts = ensure_parsed(puzzle, parse)
     total_ratings = 0
     for part in parts:
         accepted, ratings_sum = process_part_through_workflows(part, workflows)
         if accepted:
             total_ratings += ratings_sum
+    return total_ratings
 
+def part2(puzzle):
+    """
+    Number of distinct rating combinations accepted by the workflows.
+    """
+    workflows, _ = ensure_parsed(puzzle, parse)
+    return count_accepted_combinations(workflows)
 
-    # Generate intervals for the 'in' workflow which is the starting point
-    intervals = generate_intervals('in', workflows)
 
-    # Count the combinations in these intervals
-    total_combinations_intervals = count_combinations_in_intervals(intervals)
+if __name__ == "__main__":
+    system = parse(default_input(__file__))
 
-    print("First puzzle solution:", total_ratings)
-    print("Second puzzle solution:", total_combinations_intervals)
+    print("First puzzle solution:", part1(system))
+    print("Second puzzle solution:", part2(system))
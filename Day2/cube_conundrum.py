@@ -41,6 +41,16 @@ For each game, find the minimum set of cubes that must have been present. What i
 
 Your puzzle answer was 71535.
 """
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, repeat
+from operator import and_, le, mul
+from aoc.inputs import Records, default_input, ensure_parsed
+
+COLORS = ('red', 'green', 'blue')
+# The position in COLORS of every color token of a record, followed by its separator or not
+COLOR_TOKENS = {(color + separator).encode(): position
+                for position, color in enumerate(COLORS) for separator in ('', ',', ';')}
 
 def parse_game_data(line):
     """
@@ -83,22 +93,163 @@ red_limit = 12
 green_limit = 13
 blue_limit = 14
 
-possible_games_sum = 0
-total_power_sum = 0
+def game_maxima(record):
+    """
+    The ID and the most red, green and blue cubes of a record such as b"Game 7: 3 blue, 4 red; 1 red",
+    given as bytes or text. Raises ValueError for a color that is not one of COLORS.
+    """
+    tokens = (record.encode() if isinstance(record, str) else record).split()
+    most = [0, 0, 0]
+    # After "Game 7:" the tokens alternate between a count and a color with its separator
+    for count, color in zip(map(int, tokens[2::2]), tokens[3::2]):
+        position = COLOR_TOKENS.get(color)
+        if position is None:
+            raise ValueError(f"unknown color {color.rstrip(b',;').decode(errors='replace')!r} in the record {record!r}")
+        if count > most[position]:
+            most[position] = count
+    return (int(tokens[1][:-1]), *most)
+
+class FenwickTree2D:
+    """
+    A Fenwick tree over (row, column) points, rows indexed from 1, with point additions and sums
+    over the prefix rectangles [1, row] x [1, column], both in O(log rows * log points).
 
-with open("input.txt") as file:
-    lines = file.readlines()
+    The points are given up front and every node of a row only keeps the columns of the points
+    it covers, so the tree holds O(points * log rows) numbers. A dense tree would hold one per
+    (row, column) pair, which is millions of games squared when their maxima are all different.
+    Only the given points can be added to.
+    """
 
-    for line in lines:
-        game_id, cube_counts = parse_game_data(line)
+    def __init__(self, rows, points):
+        self.rows = rows
+        columns = [[] for _ in range(rows + 1)]
+        for row, column in points:
+            while row <= rows:
+                columns[row].append(column)
+                row += row & -row
+        self.columns = [sorted(set(row_columns)) for row_columns in columns]
+        self.sums = [[0] * (len(row_columns) + 1) for row_columns in self.columns]
+
+    def add(self, row, column, value):
+        while row <= self.rows:
+            sums = self.sums[row]
+            j = bisect_left(self.columns[row], column) + 1
+            while j < len(sums):
+                sums[j] += value
+                j += j & -j
+            row += row & -row
+
+    def prefix_sum(self, row, column):
+        total = 0
+        while row > 0:
+            sums = self.sums[row]
+            j = bisect_right(self.columns[row], column)
+            while j > 0:
+                total += sums[j]
+                j -= j & -j
+            row -= row & -row
+        return total
+
+class Games:
+    """
+    The games as columns: the ID of every game and the most cubes of each color revealed in it,
+    which is all both puzzles need. Each column is an array of machine integers.
+    """
 
-        # First puzzle
-        if first_puzzle_solution(cube_counts, red_limit, green_limit, blue_limit):
+    def __init__(self):
+        self.ids = array('q')
+        self.maxima = {color: array('q') for color in COLORS}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, record):
+        """ Adds the game of a record such as b"Game 7: 3 blue, 4 red; 1 red". """
+        game_id, *maxima = game_maxima(record)
+        self.ids.append(game_id)
+        for color, maximum in zip(COLORS, maxima):
+            self.maxima[color].append(maximum)
+
+    def possible(self, red, green, blue):
+        """ A flag per game, set if the game is possible with the limits. """
+        red_ok, green_ok, blue_ok = (map(le, self.maxima[color], repeat(limit))
+                                     for color, limit in zip(COLORS, (red, green, blue)))
+        return map(and_, map(and_, red_ok, green_ok), blue_ok)
+
+    def possible_ids_sum(self, red, green, blue):
+        return sum(compress(self.ids, self.possible(red, green, blue)))
+
+    def possible_ids_sums(self, limits):
+        """
+        The sums of the IDs of the possible games for a batch of (red, green, blue) limits, in
+        order, answered offline. The limits are taken by increasing red limit while the games are
+        added by increasing red maximum to a Fenwick tree over their green and blue maxima, so
+        every sum is a prefix sum of the tree over the green and blue limits.
+        """
+        limits = list(limits)
+        # The rows of the tree are the distinct green maxima, its columns the blue maxima
+        greens = sorted(set(self.maxima['green']))
+        rows = [bisect_left(greens, green) + 1 for green in self.maxima['green']]
+        tree = FenwickTree2D(len(greens), zip(rows, self.maxima['blue']))
+        games = sorted(zip(self.maxima['red'], rows, self.maxima['blue'], self.ids))
+        sums = [0] * len(limits)
+        added = 0
+        for index in sorted(range(len(limits)), key=lambda index: limits[index][0]):
+            red, green, blue = limits[index]
+            while added < len(games) and games[added][0] <= red:
+                _, row, game_blue, game_id = games[added]
+                tree.add(row, game_blue, game_id)
+                added += 1
+            sums[index] = tree.prefix_sum(bisect_right(greens, green), blue)
+        return sums
+
+    def powers(self):
+        """ The power of the minimum set of cubes of every game. """
+        return map(mul, map(mul, self.maxima['red'], self.maxima['green']), self.maxima['blue'])
+
+def parse(source):
+    """ Reads every game record into the columns of a Games in one pass. """
+    games = Games()
+    for record in Records(source):
+        if record.strip():
+            games.add(record)
+    return games
+
+def possible_ids_sums(puzzle, limits):
+    """ Sum of the IDs of the possible games for every (red, green, blue) limit triple of a batch. """
+    games = ensure_parsed(puzzle, parse)
+    return games.possible_ids_sums(limits)
+
+def running_totals(records, limits=None):
+    """
+    Yields the answers of both puzzles so far after every game record of an iterable of byte
+    lines, such as a file, standard input or a socket opened in binary mode. Only the two sums
+    are kept, so the records can be far more than the memory holds.
+    """
+    red, green, blue = limits or (red_limit, green_limit, blue_limit)
+    possible_games_sum = total_power_sum = 0
+    for record in records:
+        if not record.strip():
+            continue
+        game_id, most_red, most_green, most_blue = game_maxima(record)
+        if most_red <= red and most_green <= green and most_blue <= blue:
             possible_games_sum += game_id
+        total_power_sum += most_red * most_green * most_blue
+        yield possible_games_sum, total_power_sum
+
+def part1(puzzle):
+    """ Sum of the IDs of the games that are possible with the configured limits. """
+    games = ensure_parsed(puzzle, parse)
+    return games.possible_ids_sum(red_limit, green_limit, blue_limit)
+
+def part2(puzzle):
+    """ Sum of the power of the minimum set of cubes for every game. """
+    games = ensure_parsed(puzzle, parse)
+    return sum(games.powers())
+
 
-        # Second puzzle
-        min_red, min_green, min_blue = second_puzzle_solution(cube_counts)
-        total_power_sum += min_red * min_green * min_blue
+if __name__ == "__main__":
+    games = parse(default_input(__file__))
 
-    print("First puzzle solution:", possible_games_sum)
-    print("Second puzzle solution:", total_power_sum)
+    print("First puzzle solution:", part1(games))
+    print("Second puzzle solution:", part2(games))
@@ -116,6 +116,7 @@ Your puzzle answer was 247702167614647.
 from math import gcd
 from functools import reduce
 from collections import deque
+from aoc.inputs import default_input, ensure_parsed, read_text
 
 class Module:
     def __init__(self, name):
@@ -389,14 +390,27 @@ def simulate_until_high(modules, source_module_name, target_module_name):
 
     return  button_presses
 
-with open("input.txt") as f:
-    module_config = f.readlines()
-    # Parsing the module configuration
-    modules = create_module_network(module_config)
-    # # Simulating 1000 button pushes
+def parse(source):
+    """
+    Builds the module network from the module configuration.
+    """
+    return create_module_network(read_text(source).splitlines())
+
+def part1(puzzle):
+    """
+    Product of the low and high pulses sent after pushing the button 1000 times.
+    """
+    modules = ensure_parsed(puzzle, parse)
+    # The simulation changes the state of the modules, always start from the default state
+    reset_modules(modules)
     low_pulses, high_pulses = simulate_button_pushes(modules, 1000)
-    # Calculating the final result
-    final_result = low_pulses * high_pulses
+    return low_pulses * high_pulses
+
+def part2(puzzle):
+    """
+    Fewest number of button presses required to deliver a single low pulse to rx.
+    """
+    modules = ensure_parsed(puzzle, parse)
 
     # Find the module that is connected to rx
     rx_module = modules.get('rx')
@@ -413,7 +427,11 @@ with open("input.txt") as f:
         number_of_presses[source] = button_presses
 
     # Calcumate the LCM of the number of button presses
-    button_presses = reduce(lcm, number_of_presses.values())
+    return reduce(lcm, number_of_presses.values())
+
+
+if __name__ == "__main__":
+    modules = parse(default_input(__file__))
 
-    print("First puzzle solution:", final_result)
-    print("Second puzzle solution:", button_presses)
\ No newline at end of file
+    print("First puzzle solution:", part1(modules))
+    print("Second puzzle solution:", part2(modules))
@@ -137,55 +137,58 @@ However, the step count the Elf needs is much larger! Starting from the garden p
 
 Your puzzle answer was 605492675373144.
 """
-from collections import deque
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+
+START, ROCK = ord('S'), ord('#')
 
 def find_start_pos(grid):
     """
-    Iterates through the grid to locate the starting position marked by 'S'.
+    Locates the starting position marked by 'S'.
     """
-    for i, row in enumerate(grid):
-        for j, cell in enumerate(row):
-            if cell == 'S':
-                return (i, j)
-    return None
+    index = grid.find(START)
+    return grid.position(index) if index >= 0 else None
 
 def parse_input(map_data):
     """
-    Converts the input map data into a 2D grid and finds the starting position.
+    Converts the input map data into a grid and finds the starting position. The garden repeats
+    in every direction, so the grid has no border and positions are wrapped around instead.
     """
-    grid = [list(row.strip()) for row in map_data]
+    grid = Grid.from_lines([row.strip() for row in map_data], pad=0)
     start_pos = find_start_pos(grid)
     return grid, start_pos
 
 def count_reachable_plots(grid, start_pos, steps):
     """
-    Uses Breadth-First Search (BFS) to explore the garden grid. It counts the garden plots
-    that can be reached exactly in the given number of steps, accounting for the infinite
-    repeating nature of the grid. It tracks visited positions to avoid redundant calculations.
+    Uses Breadth-First Search (BFS) to explore the garden grid one step at a time. It counts the
+    garden plots that can be reached exactly in the given number of steps, accounting for the
+    infinite repeating nature of the grid. Positions are marked as visited when they are first
+    reached, so each one is expanded only once.
     """
-    grid_height = len(grid)
-    grid_width = len(grid[0])
+    cells, stride = grid.cells, grid.stride
+    grid_height, grid_width = grid.height, grid.width
 
     directions = [(-1, 0), (1, 0), (0, 1), (0, -1)]
 
-    visited = set()
-    queue = deque([(start_pos, 0)])
+    visited = {start_pos}
+    frontier = [start_pos]
     reachable_plots_count = 0
 
-    while queue:
-        pos, dist = queue.popleft()
-        if dist == (steps + 1) or pos in visited:
-            continue
-
-        visited.add(pos)
-
-        if (pos[0] + pos[1]) % 2 == steps % 2:
-            reachable_plots_count += 1
-
-        for d in directions:
-            new_pos = (pos[0] + d[0], pos[1] + d[1])
-            if grid[new_pos[1] % grid_height][new_pos[0] % grid_width] != '#':
-                queue.append((new_pos, dist + 1))
+    for dist in range(steps + 1):
+        next_frontier = []
+        for row, col in frontier:
+            if (row + col) % 2 == steps % 2:
+                reachable_plots_count += 1
+
+            if dist == steps:
+                continue
+            for d_row, d_col in directions:
+                new_pos = (row + d_row, col + d_col)
+                # Rows wrap around the height and columns around the width
+                if new_pos not in visited and cells[(new_pos[0] % grid_height) * stride + new_pos[1] % grid_width] != ROCK:
+                    visited.add(new_pos)
+                    next_frontier.append(new_pos)
+        frontier = next_frontier
 
     return reachable_plots_count
 
@@ -202,23 +205,37 @@ def lagrange(x0, y0, x1, y1, x2, y2):
         return t0 + t1 + t2
     return polynomial
 
+def parse(source):
+    """
+    Converts the input into the garden grid and finds the starting position.
+    """
+    return parse_input(read_bytes(source).splitlines())
 
-with open('input.txt', 'r') as f:
-    map_data = f.readlines()
-    grid, start_pos = parse_input(map_data)
+def part1(puzzle, steps=64):
+    """
+    Counts the garden plots reachable in exactly 64 steps.
+    """
+    grid, start_pos = ensure_parsed(puzzle, parse)
+    return count_reachable_plots(grid, start_pos, steps)
 
-    # Count the number of reachable plots for 64 steps.
-    number_of_plots = count_reachable_plots(map_data, start_pos, 64)
+def part2(puzzle, steps=26501365):
+    """
+    Extrapolates the number of garden plots reachable in 26501365 steps on the infinite grid.
+    """
+    grid, start_pos = ensure_parsed(puzzle, parse)
 
-    # Find the number of reachable plots for 26501365 steps for an infinite grid.
-    length_of_grid = len(grid[0])
+    length_of_grid = grid.width
     distance_to_edge = length_of_grid // 2
 
     x = [distance_to_edge + i * length_of_grid for i in range(3)]
     y = [count_reachable_plots(grid, start_pos, i) for i in x]
 
-
     polynomial = lagrange(x[0], y[0], x[1], y[1], x[2], y[2])
+    return polynomial(steps)
+
+
+if __name__ == '__main__':
+    garden = parse(default_input(__file__))
 
-    print("First puzzle solution:", number_of_plots)
-    print("Second puzzle solution:", polynomial(26501365))
+    print("First puzzle solution:", part1(garden))
+    print("Second puzzle solution:", part2(garden))
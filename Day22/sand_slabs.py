@@ -132,6 +132,7 @@ Your puzzle answer was 75358.
 import re
 import itertools
 from functools import reduce
+from aoc.inputs import default_input, ensure_parsed, read_text
 
 def parse_input(input_lines):
     """Parse the input lines into a list of bricks, each brick is a tuple of three ranges (x, y, z)"""
@@ -217,18 +218,31 @@ def count_falling_bricks(brick, supports_map, supported_by_map):
     supported_by_map_copy = {key: set(val) for key, val in supported_by_map.items()}
     return estimate_brick_fall(brick, supported_by_map_copy)
 
-with open("input.txt", 'r') as file:
-    input_lines = file.read().splitlines()
-
-    # Count the number of bricks that are safe to remove
-    bricks = parse_input(input_lines)
+def settle(bricks):
+    """
+    Drops the bricks and builds the support maps of the settled bricks.
+    """
     dropped_bricks = drop(bricks)
     supports_map, supported_by_map = build_support_maps(dropped_bricks)
-    bricks_number = count_safe_bricks(dropped_bricks, supports_map, supported_by_map)
+    return dropped_bricks, supports_map, supported_by_map
+
+def parse(source):
+    """Parse the snapshot into a list of bricks"""
+    return parse_input(read_text(source).splitlines())
+
+def part1(puzzle):
+    """Count the number of bricks that are safe to remove"""
+    dropped_bricks, supports_map, supported_by_map = settle(ensure_parsed(puzzle, parse))
+    return count_safe_bricks(dropped_bricks, supports_map, supported_by_map)
+
+def part2(puzzle):
+    """Sum of the number of other bricks that would fall for each disintegrated brick"""
+    _, supports_map, supported_by_map = settle(ensure_parsed(puzzle, parse))
+    return sum([count_falling_bricks(brick, supports_map, supported_by_map) for brick in find_unsupported_bricks(supported_by_map)])
 
-    # Recalculating the total number of falling bricks for each brick with the revised approach
-    total_falling_bricks_count = sum([count_falling_bricks(brick, supports_map, supported_by_map) for brick in find_unsupported_bricks(supported_by_map)])
 
-    print("Fisrt puzzle solution:", bricks_number)
-    print("Second puzzle solution:", total_falling_bricks_count)
+if __name__ == "__main__":
+    bricks = parse(default_input(__file__))
 
+    print("Fisrt puzzle solution:", part1(bricks))
+    print("Second puzzle solution:", part2(bricks))
@@ -99,79 +99,66 @@ Find the longest hike you can take through the surprisingly dry hiking trails li
 
 Your puzzle answer was 6586.
 """
-from collections import defaultdict
+from aoc.cache import cached_call
+from aoc.graph import Graph, longest_path_in_dag
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
 
-def create_graph(map_data):
-    """
-    Convert the map data into a graph where each node represents a tile (path or slope),
-    and edges represent possible movements according to the map rules.
-    """
-    graph = defaultdict(dict)
-    directions = {'^': (-1, 0), '>': (0, 1), 'v': (1, 0), '<': (0, -1)}
+# Stack of the depth-first search, aoc.metrics swaps it for a list that counts the pushes
+Stack = list
 
-    for i, row in enumerate(map_data):
-        for j, tile in enumerate(row):
-            if tile in '.^>v<':
-                for di, dj in [directions[tile]] if tile in directions else directions.values():
-                    ni, nj = i + di, j + dj
-                    if 0 <= ni < len(map_data) and 0 <= nj < len(map_data[ni]) and map_data[ni][nj] in '.^>v<':
-                        graph[(i, j)][(ni, nj)] = 1
+PATH, FOREST = ord('.'), ord('#')
+OPEN_TILES = frozenset(b'.^>v<')
 
-    return graph
-
-def create_intersection_graph(map_data):
+def create_intersection_graph(map_data, follow_slopes):
     """
     Convert the map data into a graph where nodes are intersections and dead ends.
-    Edges represent paths between these nodes with their length as weights.
+    Edges represent the corridors between these nodes with their length as weights. Nodes are
+    labelled with their flat index in the map, which is bordered by forest, and list their
+    neighbours in the order of those indices. When following the slopes, a slope can only be
+    left downhill, so the corridors that climb one are not edges.
     """
-    graph = defaultdict(dict)
-    directions = [(0, 1), (1, 0), (-1, 0), (0, -1)]
-
-    def is_open_tile(tile):
-        return tile in '.^>v<'
+    cells = map_data.cells
+    up, right, down, left = map_data.directions
+    slopes = {ord('^'): up, ord('>'): right, ord('v'): down, ord('<'): left}
+    directions = [right, down, up, left]
 
-    def is_intersection_or_dead_end(i, j):
-        open_neighbors = sum(is_open_tile(map_data[i + di][j + dj])
-                             for di, dj in directions
-                             if 0 <= i + di < len(map_data) and 0 <= j + dj < len(map_data[0]))
+    def is_intersection_or_dead_end(index):
+        open_neighbors = sum(cells[index + offset] in OPEN_TILES for offset in directions)
         return open_neighbors > 2 or open_neighbors == 1
 
-    def bfs(start, end):
-        """ Breadth-first search to find the shortest path from start to end and its length """
-        queue = [(start, [start])]
-        visited = {start}
-
-        while queue:
-            current, path = queue.pop(0)
-            if current == end:
-                return len(path) - 1
-
-            for di, dj in directions:
-                ni, nj = current[0] + di, current[1] + dj
-                if (0 <= ni < len(map_data) and 0 <= nj < len(map_data[0]) and
-                is_open_tile(map_data[ni][nj]) and (ni, nj) not in visited):
-                     if (ni, nj) == end or not is_intersection_or_dead_end(ni, nj):
-                        visited.add((ni, nj))
-                        queue.append(((ni, nj), path + [(ni, nj)]))
-
-        return 0  # No path found
+    def moves(index):
+        """ Offsets to the open tiles that can be reached in one step """
+        tile = cells[index]
+        offsets = [slopes[tile]] if follow_slopes and tile in slopes else directions
+        return [offset for offset in offsets if cells[index + offset] in OPEN_TILES]
 
     # Identify all intersections and dead ends as nodes
-    nodes = [(i, j) for i in range(len(map_data)) for j in range(len(map_data[0])) if is_open_tile(map_data[i][j]) and is_intersection_or_dead_end(i, j)]
-
-    # Find paths between nodes
-    for i in range(len(nodes)):
-        for j in range(i + 1, len(nodes)):
-            length = bfs(nodes[i], nodes[j])
-            if length:
-                graph[nodes[i]][nodes[j]] = length
-                graph[nodes[j]][nodes[i]] = length  # Graph is undirected
-
-    return graph
+    nodes = [index for index in map_data.indices() if cells[index] in OPEN_TILES and is_intersection_or_dead_end(index)]
+    is_node = set(nodes)
+
+    # Walk every corridor from its ends, a corridor tile has a single way forward
+    graph = {node: {} for node in nodes}
+    for node in nodes:
+        for offset in moves(node):
+            previous, current, length = node, node + offset, 1
+            while current not in is_node:
+                forward = [current + step for step in moves(current) if current + step != previous]
+                if not forward:
+                    break  # The corridor climbs a slope
+                previous, current, length = current, forward[0], length + 1
+            else:
+                graph[node][current] = max(graph[node].get(current, 0), length)
+
+    return Graph.from_adjacency({node: dict(sorted(neighbors.items())) for node, neighbors in graph.items()})
 
 def dfs(graph, start_node, end_node):
-    """ Depth-first search to find the longest path from start to end and its length """
-    stack = [(start_node, set([start_node]), 0)]
+    """
+    Depth-first search to find the longest path from start to end and its length.
+    The nodes visited by a path are kept as the bits of an int.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    stack = Stack([(start_node, 1 << start_node, 0)])
     longest_path = 0
     longest_path_count = 0
     stop_count = 10 ** 5
@@ -190,40 +177,43 @@ def dfs(graph, start_node, end_node):
             longest_path_count += 1
 
         else:
-            for neighbor, length in graph[current_node].items():
-                if neighbor not in visited:
-                    new_visited = visited.copy()
-                    new_visited.add(neighbor)
-                    stack.append((neighbor, new_visited, path_length + length))
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                if not visited >> neighbor & 1:
+                    stack.append((neighbor, visited | 1 << neighbor, path_length + weights[edge]))
 
     return longest_path
 
-with open('input.txt', 'r') as f:
-    content = f.read().strip()
-    # Parse the map from the file content
-    map_data = [list(row) for row in content.split('\n')]
-
-    # Display the size of the map and a small portion to verify the parsing
-    map_height = len(map_data)
-    map_width = len(map_data[0]) if map_height > 0 else 0
-
-    # # Create the graph from the map data
-    graph = create_graph(map_data)
+def parse(source):
+    """
+    Parse the map and find the start and end nodes (single path tile in the top and bottom rows).
+    """
+    map_data = Grid.from_text(read_bytes(source), border=FOREST)
 
-    # Find the start and end nodes (single path tile in the top and bottom rows)
-    start_node = next((i, j) for i in range(map_height) for j in range(map_width) if map_data[i][j] == '.' and i == 0)
-    end_node = next((i, j) for i in range(map_height) for j in range(map_width) if map_data[i][j] == '.' and i == map_height - 1)
+    start_node = map_data.index(0, map_data.row(0).index(PATH))
+    end_node = map_data.index(map_data.height - 1, map_data.row(map_data.height - 1).index(PATH))
 
-    # Perform the DFS search to find the longest path for the first part of the puzzle
-    longest_path_length = dfs(graph, start_node, end_node)
+    return map_data, start_node, end_node
 
-    # Create the intersection graph from the map data
-    intersection_graph = create_intersection_graph(map_data)
+def part1(puzzle):
+    """ Longest hike when the slopes can only be walked downhill """
+    map_data, start_node, end_node = ensure_parsed(puzzle, parse)
+    graph = cached_call(create_intersection_graph, map_data, True)
+    try:
+        # Slopes around the intersections make the downhill corridors acyclic
+        return longest_path_in_dag(graph, graph.ids[start_node], graph.ids[end_node])
+    except ValueError:
+        return dfs(graph, graph.ids[start_node], graph.ids[end_node])
 
-    # Perform the DFS search to find the longest path for the second part of the puzzle
-    longest_path_length_no_slopes = dfs(intersection_graph, start_node, end_node)
+def part2(puzzle):
+    """ Longest hike when the slopes can be walked in any direction """
+    map_data, start_node, end_node = ensure_parsed(puzzle, parse)
+    intersection_graph = cached_call(create_intersection_graph, map_data, False)
+    return dfs(intersection_graph, intersection_graph.ids[start_node], intersection_graph.ids[end_node])
 
-    print("First puzzle solution:", longest_path_length)
-    print("Second puzzle solution:", longest_path_length_no_slopes)
 
+if __name__ == '__main__':
+    hiking_map = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(hiking_map))
+    print("Second puzzle solution:", part2(hiking_map))
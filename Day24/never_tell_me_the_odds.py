@@ -106,8 +106,15 @@ Determine the exact position and velocity the rock needs to have at time 0 so th
 
 Your puzzle answer was 761691907059631.
 """
-from itertools import combinations
-from sympy import symbols, Eq, solve
+from fractions import Fraction
+from functools import partial
+from aoc.inputs import default_input, ensure_parsed, read_text
+from aoc.parallel import parallel_map
+
+try:
+    from sympy import symbols, Eq, solve
+except ImportError:  # Only needed by the symbolic solver, which the exact one replaces
+    symbols = Eq = solve = None
 
 def read_hailstones_data(lines):
     hailstones = []
@@ -150,19 +157,43 @@ def find_intersection(hailstone1, hailstone2):
 
     return intersection_x, intersection_y
 
-def count_intersections(hailstones, min_x, max_x, min_y, max_y):
+def count_intersections_with(hailstones, area, index):
     """
-    Counts the number of intersections within the specified test area.
+    Counts the intersections within the test area of one hailstone with the hailstones after it.
     """
+    min_x, max_x, min_y, max_y = area
+    h1 = hailstones[index]
     count = 0
-    for h1, h2 in combinations(hailstones, 2):
-        intersection = find_intersection(h1, h2)
+    for other in range(index + 1, len(hailstones)):
+        intersection = find_intersection(h1, hailstones[other])
         if intersection:
             x, y = intersection
             if min_x <= x <= max_x and min_y <= y <= max_y:
                 count += 1
     return count
 
+def count_intersections_balanced(hailstones, area, index):
+    """
+    Counts the intersections of the hailstones at index and at its mirror from the end with
+    the hailstones after them. The first one has many hailstones after it and the second one
+    few, so every such task checks about as many pairs as any other.
+    """
+    mirror = len(hailstones) - 1 - index
+    count = count_intersections_with(hailstones, area, index)
+    if mirror != index:
+        count += count_intersections_with(hailstones, area, mirror)
+    return count
+
+def count_intersections(hailstones, min_x, max_x, min_y, max_y):
+    """
+    Counts the number of intersections within the specified test area. Every pair is counted
+    once, by the first hailstone of the pair, and the hailstones are counted in parallel in
+    balanced tasks of two hailstones each.
+    """
+    area = (min_x, max_x, min_y, max_y)
+    tasks = range((len(hailstones) + 1) // 2)
+    return sum(parallel_map(partial(count_intersections_balanced, hailstones, area), tasks))
+
 
 def find_rock_trajectory(hailstones):
     """
@@ -215,17 +246,85 @@ def find_rock_trajectory(hailstones):
 
     return None
 
-with open('input.txt', 'r') as file:
-    hailstones = read_hailstones_data(file.readlines())
-    # Defining the test area boundaries
-    min_x, max_x = 200000000000000, 400000000000000
-    min_y, max_y = 200000000000000, 400000000000000
 
-    # Counting the intersections
-    intersection_count = count_intersections(hailstones, min_x, max_x, min_y, max_y)
+def cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+def rock_equations(hailstone1, hailstone2):
+    """
+    The three linear equations in (x0, y0, z0, v0x, v0y, v0z) given by a pair of hailstones, as
+    rows of coefficients followed by the constant term.
+
+    The rock meets a hailstone when (P - p_i) x (V - v_i) = 0, whose only non-linear term P x V is
+    the same for every hailstone. Subtracting the equations of two hailstones leaves
+    P x (v_1 - v_2) + (p_1 - p_2) x V = p_1 x v_1 - p_2 x v_2.
+    """
+    (p1, v1), (p2, v2) = hailstone1, hailstone2
+    d = [a - b for a, b in zip(v1, v2)]
+    e = [a - b for a, b in zip(p1, p2)]
+    rhs = [a - b for a, b in zip(cross(p1, v1), cross(p2, v2))]
+    return [
+        [0, d[2], -d[1], 0, -e[2], e[1], rhs[0]],
+        [-d[2], 0, d[0], e[2], 0, -e[0], rhs[1]],
+        [d[1], -d[0], 0, -e[1], e[0], 0, rhs[2]],
+    ]
+
+def solve_linear_system(rows):
+    """
+    Solves a square linear system given as augmented rows with Gauss-Jordan elimination over
+    fractions. Returns the solution, or None if the system has no unique solution.
+    """
+    rows = [[Fraction(value) for value in row] for row in rows]
+    size = len(rows)
+    for column in range(size):
+        pivot = next((row for row in range(column, size) if rows[row][column] != 0), None)
+        if pivot is None:
+            return None
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        pivot_row = rows[column]
+        for row in range(size):
+            factor = rows[row][column] / pivot_row[column]
+            if row != column and factor != 0:
+                rows[row] = [a - factor * b for a, b in zip(rows[row], pivot_row)]
+    return [rows[row][size] / rows[row][row] for row in range(size)]
+
+def find_rock_trajectory_exact(hailstones):
+    """
+    Finds the rock's trajectory from the first three hailstones like find_rock_trajectory, with
+    the six linear equations of rock_equations solved exactly over fractions instead of with
+    sympy. If an integer solution exists, the sum of the position is returned; otherwise None.
+    """
+    first, second, third = hailstones[:3]
+    solution = solve_linear_system(rock_equations(first, second) + rock_equations(first, third))
+    if solution is None or any(value.denominator != 1 for value in solution):
+        return None
+    return int(sum(solution[0:3]))
+
+# Defining the test area boundaries
+TEST_AREA_MIN = 200000000000000
+TEST_AREA_MAX = 400000000000000
+
+def parse(source):
+    return read_hailstones_data(read_text(source).splitlines())
+
+def part1(puzzle):
+    """
+    Number of future intersections of the hailstone paths inside the test area.
+    """
+    hailstones = ensure_parsed(puzzle, parse)
+    return count_intersections(hailstones, TEST_AREA_MIN, TEST_AREA_MAX, TEST_AREA_MIN, TEST_AREA_MAX)
+
+def part2(puzzle):
+    """
+    Sum of the coordinates of the initial position of the rock. Three hailstones are
+    enough to determine the trajectory.
+    """
+    hailstones = ensure_parsed(puzzle, parse)
+    return find_rock_trajectory_exact(hailstones[:3])
+
 
-    # Finding the rock's trajectory
-    rock_trajectory = find_rock_trajectory(hailstones[:3])
+if __name__ == '__main__':
+    hailstones = parse(default_input(__file__))
 
-    print("First puzzle solution:", intersection_count)
-    print("Second puzzle solution:", rock_trajectory)
\ No newline at end of file
+    print("First puzzle solution:", part1(hailstones))
+    print("Second puzzle solution:", part2(hailstones))
@@ -61,40 +61,30 @@ Power required is now 49 stars.
 Please supply the necessary stars and
 push the button to restart the system.
 """
-from functools import lru_cache
-from itertools import combinations, tee
+from itertools import tee
 import random
 from collections import Counter
-import networkx as nx
+from aoc.graph import Graph, connected_components, shortest_path
+from aoc.inputs import default_input, ensure_parsed, read_text
 
 def parse_input(input_data):
     """
     Parses the input data to construct a graph.
     The function reads the input data line by line. Each line represents a node and its directly connected nodes
     in the format 'node: connected_node1 connected_node2 ...'. It constructs and returns a graph where each node is
-    connected to its corresponding nodes.
+    connected to its corresponding nodes, in both directions.
     """
 
-    graph = nx.Graph()
+    graph = {}
 
     for line in input_data.strip().split("\n"):
         parts = line.split(": ")
         node = parts[0]
         connected_nodes = parts[1].split()
         for connected_node in connected_nodes:
-            graph.add_edge(node, connected_node)
-    return graph
-
-@lru_cache(maxsize=None)
-def descendants_at_distance_one(graph, node):
-    """
-    Returns the descendants of a node at a distance of one in the graph.
-
-    This function is memoized using lru_cache to improve performance by caching the results of previous calls.
-    It uses NetworkX's descendants_at_distance function to get all nodes that are exactly one edge away
-    from the specified node.
-    """
-    return nx.descendants_at_distance(graph, node, 1)
+            graph.setdefault(node, set()).add(connected_node)
+            graph.setdefault(connected_node, set()).add(node)
+    return Graph.from_adjacency(graph)
 
 def pairwise(iterable):
     """
@@ -121,16 +111,17 @@ def find_optimal_cuts(graph, num_cuts=3):
     largest components is calculated.
     """
     # Finding nodes and preparing cut candidates
-    nodes = list(graph)
+    nodes = range(len(graph))
+    neighbours = [set(graph.neighbours(node)) for node in nodes]
     cut_candidates = {
-        frozenset((a, b)) for (a, b) in combinations(graph, 2) if b in descendants_at_distance_one(graph, a)
-        and not (descendants_at_distance_one(graph, a) & descendants_at_distance_one(graph, b))
+        frozenset((a, b)) for a in nodes for b in neighbours[a] if a < b
+        and not (neighbours[a] & neighbours[b])
     }
 
     # Sampling paths and counting edges in cut candidates
     edge_counts = Counter()
     for _ in range(1000):
-        for edge in pairwise(nx.shortest_path(graph, *random.choices(nodes, k=2))):
+        for edge in pairwise(shortest_path(graph, *random.choices(nodes, k=2))):
             edgefs = frozenset(edge)
             if edgefs in cut_candidates:
                 edge_counts[edgefs] += 1
@@ -139,22 +130,26 @@ def find_optimal_cuts(graph, num_cuts=3):
     top_edges = [tuple(edgefs) for (edgefs, count) in edge_counts.most_common(num_cuts)]
 
     # Removing selected edges and calculating the product of the sizes of the two components
-    temp_graph = graph.copy()
-    temp_graph.remove_edges_from(top_edges)
-    components = list(nx.connected_components(temp_graph))
+    components = connected_components(graph, top_edges)
     if len(components) == 2:
         return len(components[0]) * len(components[1])
     else:
         return None
 
-# Read the input data
-with open("input.txt", 'r') as file:
-    input_data = file.read()
+def parse(source):
+    """
+    Parses the wiring diagram into a graph.
+    """
+    return parse_input(read_text(source))
+
+def part1(puzzle):
+    """
+    Product of the sizes of the two groups left after cutting three wires.
+    """
+    return find_optimal_cuts(ensure_parsed(puzzle, parse))
 
-# Parsing the input data into a graph
-graph = parse_input(input_data)
 
-# Finding the optimal cuts
-product = find_optimal_cuts(graph)
+if __name__ == "__main__":
+    graph = parse(default_input(__file__))
 
-print("First puzzle solution:", product)
\ No newline at end of file
+    print("First puzzle solution:", part1(graph))
@@ -47,128 +47,92 @@ What is the sum of all of the gear ratios in your engine schematic?
 
 Your puzzle answer was 87605697.
 """
-
-def is_symbol(char):
-    """Check if the character is a symbol (not a period or a digit)."""
-    return not (char.isdigit() or char == '.')
-
-def sum_part_numbers(schematic):
+from aoc.grid import Grid
+from aoc.inputs import default_input, ensure_parsed, read_bytes
+
+PERIOD, GEAR = ord('.'), ord('*')
+DIGITS = frozenset(b'0123456789')
+
+def is_symbol(cell):
+    """Check if the cell is a symbol (not a period or a digit)."""
+    return cell != PERIOD and cell not in DIGITS
+
+def number_spans(grid):
+    """Yield the first and last flat index of every number in the schematic."""
+    cells = grid.cells
+    for index in grid.indices():
+        # A number starts on a digit that follows a non-digit (the border is a period)
+        if cells[index] in DIGITS and cells[index - 1] not in DIGITS:
+            end_index = index
+            while cells[end_index + 1] in DIGITS:
+                end_index += 1
+            yield index, end_index
+
+def sum_part_numbers(grid):
     """Calculate the sum of all part numbers in the engine schematic with symbol-based number identification."""
+    cells, stride = grid.cells, grid.stride
     sum_of_parts = 0
-    num_rows = len(schematic)
-
-    for row in range(num_rows):
-        line = schematic[row].strip()  # Remove newline characters
-        num_cols = len(line)
-        col = 0
-
-        while col < num_cols:
-            if line[col].isdigit():
-                # Found the start of a number, now find its end
-                start_index = col
-                while col < num_cols and line[col].isdigit():
-                    col += 1
-                end_index = col - 1
-
-                # Define the rectangle around the number with additional line checks
-                top = max(0, row - 1)
-                bottom = min(num_rows - 1, row + 1)
-                left = max(0, start_index - 1)
-                right = min(num_cols - 1, end_index + 1)
-
-                # Check surroundings for symbols
-                has_symbol = False
-                for r in range(top, bottom + 1):
-                    for c in range(left, right + 1):
-                        if r == row and c >= start_index and c <= end_index:
-                            continue  # Skip the number itself
-                        if is_symbol(schematic[r][c]):
-                            has_symbol = True
-                            break
-                    if has_symbol:
-                        break
-
-                # Additionally, check the immediate left and right on the same line
-                if not has_symbol:
-                    if start_index > 0 and is_symbol(line[start_index - 1]):
-                        has_symbol = True
-                    elif end_index < num_cols - 1 and is_symbol(line[end_index + 1]):
-                        has_symbol = True
-
-                # Add the number to the sum if a symbol is found
-                if has_symbol:
-                    sum_of_parts += int(line[start_index:col])
-            else:
-                col += 1
+
+    for start_index, end_index in number_spans(grid):
+        # The rectangle around the number, its rows above and below and the cells on each side
+        surroundings = (cells[start_index - stride - 1:end_index - stride + 2] +
+                        cells[start_index + stride - 1:end_index + stride + 2] +
+                        cells[start_index - 1:start_index] + cells[end_index + 1:end_index + 2])
+        if any(is_symbol(cell) for cell in surroundings):
+            sum_of_parts += int(cells[start_index:end_index + 1])
 
     return sum_of_parts
 
 
-def find_gears_and_calculate_ratios_with_position_check(schematic):
+def find_gears_and_calculate_ratios_with_position_check(grid):
     """Find gears and calculate their ratios in the engine schematic with position-based number identification."""
-    num_rows = len(schematic)
+    cells, stride = grid.cells, grid.stride
     gear_ratios_sum = 0
-
-    for row in range(num_rows):
-        line = schematic[row].strip()
-        num_cols = len(line)
-
-        for col in range(num_cols):
-            if line[col] == '*':
-                # Found a gear, now check its surroundings for part numbers
-                top = max(0, row - 1)
-                bottom = min(num_rows - 1, row + 1)
-                left = max(0, col - 1)
-                right = min(num_cols - 1, col + 1)
-
-                part_numbers = []
-
-                # Check surrounding including diagonals for part numbers
-                for r in range(top, bottom + 1):
-                    for c in range(left, right + 1):
-                        if r == row and c == col:
-                            continue  # Skip the gear itself
-
-                        if schematic[r][c].isdigit():
-                            # Found a digit, determine the boundaries of the number
-                            start_index, end_index = c, c
-
-                            # Determine the horizontal boundaries of the number
-                            while start_index > 0 and schematic[r][start_index - 1].isdigit():
-                                start_index -= 1
-                            while end_index < num_cols - 1 and schematic[r][end_index + 1].isdigit():
-                                end_index += 1
-
-                            # Extract the number and its position
-                            number = int(schematic[r][start_index:end_index + 1])
-                            position = (r, start_index, end_index)
-
-                            # Add the number with its position
-                            if (number, position) not in part_numbers:
-                                part_numbers.append((number, position))
-
-                            # Break if two numbers are found
-                            if len(part_numbers) == 2:
-                                break
-                    if len(part_numbers) == 2:
-                        break
-
-                # Calculate the gear ratio if exactly two part numbers are found
+    # Surrounding cells row by row, left to right
+    around = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+
+    for index in grid.indices():
+        if cells[index] == GEAR:
+            part_numbers = []
+
+            for offset in around:
+                start_index = end_index = index + offset
+                if cells[start_index] not in DIGITS:
+                    continue
+                # Found a digit, determine the boundaries of the number
+                while cells[start_index - 1] in DIGITS:
+                    start_index -= 1
+                while cells[end_index + 1] in DIGITS:
+                    end_index += 1
+
+                number = int(cells[start_index:end_index + 1])
+                if (number, start_index) not in part_numbers:
+                    part_numbers.append((number, start_index))
+                # Break if two numbers are found
                 if len(part_numbers) == 2:
-                    gear_ratio = part_numbers[0][0] * part_numbers[1][0]
-                    gear_ratios_sum += gear_ratio
+                    break
+
+            # Calculate the gear ratio if exactly two part numbers are found
+            if len(part_numbers) == 2:
+                gear_ratios_sum += part_numbers[0][0] * part_numbers[1][0]
 
     return gear_ratios_sum
 
+def parse(source):
+    """ Read the engine schematic into a grid bordered by periods. """
+    return Grid.from_text(read_bytes(source), border=PERIOD)
 
-with open("input.txt") as file:
-    engine_schematic = file.readlines()
+def part1(puzzle):
+    """ Sum of all the part numbers in the engine schematic. """
+    return sum_part_numbers(ensure_parsed(puzzle, parse))
 
-    # Calculate the sum of all the part numbers
-    sum_of_parts = sum_part_numbers(engine_schematic)
-    gear_ration_sum = find_gears_and_calculate_ratios_with_position_check(engine_schematic)
+def part2(puzzle):
+    """ Sum of all the gear ratios in the engine schematic. """
+    return find_gears_and_calculate_ratios_with_position_check(ensure_parsed(puzzle, parse))
 
-    print("First puzzle solution:", sum_of_parts)
-    print("Second puzzle solution:", gear_ration_sum)
 
+if __name__ == "__main__":
+    engine_schematic = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(engine_schematic))
+    print("Second puzzle solution:", part2(engine_schematic))
@@ -53,19 +53,28 @@ Process all of the original and copied scratchcards until no more scratchcards a
 
 Your puzzle answer was 8172507.
 """
+from collections import deque
+
+from aoc.inputs import Records, default_input, ensure_parsed
+
+def card_numbers(card_line):
+    """ The set of winning numbers and the own numbers of a card line, given as bytes or text. """
+    if isinstance(card_line, str):
+        card_line = card_line.encode()
+
+    # Splitting the line to get the part after the colon (:)
+    _, numbers = card_line.split(b':')
+
+    # Splitting the numbers into winning numbers and own numbers
+    winning_numbers, own_numbers = numbers.split(b'|')
+    return set(map(int, winning_numbers.split())), map(int, own_numbers.split())
 
 def parse_and_calculate_card_points(card_line):
     """
     Parse a card line to extract the winning and own numbers,
     and then calculate the points for that card.
     """
-    # Splitting the line to get the part after the colon (:)
-    _, numbers = card_line.split(':')
-
-    # Splitting the numbers into winning numbers and own numbers
-    winning_numbers, own_numbers = numbers.split('|')
-    winning_numbers = set(map(int, winning_numbers.split()))
-    own_numbers = map(int, own_numbers.split())
+    winning_numbers, own_numbers = card_numbers(card_line)
 
     # Calculating points
     points = 0
@@ -83,32 +92,43 @@ def count_matching_numbers(winning_numbers, own_numbers):
     return sum(1 for number in own_numbers if number in winning_numbers)
 
 def process_scratchcards(data):
-    """ Process the scratchcards and return the total number of scratchcards."""
+    """ Process the scratchcards and return the number of copies of every scratchcard."""
+    card_counts = []
+    # Copies won for the next cards, the card after the current one first
+    won_copies = deque()
 
-    # Initialize count array with 1 for each card (as each card exists initially)
-    card_counts = [1] * len(data)
+    for card_line in data:
+        winning_numbers, own_numbers = card_numbers(card_line)
 
-    for i, card_line in enumerate(data):
-        _, numbers = card_line.split(':')
-        winning_numbers, own_numbers = numbers.split('|')
-        winning_numbers = set(map(int, winning_numbers.split()))
-        own_numbers = map(int, own_numbers.split())
+        # Each card exists initially, plus the copies won from the previous cards
+        count = 1 + (won_copies.popleft() if won_copies else 0)
+        card_counts.append(count)
 
+        # Add the count to subsequent cards based on the number of matches. Copies of cards
+        # past the end of the table are never read.
         matches = count_matching_numbers(winning_numbers, own_numbers)
-
-        # Add the count to subsequent cards based on the number of matches and current count of the card
-        for j in range(i + 1, min(i + 1 + matches, len(data))):
-            card_counts[j] += card_counts[i]
+        won_copies.extend([0] * (matches - len(won_copies)))
+        for j in range(matches):
+            won_copies[j] += count
 
     return card_counts
 
+def parse(source):
+    """ The lines of the scratchcards, read one at a time. """
+    return Records(source)
+
+def part1(puzzle):
+    """ Total points of all the scratchcards. """
+    lines = ensure_parsed(puzzle, parse)
+    return sum(parse_and_calculate_card_points(card) for card in lines)
 
-with open("input.txt") as file:
-    lines = file.readlines()
+def part2(puzzle):
+    """ Total number of scratchcards, including the copies won. """
+    return sum(process_scratchcards(ensure_parsed(puzzle, parse)))
 
-    total_points = sum(parse_and_calculate_card_points(card) for card in lines)
-    total_scratchcards = sum(process_scratchcards(lines))
 
-    print("First puzzle solution:", total_points)
-    print("Second puzzle solution:", total_scratchcards)
+if __name__ == "__main__":
+    lines = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(lines))
+    print("Second puzzle solution:", part2(lines))
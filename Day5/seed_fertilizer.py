@@ -95,6 +95,9 @@ Consider all of the initial seed numbers listed in the ranges on the first line
 
 Your puzzle answer was 77435348.
 """
+from aoc.inputs import default_input, ensure_parsed, read_text
+from aoc.intervals import IntervalSet, PiecewiseLinear
+
 def parse_mappings(content):
     """
     Parses the provided content to extract seed numbers and the mappings for each category.
@@ -145,72 +148,44 @@ def find_lowest_location(seeds, mappings):
 
     return lowest_location
 
-def map_intervals(interval, mapping_rules):
+def category_function(mapping_rules):
     """
-    Maps an interval of numbers through the given mapping rules.
-    The rules are a list of tuples (destination_start, source_start, range_length).
-    Returns a list of intervals resulting from the mapping.
+    The mapping rules (destination_start, source_start, range_length) as a function that shifts
+    each source range to its destination.
     """
-    result_intervals = []
-    start, end = interval
+    return PiecewiseLinear((source_start, source_start + range_length, destination_start - source_start)
+                           for destination_start, source_start, range_length in mapping_rules)
 
-    for destination_start, source_start, range_length in mapping_rules:
-        source_end = source_start + range_length - 1
-        interval_adjustment = destination_start - source_start
-
-        # Case 1: Interval starts before and intersects with the mapping rule
-        if start < source_start < end:
-            if end <= source_end:
-                result_intervals.append((start, source_start))  # Part before the mapping
-                result_intervals.append((destination_start, destination_start + (end - source_start)))  # Mapped part
-                return result_intervals  # Entire interval processed
-            else:
-                result_intervals.append((start, source_start))  # Part before the mapping
-                start = source_end  # Adjust start for next mapping
-
-        # Case 2: Interval is entirely within a mapping rule
-        elif source_start <= start and end <= source_end:
-            mapped_start = start + interval_adjustment
-            mapped_end = end + interval_adjustment
-            result_intervals.append((mapped_start, mapped_end))
-            return result_intervals  # Entire interval processed
-
-        # Case 3: Interval starts within a mapping rule but extends beyond it
-        elif source_start <= start < source_end:
-            mapped_start = start + interval_adjustment
-            mapped_end = source_end + interval_adjustment
-            result_intervals.append((mapped_start, mapped_end))  # Mapped part
-            start = source_end + 1  # Adjust start for next mapping
-
-    # Remaining part of the interval, if any, maps to itself
-    if start <= end:
-        result_intervals.append((start, end))
-
-    return result_intervals
-
-def find_lowest_location_intervals(seeds, mappings):
+def find_lowest_location_ranges(seeds, mappings):
     """
-    Finds the lowest location number that corresponds to any seed number in the seed intervals.
+    Finds the lowest location number that corresponds to any seed number in the seed ranges.
+    The seed ranges are mapped as a whole set of intervals through each category. The set stays
+    coalesced, so it never holds more intervals than the boundaries of the rules it went through.
     """
-    intervals = [(seeds[i], seeds[i] + seeds[i + 1]) for i in range(0, len(seeds), 2)]
+    numbers = IntervalSet.from_lengths(zip(seeds[0::2], seeds[1::2]))
     for category in mappings:
-        new_intervals = []
-        for interval in intervals:
-            mapped_intervals = map_intervals(interval, mappings[category])
-            new_intervals.extend(mapped_intervals)
-        intervals = new_intervals
+        numbers = category_function(mappings[category]).image(numbers)
+    return numbers.min()
 
-    # Finding the lowest location number from the intervals
-    return min(interval[0] for interval in intervals)
+def parse(source):
+    """ Parse the almanac into the seed numbers and the mappings sorted by source start. """
+    seeds, mappings = parse_mappings(read_text(source).splitlines())
+    mappings = {k: sorted(v, key=lambda x: x[1]) for k, v in mappings.items()} # Sorted mappings by source start
+    return seeds, mappings
 
-with open("input.txt") as file:
-    lines = file.readlines()
+def part1(puzzle):
+    """ Lowest location number for the individual seed numbers. """
+    seeds, mappings = ensure_parsed(puzzle, parse)
+    return find_lowest_location(seeds, mappings)
+
+def part2(puzzle):
+    """ Lowest location number for the seed ranges. """
+    seeds, mappings = ensure_parsed(puzzle, parse)
+    return find_lowest_location_ranges(seeds, mappings)
 
-    seeds, mappings = parse_mappings(lines)
-    mappings = {k: sorted(v, key=lambda x: x[1]) for k, v in mappings.items()} # Sorted mappings by source start
 
-    lowest_location_number = find_lowest_location(seeds, mappings)
-    lowest_location_number_intervals = find_lowest_location_intervals(seeds, mappings)
+if __name__ == "__main__":
+    almanac = parse(default_input(__file__))
 
-    print("First puzzle solution:", lowest_location_number)
-    print("Second puzzle solution:", lowest_location_number_intervals)
\ No newline at end of file
+    print("First puzzle solution:", part1(almanac))
+    print("Second puzzle solution:", part2(almanac))
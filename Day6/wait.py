@@ -54,6 +54,7 @@ Your puzzle answer was 32607562.
 """
 
 import math
+from aoc.inputs import default_input, ensure_parsed, read_text
 
 def calculate_ways_to_win(time, record):
     """
@@ -66,7 +67,8 @@ def calculate_ways_to_win(time, record):
         if distance > record:
             ways_to_win += 1
 
-    midpoint_win = 1 if time % 2 == 0 else 0
+    # The midpoint of an even race was counted once but is not mirrored
+    midpoint_win = 1 if time % 2 == 0 and (time // 2) ** 2 > record else 0
     return ways_to_win * 2 - midpoint_win
 
 def calculate_ways_to_win_formula(time, distance):
@@ -84,39 +86,42 @@ def calculate_ways_to_win_formula(time, distance):
     if discriminant < 0:
         return 0
 
-    # Calculate the square root of the discriminant
-    sqrt_discriminant = math.sqrt(discriminant)
-    # Calculate the two roots of the quadratic equation
-    root1 = (-b + sqrt_discriminant) / (2 * a)
-    root2 = (-b - sqrt_discriminant) / (2 * a)
+    # Calculate the integer square root of the discriminant, floats lose precision on long races
+    sqrt_discriminant = math.isqrt(discriminant)
+    # Smallest hold time that beats the record; the winning range is symmetric around time / 2
+    lower_bound = (-b - sqrt_discriminant) // (2 * a)
+    while lower_bound * (time - lower_bound) <= distance and lower_bound <= time // 2:
+        lower_bound += 1
+    upper_bound = time - lower_bound
 
-    # Determine the valid range of hold times (i) based on the roots
-    lower_bound = math.ceil(min(root1, root2))
-    upper_bound = math.floor(max(root1, root2))
-
-    # Return the number of ways to win within the valid range of i
+    # Return the number of ways to win within the valid range of i (a tie with the record does not win)
     return max(0, upper_bound - lower_bound + 1)
 
-# Open the input file and read the lines
-with open("input.txt") as file:
-    lines = file.readlines()
-
-    # Extract and convert the race times and record distances from the file
+def parse(source):
+    """ Extract the race times and record distances. """
+    lines = read_text(source).splitlines()
     times = [int(x) for x in lines[0].split()[1:]]
     records = [int(x) for x in lines[1].split()[1:]]
+    return times, records
+
+def part1(puzzle):
+    """ Product of the number of ways to win each race, by iterating over the hold times. """
+    times, records = ensure_parsed(puzzle, parse)
+    return math.prod(calculate_ways_to_win(time, record) for time, record in zip(times, records))
+
+def single_race(times, records):
+    """ The time and the record of the one race the sheet holds once the spaces are ignored. """
+    return int(''.join(map(str, times))), int(''.join(map(str, records)))
+
+def part2(puzzle):
+    """ Number of ways to win the single long race, using the quadratic formula. """
+    times, records = ensure_parsed(puzzle, parse)
+    return calculate_ways_to_win_formula(*single_race(times, records))
 
-    # Calculate the number of ways to win for each race using both methods
-    ways_to_win_each_race = [calculate_ways_to_win(time, record) for time, record in zip(times, records)]
-    ways_to_win_each_race_formula = [calculate_ways_to_win_formula(time, record) for time, record in zip(times, records)]
 
-    # Initialize variables to hold the total number of ways to win
-    total_ways_to_win_puzzle1 = 1
-    total_ways_to_win_puzzle2 = 1
-    # Multiply the ways to win for each race to get the total ways to win
-    for ways1, ways2 in zip(ways_to_win_each_race, ways_to_win_each_race_formula):
-        total_ways_to_win_puzzle1 *= ways1
-        total_ways_to_win_puzzle2 *= ways2
+if __name__ == "__main__":
+    races = parse(default_input(__file__))
 
     # Print the solutions for both approaches
-    print("First puzzle solution:", total_ways_to_win_puzzle1)
-    print("Second puzzle solution:", total_ways_to_win_puzzle2)
+    print("First puzzle solution:", part1(races))
+    print("Second puzzle solution:", part2(races))
@@ -68,6 +68,7 @@ Your puzzle answer was 252898370.
 
 from collections import Counter
 from functools import cmp_to_key
+from aoc.inputs import default_input, ensure_parsed, read_text
 
 def rank_hand(hand, joker_rule=False):
     """
@@ -124,19 +125,21 @@ def calculate_total_winnings(hands, joker_rule=False):
     sorted_hands = sorted(hands, key=cmp_to_key(lambda x, y: compare_hands(x, y, joker_rule)), reverse=True)
     return sum(bid * (i+1) for i, (_, bid) in enumerate(sorted_hands))
 
+def parse(source):
+    """ Parse the hands and their bids. """
+    return [(line.split()[0], int(line.split()[1])) for line in read_text(source).splitlines()]
 
-# Open the input file and read the lines
-with open("input.txt") as file:
-    lines = file.readlines()
+def part1(puzzle):
+    """ Total winnings without the joker rule. """
+    return calculate_total_winnings(ensure_parsed(puzzle, parse), joker_rule=False)
 
-    # Parse the input and calculate the rankings
-    hands = [(line.split()[0], int(line.split()[1])) for line in lines]
-
-    # Print the solutions
-    total_winnings1 = calculate_total_winnings(hands, joker_rule=False)
-    total_winnings2 = calculate_total_winnings(hands, joker_rule=True)
-    print("First puzzle solution:", total_winnings1)
-    print("Second puzzle solution:", total_winnings2)
+def part2(puzzle):
+    """ Total winnings with the joker rule. """
+    return calculate_total_winnings(ensure_parsed(puzzle, parse), joker_rule=True)
 
 
+if __name__ == "__main__":
+    hands = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(hands))
+    print("Second puzzle solution:", part2(hands))
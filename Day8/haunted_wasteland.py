@@ -57,25 +57,30 @@ Simultaneously start on every node that ends with A. How many steps does it take
 
 Your puzzle answer was 15726453850399.
 """
+from array import array
 from math import gcd
 from functools import reduce
+from aoc.graph import Graph
+from aoc.inputs import default_input, ensure_parsed, read_text
+
+# Instructions are turned into the position of the edge to follow, left edges come first
+TURNS = {'L': 0, 'R': 1}
 
 # Function to navigate through the nodes
-def navigate_to_zzz(start_node, instructions, nodes):
-    current_node = start_node
+def navigate_to_zzz(start_node, instructions, network):
+    offsets, targets = network.offsets, network.targets
+    current_node = network.ids[start_node]
+    end_node = network.ids['ZZZ']
     steps = 0
     instruction_index = 0
 
-    while current_node != 'ZZZ':
+    while current_node != end_node:
         # Get the next instruction and update the index
-        instruction = instructions[instruction_index]
+        turn = instructions[instruction_index]
         instruction_index = (instruction_index + 1) % len(instructions)
 
         # Navigate to the next node
-        if instruction == 'L':
-            current_node = nodes[current_node][0]
-        else:  # 'R'
-            current_node = nodes[current_node][1]
+        current_node = targets[offsets[current_node] + turn]
 
         steps += 1
 
@@ -90,43 +95,48 @@ def already_found(destination_nodes, node):
 
 
 # Function to navigate through the network from each start node
-def navigate(start_node, instructions, nodes):
-        current_node = start_node
+def navigate(start_node, instructions, network, is_destination):
+        offsets, targets = network.offsets, network.targets
+        current_node = network.ids[start_node]
         steps = 0
         instruction_index = 0
-        visited = {current_node: 0}  # Tracks visited nodes and their positions in the instruction sequence
+        # Tracks visited nodes and their positions in the instruction sequence, -1 when not visited
+        visited = array('q', [-1]) * len(network)
+        visited[current_node] = 0
         destination_nodes = []  # List of destination nodes found
 
         while True:
             # Get the next instruction and update the index
-            instruction = instructions[instruction_index]
+            turn = instructions[instruction_index]
             instruction_index = (instruction_index + 1) % len(instructions)
 
             # Navigate to the next node
-            if instruction == 'L':
-                current_node = nodes[current_node][0]
-            else:  # 'R'
-                current_node = nodes[current_node][1]
+            left_edge = offsets[current_node]
+            current_node = targets[left_edge + turn]
 
             steps += 1
 
             # Check for a destination node and add to the list
-            if current_node.endswith('Z') and not already_found(destination_nodes, current_node):
+            if is_destination[current_node] and not already_found(destination_nodes, current_node):
                 destination_nodes.append((current_node, steps))
 
             # Check for end conditions: loop or node pointing to itself
-            if (current_node in visited and visited[current_node] == instruction_index) or \
-               (nodes[current_node][0] == current_node and nodes[current_node][1] == current_node):
+            left_edge = offsets[current_node]
+            if visited[current_node] == instruction_index or \
+               (targets[left_edge] == current_node and targets[left_edge + 1] == current_node):
                 return destination_nodes
 
             # Update visited nodes
             visited[current_node] = instruction_index
 
-def find_paths_to_destination_nodes(start_node, instructions, nodes):
+def find_paths_to_destination_nodes(start_nodes, instructions, network):
+    # Flags of the nodes ending with 'Z', by node id
+    is_destination = bytearray(label.endswith('Z') for label in network.labels)
+
     # Applying the function to each start node
     results = {}
     for start_node in start_nodes:
-        destinations = navigate(start_node, instructions, nodes)
+        destinations = navigate(start_node, instructions, network, is_destination)
         results[start_node] = destinations
 
     return results
@@ -137,12 +147,15 @@ def lcm(numbers):
         return a * b // gcd(a, b)
     return reduce(lcm_of_two, numbers, 1)
 
-# Open the input file and read the lines
-with open("input.txt") as file:
-    lines = file.readlines()
+def parse(source):
+    """
+    Parse the instructions into edge positions and the node definitions into a graph whose
+    nodes have their left edge first and their right edge second.
+    """
+    lines = read_text(source).splitlines()
 
     # Separating the instructions and the node definitions
-    instructions = lines[0].strip()  # The first line contains the instructions
+    instructions = [TURNS[instruction] for instruction in lines[0].strip()]  # The first line contains the instructions
     node_definitions = lines[2:]  # Skip the first two lines (instructions and an empty line)
 
     # Parsing node definitions
@@ -153,21 +166,32 @@ with open("input.txt") as file:
         left_right = parts[1].strip('()').split(', ')
         nodes[node_label] = left_right
 
-    # Calculate the number of steps to reach 'ZZZ'
-    steps_to_zzz = navigate_to_zzz('AAA', instructions, nodes)
+    return instructions, Graph.from_adjacency(nodes)
+
+def part1(puzzle):
+    """ Number of steps needed to reach 'ZZZ' from 'AAA'. """
+    instructions, network = ensure_parsed(puzzle, parse)
+    return navigate_to_zzz('AAA', instructions, network)
+
+def part2(puzzle):
+    """ Number of steps before all the ghosts are on nodes ending with 'Z'. """
+    instructions, network = ensure_parsed(puzzle, parse)
 
     # Collecting the start nodes (nodes ending with 'A')
-    start_nodes = [node for node in nodes if node.endswith('A')]
+    start_nodes = [node for node in network.labels if node.endswith('A')]
 
     # Finding the destination nodes for each start node
-    all_destinations_results = find_paths_to_destination_nodes(start_nodes, instructions, nodes)
+    all_destinations_results = find_paths_to_destination_nodes(start_nodes, instructions, network)
 
     # Extracting the number of steps for each start node
     steps_list = [all_destinations_results[node][0][-1] for node in all_destinations_results]
 
     # Calculating the least multiple where all nodes end up in a destination node
-    ghost_steps = lcm(steps_list)
+    return lcm(steps_list)
+
 
-    print("First puzzle solution:", steps_to_zzz)
-    print("Second puzzle solution:", ghost_steps)
+if __name__ == "__main__":
+    network = parse(default_input(__file__))
 
+    print("First puzzle solution:", part1(network))
+    print("Second puzzle solution:", part2(network))
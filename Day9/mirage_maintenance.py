@@ -80,6 +80,7 @@ Analyze your OASIS report again, this time extrapolating the previous value for
 Your puzzle answer was 1152.
 """
 from functools import reduce
+from aoc.inputs import Records, default_input, ensure_parsed
 
 def calculate_differences(sequence, direction='next'):
     """
@@ -98,22 +99,27 @@ def calculate_differences(sequence, direction='next'):
     else:
         return reduce(lambda acc, x: x - acc, elements[::-1])
 
-# Open the input file and read the lines
-with open("input.txt") as file:
-    lines = file.readlines()
+def parse_sequence(line):
+    """ Parse a line of the report into a sequence of numbers. """
+    return [int(x) for x in line.split()]
 
-    # Processing each line in the file
-    sum_of_next_values = 0
-    sum_of_previous_values = 0
+def parse(source):
+    """ The lines of the report, read one at a time and parsed by parse_sequence when needed. """
+    return Records(source)
 
-    for line in lines:
-        sequence = [int(x) for x in line.strip().split()]
+def part1(puzzle):
+    """ Sum of the extrapolated next values. """
+    lines = ensure_parsed(puzzle, parse)
+    return sum(calculate_differences(parse_sequence(line), 'next') for line in lines)
 
-        next_value = calculate_differences(sequence.copy(), 'next')
-        previous_value = calculate_differences(sequence.copy(), 'previous')
+def part2(puzzle):
+    """ Sum of the extrapolated previous values. """
+    lines = ensure_parsed(puzzle, parse)
+    return sum(calculate_differences(parse_sequence(line), 'previous') for line in lines)
 
-        sum_of_next_values += next_value
-        sum_of_previous_values += previous_value
 
-    print("First puzzle solution:", sum_of_next_values)
-    print("Second puzzle solution:", sum_of_previous_values)
+if __name__ == "__main__":
+    sequences = parse(default_input(__file__))
+
+    print("First puzzle solution:", part1(sequences))
+    print("Second puzzle solution:", part2(sequences))
@@ -0,0 +1,8 @@
+"""
+Shared helpers for the Advent of Code 2023 solutions.
+
+Each DayN directory holds one solver module exposing ``parse``, ``part1`` and
+``part2`` (Day 25 only has ``part1``). The solvers can be imported from the
+repository root, e.g. ``import Day1.trebuchet``, or run as scripts with
+``python -m Day1.trebuchet``.
+"""
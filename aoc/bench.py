@@ -0,0 +1,218 @@
+"""
+Scaling benchmarks of the day solvers.
+
+Parse, part 1 and part 2 of every day are timed on the checked-in input (scale 1) and on
+scaled-up inputs at larger scales. Days that cannot be scaled from their input use a synthetic one
+from aoc.generators instead. Every measurement runs in its own process with a time limit,
+and once a day exceeds the limit its larger scales are skipped. The results can be written as
+JSON and compared against a stored baseline, or against the reports of other Python runtimes
+(CPython and PyPy) to pick the faster one for each day.
+"""
+import datetime
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from aoc.days import input_path, load_day
+from aoc.generators import GENERATORS, generate
+from aoc.inputs import read_text
+from aoc.scaling import SCALERS
+
+DEFAULT_SCALES = (1, 10, 100)
+STAGES = ("parse", "part1", "part2")
+
+
+def benchmark_input(day, scale, seed=2023):
+    """ Return the input text of a day at the given scale, or None if the day cannot be scaled. """
+    text = read_text(input_path(day))
+    if scale == 1:
+        return text
+    scaler = SCALERS.get(day)
+    if scaler is not None:
+        return scaler(text, scale, random.Random(seed))
+    if day in GENERATORS:
+        return generate(day, scale, seed)[0]
+    return None
+
+
+def best_time(function, repeat):
+    """ Run a function ``repeat`` times and return its last result and its fastest wall time. """
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def measure(day, scale, seed=2023, repeat=1):
+    """ Time parse, part 1 and part 2 of a day at one scale in the current process. """
+    result = {"day": day, "scale": scale}
+    text = benchmark_input(day, scale, seed)
+    if text is None:
+        result["status"] = "no scaler"
+        return result
+
+    module = load_day(day)
+    result["input_bytes"] = len(text.encode())
+    data, result["parse"] = best_time(lambda: module.parse(text), repeat)
+    for part in (1, 2):
+        solver = getattr(module, f"part{part}", None)
+        if solver is not None:
+            _, result[f"part{part}"] = best_time(lambda: solver(data), repeat)
+    result["status"] = "ok"
+    return result
+
+
+def _measure_worker(connection, day, scale, seed, repeat):
+    try:
+        connection.send(measure(day, scale, seed, repeat))
+    except Exception as error:
+        connection.send({"day": day, "scale": scale, "status": "error", "error": repr(error)})
+    finally:
+        connection.close()
+
+
+def measure_with_timeout(day, scale, timeout, seed=2023, repeat=1):
+    """ Run measure in a separate process, giving up after ``timeout`` seconds. """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_worker, args=(sender, day, scale, seed, repeat))
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        return {"day": day, "scale": scale, "status": "timeout"}
+    except EOFError:
+        return {"day": day, "scale": scale, "status": "error", "error": "worker died"}
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+
+def run_benchmarks(days, scales=DEFAULT_SCALES, timeout=60, seed=2023, repeat=1, progress=None):
+    """
+    Benchmark every day at every scale, in increasing order of scale. A day stops at the first
+    scale that times out or fails. ``progress`` is called with every result as it completes.
+    """
+    results = []
+    for day in days:
+        for scale in sorted(scales):
+            result = measure_with_timeout(day, scale, timeout, seed, repeat)
+            results.append(result)
+            if progress:
+                progress(result)
+            if result["status"] in ("timeout", "error"):
+                break
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def growth_exponents(results):
+    """
+    Estimate how the time of each stage grows with the scale, as the exponent k of time ~ scale^k
+    between consecutive measured scales of the same day. Returns {(day, scale): {stage: k}}.
+    """
+    exponents = {}
+    previous = {}
+    for result in results:
+        if result["status"] != "ok":
+            continue
+        day, scale = result["day"], result["scale"]
+        if day in previous:
+            earlier = previous[day]
+            exponents[(day, scale)] = {
+                stage: math.log(result[stage] / earlier[stage]) / math.log(scale / earlier["scale"])
+                for stage in STAGES
+                if result.get(stage) and earlier.get(stage)
+            }
+        previous[day] = result
+    return exponents
+
+
+def compare_with_baseline(current, baseline, tolerance=1.25):
+    """
+    Compare two benchmark reports. Returns a list of (day, scale, stage, baseline_time, current_time)
+    for every stage that became slower than the baseline by more than the tolerance factor.
+    """
+    reference = {(r["day"], r["scale"]): r for r in baseline["results"] if r["status"] == "ok"}
+    regressions = []
+    for result in current["results"]:
+        before = reference.get((result["day"], result["scale"]))
+        if before is None:
+            continue
+        if result["status"] == "timeout":
+            # Finished within the time limit before, so any stage could be the culprit
+            regressions.append((result["day"], result["scale"], "timeout", sum(before.get(s, 0) for s in STAGES), math.inf))
+            continue
+        if result["status"] != "ok":
+            continue
+        for stage in STAGES:
+            if stage in result and stage in before and result[stage] > before[stage] * tolerance:
+                regressions.append((result["day"], result["scale"], stage, before[stage], result[stage]))
+    return regressions
+
+
+def load_report(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_report(report, path):
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def benchmark_interpreter(executable, days, scales=DEFAULT_SCALES, timeout=60, seed=2023, repeat=1):
+    """
+    Run the benchmarks of this checkout under another Python interpreter, such as pypy3, and
+    return its report. The interpreter only needs the standard library.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        output = Path(directory) / "report.json"
+        command = [executable, "-m", "aoc", "bench", *map(str, days), "--scales", *map(str, scales),
+                   "--timeout", str(timeout), "--seed", str(seed), "--repeat", str(repeat), "--output", str(output)]
+        subprocess.run(command, cwd=Path(__file__).resolve().parent.parent, stdout=subprocess.DEVNULL, check=True)
+        report = load_report(output)
+    report["executable"] = os.fspath(executable)
+    return report
+
+
+def total_time(result):
+    """ Parse and solve time of a measurement, or None if it did not finish. """
+    if result["status"] != "ok":
+        return None
+    return sum(result.get(stage, 0) for stage in STAGES)
+
+
+def compare_runtimes(reports):
+    """
+    Line up the reports of several runtimes. Returns, for every day and scale measured by any of
+    them, a dictionary with the total time of each runtime (None if it timed out or failed) and
+    the name of the fastest one. Runtimes are named by the "python" entry of their report.
+    """
+    times = {}
+    for report in reports:
+        for result in report["results"]:
+            times.setdefault((result["day"], result["scale"]), {})[report["python"]] = total_time(result)
+
+    rows = []
+    for (day, scale), by_runtime in sorted(times.items()):
+        finished = {runtime: time for runtime, time in by_runtime.items() if time is not None}
+        fastest = min(finished, key=finished.get) if finished else None
+        rows.append({"day": day, "scale": scale, "times": by_runtime, "fastest": fastest})
+    return rows
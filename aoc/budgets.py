@@ -0,0 +1,66 @@
+"""
+Memory budgets of the day solvers.
+
+A budget caps the peak RSS of the process that solves a part (``peak_rss``) and the peak of the
+memory traced by tracemalloc while parsing and solving it (``traced_peak``). The RSS includes the
+interpreter and the imported modules, about 20MB; the traced peak only counts the Python
+allocations of the part, so it is the steadier number to budget.
+
+Budgets are read from a JSON file whose keys are "default", a day ("18") or a day and a part
+("18-2"), the more specific keys overriding the more general ones:
+
+    {"default": {"peak_rss": "256MB"}, "18": {"traced_peak": "64MB"}, "23-2": {"peak_rss": "512MB"}}
+
+Sizes are numbers of bytes or strings with a B, KB, MB or GB unit.
+"""
+import json
+import re
+
+LIMITS = ("peak_rss", "traced_peak")
+UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+
+def parse_size(size):
+    """ A size in bytes from a number or a string like "256MB". """
+    if isinstance(size, (int, float)):
+        return int(size)
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B)?\s*", size.upper())
+    if not match:
+        raise ValueError(f"invalid size: {size!r}")
+    return int(float(match.group(1)) * UNITS[match.group(2) or "B"])
+
+
+def format_size(size):
+    """ A size in bytes as text with the largest unit that keeps it at 1 or more, e.g. "1.5KB". """
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}B"
+        size /= 1024
+
+
+def load_budgets(path):
+    """ Read a budget file into {key: {limit: bytes}}. """
+    with open(path) as file:
+        budgets = json.load(file)
+    unknown = {limit for budget in budgets.values() for limit in budget} - set(LIMITS)
+    if unknown:
+        raise ValueError(f"unknown budget limit(s): {', '.join(sorted(unknown))}")
+    return {str(key): {limit: parse_size(size) for limit, size in budget.items()} for key, budget in budgets.items()}
+
+
+def budget_for(budgets, day, part):
+    """ The limits that apply to a part: the default ones, then the day's, then the part's. """
+    budget = {}
+    for key in ("default", str(day), f"{day}-{part}"):
+        budget.update(budgets.get(key, {}))
+    return budget
+
+
+def violations(result, budget):
+    """ Descriptions of the limits of a budget that a result went over. """
+    exceeded = []
+    for limit in LIMITS:
+        used = result.get(limit)
+        if limit in budget and used is not None and used > budget[limit]:
+            exceeded.append(f"{limit} {format_size(used)} over the budget of {format_size(budget[limit])}")
+    return exceeded
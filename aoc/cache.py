@@ -0,0 +1,271 @@
+"""
+Content-addressed on-disk cache for parsed inputs, intermediate structures and answers.
+
+Entries are pickles named after a SHA-256 key:
+
+- parsed inputs are keyed by the input bytes and the fingerprint of the parse function, so they
+  survive changes to the rest of the solver;
+- answers are keyed by the input bytes and the source of the whole solver module;
+- solvers can cache expensive steps (e.g. building a graph) with ``cached_call``, keyed by the
+  pickled arguments and the fingerprint of the called function.
+
+A fingerprint covers the source of a function and of every function or class of this repository
+it refers to, directly or not, and the values of the module-level constants and default arguments
+they use. The cache is off unless ``enable`` is called (``aoc run --cache``),
+and is kept under a size limit by evicting the least recently used entries.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import tempfile
+import types
+from pathlib import Path
+
+from aoc.days import ROOT
+
+DEFAULT_LIMIT = 256 * 1024 * 1024
+
+# Values whose repr is the same in every process, so it can stand for them in a fingerprint
+PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, bytearray, range)
+
+_cache = None
+
+
+def default_directory():
+    """ $AOC_CACHE_DIR, or the aoc directory of $XDG_CACHE_HOME (~/.cache by default). """
+    if os.environ.get("AOC_CACHE_DIR"):
+        return Path(os.environ["AOC_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aoc"
+
+
+class DiskCache:
+    """ A directory of pickled entries with a total size limit and least recently used eviction. """
+
+    def __init__(self, directory=None, limit=DEFAULT_LIMIT):
+        self.directory = Path(directory or default_directory())
+        self.limit = limit
+        # Total size of the entries, counted once and then kept up to date by put and evict. Other
+        # processes sharing the directory make it drift, the next eviction counts it again.
+        self.size = None
+
+    def path(self, key):
+        return self.directory / key[:2] / f"{key}.pickle"
+
+    def get(self, key, default=None):
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+            return default
+        os.utime(path)  # the modification time tracks the last use
+        return value
+
+    def put(self, key, value):
+        """ Store a value, unless it cannot be pickled or is larger than the whole cache. """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        if len(data) > self.limit:
+            return False
+
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.entries())
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        # Write to a temporary file first so concurrent readers never see half an entry
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+        self.size += len(data) - replaced
+        if self.size > self.limit:
+            self.evict()
+        return True
+
+    def entries(self):
+        """ (last use, size, path) of every entry. """
+        entries = []
+        for path in self.directory.glob("*/*.pickle"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """ Remove the least recently used entries until the cache fits its size limit. """
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total -= size
+        self.size = total
+
+    def clear(self):
+        for _, _, path in self.entries():
+            path.unlink(missing_ok=True)
+        self.size = 0
+
+
+def enable(directory=None, limit=DEFAULT_LIMIT):
+    """ Turn the cache on for this process. """
+    global _cache
+    _cache = DiskCache(directory, limit)
+    return _cache
+
+
+def disable():
+    global _cache
+    _cache = None
+
+
+def active():
+    """ The cache of this process, or None if it is off. """
+    return _cache
+
+
+def digest(*parts):
+    """ SHA-256 hex digest of a sequence of strings and bytes. """
+    sha = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else bytes(part)
+        sha.update(len(data).to_bytes(8, "little"))
+        sha.update(data)
+    return sha.hexdigest()
+
+
+def _is_local(obj):
+    """ Check if a function or class is defined in this repository rather than a library. """
+    try:
+        source_file = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return source_file is not None and Path(source_file).resolve().is_relative_to(ROOT)
+
+
+def _referenced_names(code):
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= _referenced_names(constant)
+    return names
+
+
+def _data_repr(value):
+    """ repr of a value made of plain constants and containers, or None for anything else. """
+    if isinstance(value, PLAIN_TYPES):
+        return repr(value)
+    if isinstance(value, re.Pattern):
+        return f"re.compile({value.pattern!r}, {value.flags})"
+    if isinstance(value, (tuple, list, dict, set, frozenset)):
+        items = value.items() if isinstance(value, dict) else value
+        reprs = [_data_repr(item) for item in items]
+        if None in reprs:
+            return None
+        if isinstance(value, (set, frozenset)):
+            reprs.sort()  # the iteration order of a set of str changes with the hash seed
+        return f"{type(value).__name__}({', '.join(reprs)})"
+    return None
+
+
+def _data_source(module_globals, name, value):
+    """
+    What a fingerprint records for a constant a function uses: its repr, or the whole source of its
+    module when the value has no stable repr (an instance, a lambda...).
+    """
+    data = _data_repr(value)
+    if data is None:
+        source_file = module_globals.get("__file__")
+        data = digest(Path(source_file).read_bytes()) if source_file else repr(type(value))
+    return f"{module_globals.get('__name__')}.{name} = {data}"
+
+
+def fingerprint(function):
+    """
+    Hash of the source of a function and of every function or class of this repository that it
+    refers to through global names, followed transitively, with the values of the other globals
+    and of the default arguments they use.
+    """
+    seen, sources = set(), []
+    pending = [function]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        try:
+            sources.append(f"{obj.__module__}.{obj.__qualname__}\n{inspect.getsource(obj)}")
+        except (OSError, TypeError):
+            sources.append(repr(obj))
+
+        if inspect.isclass(obj):
+            functions = [member for member in vars(obj).values() if inspect.isfunction(member)]
+        else:
+            functions = [obj] if inspect.isfunction(obj) else []
+        for member in functions:
+            names = [name for name in _referenced_names(member.__code__) if name in member.__globals__]
+            values = [(name, member.__globals__[name]) for name in names]
+            defaults = list(member.__defaults__ or ()) + list((member.__kwdefaults__ or {}).values())
+            values += [(f"{member.__qualname__}.<default {i}>", value) for i, value in enumerate(defaults)]
+            for name, target in values:
+                # Follow functions wrapped by a decorator such as functools.lru_cache
+                target = inspect.unwrap(target) if callable(target) else target
+                if inspect.isfunction(target) or inspect.isclass(target):
+                    if _is_local(target):
+                        pending.append(target)
+                elif not (inspect.ismodule(target) or callable(target)):
+                    sources.append(_data_source(member.__globals__, name, target))
+    return digest(*sorted(set(sources)))
+
+
+def module_fingerprint(module):
+    """ Hash of the whole source file of a module. """
+    return digest(Path(module.__file__).read_bytes())
+
+
+def cached_call(function, *args):
+    """
+    Call a function, or return its result from the cache when the cache is on and the function
+    was already called with equal arguments. The arguments must be picklable.
+    """
+    if _cache is None:
+        return function(*args)
+    key = digest("call", fingerprint(function), pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL))
+    missing = object()
+    value = _cache.get(key, missing)
+    if value is missing:
+        value = function(*args)
+        _cache.put(key, value)
+    return value
+
+
+def cached_parse(module, input_bytes):
+    """ Parse an input with the parse function of a module, through the cache when it is on. """
+    if _cache is None:
+        return module.parse(input_bytes)
+    key = digest("parse", module.__name__, fingerprint(module.parse), input_bytes)
+    missing = object()
+    data = _cache.get(key, missing)
+    if data is missing:
+        data = module.parse(input_bytes)
+        _cache.put(key, data)
+    return data
+
+
+def answer_key(module, part, input_bytes):
+    """ Cache key of the answer of a part, which changes with any change to the solver module. """
+    return digest("answer", module.__name__, str(part), module_fingerprint(module), input_bytes)
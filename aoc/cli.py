@@ -0,0 +1,529 @@
+"""
+Command line interface of the solutions, available as ``python -m aoc``.
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import shutil
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+from aoc import bench, budgets, cache, differential, server, watch
+from aoc.days import find_days, load_day, parse_day_spec
+from aoc.generators import GENERATORS, generate
+from aoc.inputs import follow
+from aoc.runner import PARTS, collect_inputs, run_batch, run_parts, schedule, to_json
+
+
+def format_seconds(seconds):
+    """ Format a duration for the result tables. """
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_bytes(size):
+    """ Format a memory size for the result tables. """
+    return "-" if size is None else budgets.format_size(size)
+
+
+def print_results_table(results, total_time):
+    """ Print the results sorted by day and part, with the traced memory peaks if there are any. """
+    traced = any("traced_peak" in result for result in results)
+    print(f"{'Day':>3} {'Part':>4}  {'Answer':<18} {'Parse':>9} {'Wall':>9} {'CPU':>9} {'Peak RSS':>9}"
+          + (f" {'Traced':>9}" if traced else ""))
+    for result in sorted(results, key=lambda r: (r["day"], r["part"])):
+        if result.get("skipped"):
+            continue
+        if "error" in result:
+            answer = "ERROR"
+        else:
+            answer = str(result["answer"])
+        wall = "cached" if result.get("cached") else format_seconds(result.get("wall_time"))
+        print(f"{result['day']:>3} {result['part']:>4}  {answer:<18} "
+              f"{format_seconds(result.get('parse_time')):>9} {wall:>9} "
+              f"{format_seconds(result.get('cpu_time')):>9} {format_bytes(result.get('peak_rss')):>9}"
+              + (f" {format_bytes(result.get('traced_peak')):>9}" if traced else ""))
+    print(f"Total wall time: {format_seconds(total_time)}")
+
+    for result in results:
+        if "error" in result:
+            print(f"\nDay {result['day']} part {result['part']} failed:\n{result['error']}", file=sys.stderr)
+
+
+def selected_days(args):
+    """ Resolve the day arguments of a command, exiting with a usage error on unknown days. """
+    try:
+        return parse_day_spec(args.days, find_days())
+    except ValueError as error:
+        raise SystemExit(f"aoc: {error}")
+
+
+def save_metrics(results, path):
+    """ Write the work counters of every solved part as JSON. """
+    parts = [
+        {"day": r["day"], "part": r["part"], "metrics": r.get("metrics", {})}
+        for r in sorted(results, key=lambda r: (r["day"], r["part"]))
+        if "answer" in r
+    ]
+    report = {"created": datetime.datetime.now().isoformat(timespec="seconds"), "parts": parts}
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def print_profiles(results):
+    """ Print where each profiled part spent its time and held its memory. """
+    for result in sorted(results, key=lambda r: (r["day"], r["part"])):
+        profile = result.get("profile")
+        if not profile or "files" not in profile:
+            continue
+        print(f"\nDay {result['day']} part {result['part']} ({profile['files'][0]} and friends)")
+        for hotspot in profile["hotspots"]:
+            print(f"  time:   {hotspot}")
+        for site in profile["allocations"]:
+            print(f"  memory: {site}")
+
+
+def read_budgets(args):
+    """ The memory budgets of the budget file, with --max-rss and --max-traced as defaults. """
+    try:
+        limits = budgets.load_budgets(args.budget) if args.budget else {}
+        for limit, size in (("peak_rss", args.max_rss), ("traced_peak", args.max_traced)):
+            if size:
+                limits.setdefault("default", {})[limit] = budgets.parse_size(size)
+    except (OSError, ValueError) as error:
+        raise SystemExit(f"aoc: {error}")
+    return limits
+
+
+def check_budgets(results, limits):
+    """ Print the parts that went over their memory budget and return how many did. """
+    over = 0
+    for result in sorted(results, key=lambda r: (r["day"], r["part"])):
+        if result.get("skipped") or result.get("cached"):
+            continue
+        exceeded = budgets.violations(result, budgets.budget_for(limits, result["day"], result["part"]))
+        for violation in exceeded:
+            print(f"Day {result['day']} part {result['part']}: {violation}", file=sys.stderr)
+        over += bool(exceeded)
+    return over
+
+
+def command_run(args):
+    days = selected_days(args)
+    if args.input and len(days) != 1:
+        raise SystemExit("aoc: --input can only be used with a single day")
+    limits = read_budgets(args)
+    trace_memory = args.memory or any("traced_peak" in budget for budget in limits.values())
+
+    if args.workers:
+        # Read by aoc.parallel in the solver processes, which inherit the environment
+        os.environ["AOC_WORKERS"] = str(args.workers)
+    cache_dir = args.cache_dir or (cache.default_directory() if args.cache else None)
+    tasks = schedule(days, args.part or PARTS)
+    start = time.perf_counter()
+    results = []
+    for result in run_parts(tasks, jobs=args.jobs, input_file=args.input, cache_dir=cache_dir,
+                            collect_metrics=bool(args.metrics), profile_dir=args.profile, trace_memory=trace_memory):
+        results.append(result)
+        if args.json and not result.get("skipped"):
+            print(to_json(result), flush=True)
+
+    if not args.json:
+        print_results_table(results, time.perf_counter() - start)
+        print_profiles(results)
+    if args.metrics:
+        save_metrics(results, args.metrics)
+    over_budget = check_budgets(results, limits) if limits else 0
+    return 1 if over_budget or any("error" in result for result in results) else 0
+
+
+def print_watch_results(results):
+    """ Print a line per part solved again by the watcher, and the errors in full. """
+    stamp = datetime.datetime.now().strftime("%H:%M:%S")
+    for result in sorted(results, key=lambda r: (r["day"], r["part"] or 0)):
+        name = f"Day {result['day']}" + (f" part {result['part']}" if result["part"] else "")
+        if "error" in result:
+            print(f"[{stamp}] {name}: failed", file=sys.stderr)
+            print(result["error"].rstrip(), file=sys.stderr)
+            continue
+        times = [f"part {format_seconds(result['wall_time'])}"]
+        if "parse_time" in result:
+            times.insert(0, f"parse {format_seconds(result['parse_time'])}")
+        print(f"[{stamp}] {name}: {result['answer']}  ({result['reason']}, {', '.join(times)})", flush=True)
+
+
+def command_watch(args):
+    days = selected_days(args)
+    if args.input and len(days) != 1:
+        raise SystemExit("aoc: --input can only be used with a single day")
+    watcher = watch.Watcher(days, args.part or PARTS, args.input)
+    try:
+        watcher.watch(print_watch_results, args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def open_stream(args, stack):
+    """ The binary stream of records of the stream command: a TCP connection, standard input or a file. """
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        connection = stack.enter_context(socket.create_connection((host or "localhost", int(port))))
+        return stack.enter_context(connection.makefile("rb"))
+    if args.input == "-":
+        return sys.stdin.buffer
+    return stack.enter_context(open(args.input, "rb"))
+
+
+def command_stream(args):
+    if args.day not in find_days():
+        raise SystemExit(f"aoc: unknown day: {args.day}")
+    running_totals = getattr(load_day(args.day), "running_totals", None)
+    if running_totals is None:
+        raise SystemExit(f"aoc: day {args.day} cannot be solved from a stream")
+
+    def report(count, answers):
+        if args.json:
+            print(json.dumps({"day": args.day, "records": count, "answers": dict(zip(PARTS, answers))}), flush=True)
+        else:
+            parts = ", ".join(f"part {part} {answer}" for part, answer in zip(PARTS, answers))
+            print(f"{count} records" + (f": {parts}" if parts else ""), flush=True)
+
+    count, answers = 0, ()
+    with contextlib.ExitStack() as stack:
+        try:
+            stream = open_stream(args, stack)
+            records = follow(stream, args.interval) if args.follow else stream
+            for count, answers in enumerate(running_totals(records), 1):
+                if args.every and count % args.every == 0:
+                    report(count, answers)
+        except OSError as error:
+            raise SystemExit(f"aoc: {error}")
+        except KeyboardInterrupt:
+            pass
+    if not args.every or count % args.every:
+        report(count, answers)
+    return 0
+
+
+def command_batch(args):
+    if args.day not in find_days():
+        raise SystemExit(f"aoc: unknown day: {args.day}")
+    inputs = collect_inputs(args.inputs, args.pattern)
+    missing = [str(path) for path in inputs if not path.is_file()]
+    if missing:
+        raise SystemExit(f"aoc: missing input(s): {', '.join(missing)}")
+
+    cache_dir = args.cache_dir or (cache.default_directory() if args.cache else None)
+    failures = 0
+    for result in run_batch(args.day, inputs, args.part or PARTS, args.jobs, cache_dir):
+        if not result.get("skipped"):
+            print(to_json(result), flush=True)
+        failures += "error" in result
+    return 1 if failures else 0
+
+
+def print_benchmark_row(result, exponents):
+    """ Print one benchmark measurement along with the growth exponent of each part. """
+    day, scale = result["day"], result["scale"]
+    if result["status"] != "ok":
+        error = f": {result['error']}" if "error" in result else ""
+        print(f"{day:>3} {scale:>6}  {result['status']}{error}", flush=True)
+        return
+
+    growth = exponents.get((day, scale), {})
+    columns = []
+    for stage in bench.STAGES:
+        column = format_seconds(result.get(stage))
+        if stage in growth:
+            column += f" (n^{growth[stage]:.1f})"
+        columns.append(f"{column:>18}")
+    print(f"{day:>3} {scale:>6}  {format_bytes(result['input_bytes']):>9}  {''.join(columns)}", flush=True)
+
+
+def command_bench(args):
+    days = selected_days(args)
+    results = []
+
+    def progress(result):
+        results.append(result)
+        print_benchmark_row(result, bench.growth_exponents(results))
+
+    print(f"{'Day':>3} {'Scale':>6}  {'Input':>9}  {'Parse':>18}{'Part 1':>18}{'Part 2':>18}")
+    report = bench.run_benchmarks(days, args.scales, args.timeout, args.seed, args.repeat, progress)
+    if args.output:
+        bench.save_report(report, args.output)
+
+    if not args.baseline:
+        return 0
+    regressions = bench.compare_with_baseline(report, bench.load_report(args.baseline), args.tolerance)
+    for day, scale, stage, before, after in regressions:
+        print(f"Regression: day {day} at scale {scale}, {stage} went from "
+              f"{format_seconds(before)} to {format_seconds(after) if after != float('inf') else 'timeout'}")
+    if not regressions:
+        print(f"No regressions against {args.baseline}")
+    return 1 if regressions else 0
+
+
+def command_runtimes(args):
+    days = selected_days(args)
+    reports = [bench.load_report(path) for path in args.report]
+    for executable in args.python or ([] if reports else [sys.executable, "pypy3"]):
+        if not shutil.which(executable):
+            raise SystemExit(f"aoc: interpreter not found: {executable}")
+        print(f"Benchmarking with {executable}...", file=sys.stderr, flush=True)
+        reports.append(bench.benchmark_interpreter(executable, days, args.scales, args.timeout, args.seed, args.repeat))
+    if args.output:
+        bench.save_report({"reports": reports}, args.output)
+
+    names = set()
+    for report in reports:
+        # Two reports of the same version, e.g. of two builds, are told apart by where they came from
+        if report["python"] in names:
+            report["python"] += f" ({report.get('executable', 'report')})"
+        names.add(report["python"])
+
+    rows = bench.compare_runtimes(reports)
+    runtimes = list(dict.fromkeys(report["python"] for report in reports))
+    widths = [max(18, len(runtime) + 2) for runtime in runtimes]
+    print(f"{'Day':>3} {'Scale':>6}  " + "".join(f"{runtime:>{width}}" for runtime, width in zip(runtimes, widths)) + "  Fastest")
+    for row in rows:
+        if args.days and row["day"] not in days:
+            continue
+        columns = "".join(f"{format_seconds(row['times'].get(runtime)):>{width}}" for runtime, width in zip(runtimes, widths))
+        print(f"{row['day']:>3} {row['scale']:>6}  {columns}  {row['fastest'] or '-'}")
+    return 0
+
+
+def command_generate(args):
+    if args.day not in GENERATORS:
+        raise SystemExit(f"aoc: no generator for day {args.day}")
+    text, answers = generate(args.day, args.scale, args.seed)
+    if args.output:
+        args.output.write_text(text)
+    elif not args.check:
+        print(text)
+
+    if not args.check:
+        for part, answer in answers.items():
+            print(f"Part {part}: {answer}", file=sys.stderr)
+        return 0
+
+    module = load_day(args.day)
+    data = module.parse(text)
+    mismatches = 0
+    for part, expected in answers.items():
+        answer = getattr(module, f"part{part}")(data)
+        if expected is None:
+            status = "not checked"
+        elif answer == expected:
+            status = "ok"
+        else:
+            status = f"MISMATCH, expected {expected}"
+            mismatches += 1
+        print(f"Day {args.day} part {part}: {answer} ({status})")
+    return 1 if mismatches else 0
+
+
+def command_diff(args):
+    names = args.pairs or sorted(differential.PAIRS)
+    unknown = [name for name in names if name not in differential.PAIRS]
+    if unknown:
+        raise SystemExit(f"aoc: unknown pair(s): {', '.join(unknown)}")
+
+    failures = 0
+    for name in names:
+        result = differential.check_pair(name, args.cases, args.seed, args.max_size)
+        if "failure" not in result:
+            print(f"{name}: {result['checked']} cases ok ({result['invalid']} invalid)")
+            continue
+        failures += 1
+        failure = result["failure"]
+        print(f"{name}: MISMATCH after {result['checked']} cases\n"
+              f"  case:      {failure['case']!r}\n"
+              f"  shrunk to: {failure['shrunk']!r}\n"
+              f"  reference: {failure['reference']!r}\n"
+              f"  engine:    {failure['engine']!r}")
+    return 1 if failures else 0
+
+
+def command_serve(args):
+    workers = args.workers or "CPU count"
+
+    def ready(socket_path):
+        print(f"Serving on {socket_path} with {workers} warm workers", flush=True)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    # Stop as cleanly on SIGTERM as on Ctrl-C, so the socket is removed
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve(args.socket, args.workers, ready)
+    except RuntimeError as error:
+        raise SystemExit(f"aoc: {error}")
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def command_ask(args):
+    messages = []
+    stdin_text = None  # read the first time "-" appears, then shared by every part and repetition
+    for input_file in args.input or [None]:
+        for part in args.part or PARTS:
+            message = {"day": args.day, "part": part}
+            if input_file == "-":
+                if stdin_text is None:
+                    stdin_text = sys.stdin.read()
+                message["input"] = stdin_text
+            elif input_file:
+                # The server resolves paths from its own working directory
+                message["path"] = str(Path(input_file).resolve())
+            messages.append(message)
+
+    failures = 0
+    try:
+        for response in server.requests(messages, args.socket):
+            if args.json:
+                print(json.dumps(response), flush=True)
+            elif response.get("skipped"):
+                continue
+            elif "answer" in response:
+                print(f"Day {response['day']} part {response['part']} ({response['input']}): "
+                      f"{response['answer']} in {format_seconds(response.get('wall_time'))}", flush=True)
+            else:
+                print(f"aoc: {response.get('error', response)}", file=sys.stderr)
+            failures += "error" in response
+    except OSError as error:
+        raise SystemExit(f"aoc: cannot reach the server ({error}), start it with: python -m aoc serve")
+    return 1 if failures else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code 2023 solutions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve days in parallel and report time and memory per part")
+    run.add_argument("days", nargs="*", help="days to run, e.g. 1 5-8 23 (default: all)")
+    run.add_argument("-p", "--part", type=int, choices=PARTS, action="append", help="only run this part")
+    run.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: CPU count)")
+    run.add_argument("-w", "--workers", type=int,
+                     help="workers of the parallel loops inside a part (default: $AOC_WORKERS or 1)")
+    run.add_argument("--input", type=Path, help="input file to use instead of the checked-in one")
+    run.add_argument("--json", action="store_true", help="print one JSON object per part as it completes")
+    run.add_argument("--cache", action="store_true",
+                     help="reuse parsed inputs and answers from the on-disk cache (default: ~/.cache/aoc)")
+    run.add_argument("--cache-dir", type=Path, help="cache directory, implies --cache")
+    run.add_argument("--metrics", type=Path, help="count the work of the instrumented solvers into this JSON file")
+    run.add_argument("--profile", type=Path,
+                     help="profile every part with cProfile, stack sampling and tracemalloc into this directory")
+    run.add_argument("--memory", action="store_true",
+                     help="also record the peak of the allocations traced by tracemalloc (slower)")
+    run.add_argument("--budget", type=Path, help="fail when a part goes over the memory budgets of this JSON file")
+    run.add_argument("--max-rss", help="fail when a part peaks above this RSS, e.g. 512MB")
+    run.add_argument("--max-traced", help="fail when the traced allocations of a part peak above this size, implies --memory")
+    run.set_defaults(handler=command_run)
+
+    watcher = commands.add_parser("watch", help="solve days again whenever their input or solver changes")
+    watcher.add_argument("days", nargs="*", help="days to watch, e.g. 19 20 (default: all)")
+    watcher.add_argument("-p", "--part", type=int, choices=PARTS, action="append", help="only solve this part")
+    watcher.add_argument("--input", type=Path, help="input file to watch instead of the checked-in one")
+    watcher.add_argument("--interval", type=float, default=watch.DEFAULT_INTERVAL,
+                         help=f"seconds between two checks of the files (default: {watch.DEFAULT_INTERVAL})")
+    watcher.set_defaults(handler=command_watch)
+
+    stream = commands.add_parser("stream", help="solve a day from a stream of records, keeping only running totals")
+    stream.add_argument("day", type=int, help="day to solve, one whose solver has running_totals (day 2)")
+    stream.add_argument("input", nargs="?", default="-", help="input file, - for standard input (default)")
+    stream.add_argument("--connect", metavar="HOST:PORT", help="read the records from a TCP connection instead")
+    stream.add_argument("--follow", action="store_true", help="keep reading the input as it grows, like tail -f")
+    stream.add_argument("--interval", type=float, default=1.0,
+                        help="seconds to wait at the end of the input with --follow (default: 1)")
+    stream.add_argument("--every", type=int, default=0,
+                        help="print the running answers every N records (default: only at the end)")
+    stream.add_argument("--json", action="store_true", help="print the answers as JSON lines")
+    stream.set_defaults(handler=command_stream)
+
+    batch = commands.add_parser("batch", help="solve many inputs of one day, one JSON line per result as it completes")
+    batch.add_argument("day", type=int, help="day to solve")
+    batch.add_argument("inputs", nargs="+", type=Path,
+                       help="input files, directories of input files or .list manifests of input paths")
+    batch.add_argument("--pattern", default="*.txt", help="input files to take from directories (default: *.txt)")
+    batch.add_argument("-p", "--part", type=int, choices=PARTS, action="append", help="only solve this part")
+    batch.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: CPU count)")
+    batch.add_argument("--cache", action="store_true", help="reuse answers from the on-disk cache")
+    batch.add_argument("--cache-dir", type=Path, help="cache directory, implies --cache")
+    batch.set_defaults(handler=command_batch)
+
+    benchmark = commands.add_parser("bench", help="time every stage on the real and on scaled-up inputs")
+    benchmark.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    benchmark.add_argument("--scales", type=int, nargs="+", default=bench.DEFAULT_SCALES,
+                           help="input scale factors, 1 is the checked-in input (default: 1 10 100)")
+    benchmark.add_argument("--timeout", type=float, default=60, help="time limit per day and scale in seconds")
+    benchmark.add_argument("--repeat", type=int, default=1, help="keep the best of this many runs")
+    benchmark.add_argument("--seed", type=int, default=2023, help="seed of the generated inputs")
+    benchmark.add_argument("--output", type=Path, help="write the results to this JSON file")
+    benchmark.add_argument("--baseline", type=Path, help="compare against the results in this JSON file")
+    benchmark.add_argument("--tolerance", type=float, default=1.25,
+                           help="slowdown factor reported as a regression (default: 1.25)")
+    benchmark.set_defaults(handler=command_bench)
+
+    runtimes = commands.add_parser("runtimes", help="compare the benchmarks of several Python runtimes, e.g. CPython and PyPy")
+    runtimes.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    runtimes.add_argument("--python", action="append",
+                          help="interpreter to benchmark, repeatable (default: this one and pypy3)")
+    runtimes.add_argument("--report", type=Path, action="append", default=[],
+                          help="include an existing `aoc bench --output` report, repeatable")
+    runtimes.add_argument("--scales", type=int, nargs="+", default=(1,), help="input scale factors (default: 1)")
+    runtimes.add_argument("--timeout", type=float, default=60, help="time limit per day and scale in seconds")
+    runtimes.add_argument("--repeat", type=int, default=3, help="keep the best of this many runs (default: 3)")
+    runtimes.add_argument("--seed", type=int, default=2023, help="seed of the generated inputs")
+    runtimes.add_argument("--output", type=Path, help="write all the reports to this JSON file")
+    runtimes.set_defaults(handler=command_runtimes)
+
+    generator = commands.add_parser("generate", help="generate a synthetic input with known answers")
+    generator.add_argument("day", type=int, help="day to generate an input for")
+    generator.add_argument("--scale", type=float, default=1,
+                           help="size relative to the real input, fractions give smaller inputs (default: 1)")
+    generator.add_argument("--seed", type=int, help="random seed, for reproducible inputs")
+    generator.add_argument("--output", type=Path, help="write the input to this file instead of printing it")
+    generator.add_argument("--check", action="store_true",
+                           help="solve the generated input and compare with the known answers")
+    generator.set_defaults(handler=command_generate)
+
+    diff = commands.add_parser("diff", help="check fast engines against their reference implementations")
+    diff.add_argument("pairs", nargs="*", help="registered pairs to check (default: all)")
+    diff.add_argument("--cases", type=int, default=200, help="random cases per pair (default: 200)")
+    diff.add_argument("--seed", type=int, help="random seed, for reproducible cases")
+    diff.add_argument("--max-size", type=int, default=100, help="size of the last and largest case (default: 100)")
+    diff.set_defaults(handler=command_diff)
+
+    serve = commands.add_parser("serve", help="keep warm solvers running and answer requests on a Unix socket")
+    serve.add_argument("--socket", type=Path, help=f"socket path (default: {server.default_socket()})")
+    serve.add_argument("-j", "--workers", type=int, help="number of worker processes (default: CPU count)")
+    serve.set_defaults(handler=command_serve)
+
+    ask = commands.add_parser("ask", help="solve a day on a running server")
+    ask.add_argument("day", type=int, help="day to solve")
+    ask.add_argument("-p", "--part", type=int, choices=PARTS, action="append", help="only solve this part")
+    ask.add_argument("--input", action="append",
+                     help="input file, - for standard input, can be repeated (default: the checked-in input)")
+    ask.add_argument("--socket", type=Path, help=f"socket path (default: {server.default_socket()})")
+    ask.add_argument("--json", action="store_true", help="print the server responses as JSON lines")
+    ask.set_defaults(handler=command_ask)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
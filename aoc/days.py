@@ -0,0 +1,61 @@
+"""
+Discovery and loading of the DayN solver modules.
+
+The solver of a day is the single Python module inside its DayN directory whose
+name does not start with an underscore.
+"""
+import importlib
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DAY_DIRECTORY = re.compile(r"Day(\d+)$")
+
+
+def find_days(root=ROOT):
+    """ Return a dictionary mapping each day number to the dotted name of its solver module. """
+    days = {}
+    for directory in root.iterdir():
+        match = DAY_DIRECTORY.match(directory.name)
+        if not match or not directory.is_dir():
+            continue
+        modules = [path for path in directory.glob("*.py") if not path.name.startswith("_")]
+        if len(modules) == 1:
+            days[int(match.group(1))] = f"{directory.name}.{modules[0].stem}"
+    return dict(sorted(days.items()))
+
+
+def load_day(day):
+    """ Import and return the solver module of a day. """
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return importlib.import_module(find_days()[day])
+
+
+def input_path(day):
+    """ Return the path of the checked-in input of a day. """
+    return ROOT / f"Day{day}" / "input.txt"
+
+
+def parse_day_spec(specs, available):
+    """
+    Expand day specifications such as ["1", "5-8", "23"] into a sorted list of day numbers.
+    An empty specification selects every available day.
+    """
+    if not specs:
+        return sorted(available)
+
+    days = set()
+    for spec in specs:
+        for item in spec.split(","):
+            if "-" in item:
+                first, last = item.split("-", 1)
+                days.update(range(int(first), int(last) + 1))
+            elif item:
+                days.add(int(item))
+
+    unknown = days - set(available)
+    if unknown:
+        raise ValueError(f"unknown day(s): {', '.join(map(str, sorted(unknown)))}")
+    return sorted(days)
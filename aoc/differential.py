@@ -0,0 +1,244 @@
+"""
+Differential testing of fast engines against reference implementations.
+
+A pair registers a reference function next to an engine that should compute the same answer,
+a generator of random cases and optionally a shrinker. Both functions are run on every case
+(a tuple of arguments) with growing sizes; on the first mismatch the case is shrunk greedily to
+a minimal one that still fails. A case on which the reference raises an exception is not a
+valid case: it is skipped while testing and never kept while shrinking.
+"""
+import random
+from collections import namedtuple
+
+from aoc.days import load_day
+from aoc.generators import skyline_moves
+
+Pair = namedtuple("Pair", "reference engine generate shrink")
+PAIRS = {}
+
+
+def register(name, reference, engine, generate, shrink=None):
+    """
+    Register an engine to check against a reference. ``generate(rng, size)`` returns a tuple of
+    arguments for both functions, ``shrink(case)`` yields smaller variants of a case (by default
+    shrink_value, which works on nested tuples and lists of numbers and strings).
+    """
+    PAIRS[name] = Pair(reference, engine, generate, shrink or shrink_value)
+
+
+def shrink_value(value):
+    """ Yield smaller variants of a value: numbers closer to zero, shorter sequences, smaller items. """
+    if isinstance(value, bool):
+        return
+    if isinstance(value, int):
+        for smaller in (0, value // 2, value - 1 if value > 0 else value + 1):
+            if abs(smaller) < abs(value):
+                yield smaller
+    elif isinstance(value, (tuple, list, str)):
+        # Drop chunks of decreasing length, then shrink the items one by one
+        chunk = len(value) // 2
+        while chunk:
+            for start in range(0, len(value) - chunk + 1, chunk):
+                yield value[:start] + value[start + chunk:]
+            chunk //= 2
+        if isinstance(value, str):
+            return
+        for i, item in enumerate(value):
+            for smaller in shrink_value(item):
+                yield value[:i] + type(value)([smaller]) + value[i + 1:]
+
+
+def compare(pair, case):
+    """
+    Run both functions on a case. Returns None if the case is invalid (the reference raises),
+    otherwise (reference_answer, engine_answer), where an engine exception is the answer.
+    """
+    try:
+        expected = pair.reference(*case)
+    except Exception:
+        return None
+    try:
+        answer = pair.engine(*case)
+    except Exception as error:
+        answer = error
+    return expected, answer
+
+
+def fails(pair, case):
+    outcome = compare(pair, case)
+    return outcome is not None and (isinstance(outcome[1], Exception) or outcome[0] != outcome[1])
+
+
+def shrink_case(pair, case, max_steps=10000):
+    """ Greedily replace a failing case by the first smaller variant that still fails. """
+    for _ in range(max_steps):
+        for smaller in pair.shrink(case):
+            if fails(pair, smaller):
+                case = smaller
+                break
+        else:
+            break
+    return case
+
+
+def check_pair(name, cases=200, seed=None, max_size=100):
+    """
+    Check one registered pair on random cases, from size 1 up to ``max_size``. Returns a
+    dictionary with the number of cases that were compared and, on a mismatch, the original
+    and the shrunk failing case with both answers.
+    """
+    pair = PAIRS[name]
+    rng = random.Random(seed)
+    result = {"name": name, "checked": 0, "invalid": 0}
+    for i in range(cases):
+        size = 1 + i * max_size // cases
+        case = pair.generate(rng, size)
+        outcome = compare(pair, case)
+        if outcome is None:
+            result["invalid"] += 1
+            continue
+        result["checked"] += 1
+        if fails(pair, case):
+            shrunk = shrink_case(pair, case)
+            expected, answer = compare(pair, shrunk)
+            result["failure"] = {"case": case, "shrunk": shrunk, "reference": expected, "engine": answer}
+            break
+    return result
+
+
+# --- Built-in pairs --------------------------------------------------------------------------
+
+def generate_race(rng, size):
+    """ A race and a record that is often a tie with one of the hold times. """
+    time = rng.randint(0, size * 10)
+    hold = rng.randint(0, time // 2)
+    record = hold * (time - hold)
+    if rng.random() < 0.5:
+        record += rng.randint(-hold, hold + 1)
+    return time, max(0, record)
+
+
+def _lagoon_by_flood_fill(widths, depths):
+    return load_day(18).calculate_lava_volume(skyline_moves(widths, depths))
+
+
+def _lagoon_by_shoelace(widths, depths):
+    return load_day(18).calculate_lava_volume_hex(skyline_moves(widths, depths))
+
+
+def generate_skyline(rng, size):
+    """ Columns of a skyline lagoon (see aoc.generators.skyline_polygon). """
+    columns = rng.randint(1, size)
+    widths, depths = [rng.randint(2, 10)], [rng.randint(2, 12)]
+    while len(depths) < columns:
+        depth = rng.randint(2, 12)
+        if depth != depths[-1]:
+            widths.append(rng.randint(1, 10))
+            depths.append(depth)
+    return widths, depths
+
+
+def generate_rock_throw(rng, size):
+    """
+    Three hailstones on the path of a rock, at puzzle-like magnitudes. With small numbers the
+    symbolic equations, which only use two components of each cross product, also have integer
+    solutions that miss some hailstones.
+    """
+    rock = [rng.randint(10 ** 14, 4 * 10 ** 14) for _ in range(3)]
+    rock_velocity = [rng.randint(-size - 50, size + 50) for _ in range(3)]
+    hailstones = []
+    while len(hailstones) < 3:
+        time = rng.randint(10 ** 10, 10 ** 12)
+        velocity = tuple(rng.randint(-size - 300, size + 300) for _ in range(3))
+        if any(v == rv for v, rv in zip(velocity, rock_velocity)):
+            continue
+        position = tuple(r + time * (rv - v) for r, rv, v in zip(rock, rock_velocity, velocity))
+        hailstones.append((position, velocity))
+    return (tuple(hailstones),)
+
+
+def _almanac(seeds, maps):
+    """ The mappings of Day 5 from a tuple of maps of (destination, source, length) rules. """
+    return {index: sorted(rules, key=lambda rule: rule[1]) for index, rules in enumerate(maps)}
+
+
+def _lowest_location_by_seed(seeds, maps):
+    every_seed = [seed for start, length in zip(seeds[0::2], seeds[1::2]) for seed in range(start, start + length)]
+    return load_day(5).find_lowest_location(every_seed, _almanac(seeds, maps))
+
+
+def _lowest_location_by_ranges(seeds, maps):
+    return load_day(5).find_lowest_location_ranges(list(seeds), _almanac(seeds, maps))
+
+
+def generate_almanac(rng, size):
+    """ A few seed ranges and maps of small, sometimes overlapping, rules. """
+    universe = size * 10
+    seeds = []
+    for _ in range(rng.randint(1, 4)):
+        seeds += [rng.randrange(universe), rng.randint(1, size)]
+    maps = tuple(
+        tuple((rng.randrange(universe), rng.randrange(universe), rng.randint(1, size)) for _ in range(rng.randint(0, 5)))
+        for _ in range(rng.randint(1, 4))
+    )
+    return tuple(seeds), maps
+
+
+def _combinations_by_paths(workflows):
+    aplenty = load_day(19)
+    return aplenty.count_combinations_in_intervals(aplenty.generate_intervals('in', dict(workflows)))
+
+
+def _combinations_by_boxes(workflows):
+    return load_day(19).count_accepted_combinations(dict(workflows))
+
+
+def generate_workflows(rng, size):
+    """ Workflows that only send parts to later workflows, so every path ends in A or R. """
+    names = ['in'] + [f"w{index}" for index in range(rng.randint(0, min(size, 20)))]
+    workflows = []
+    for index, name in enumerate(names):
+        targets = names[index + 1:] + ['A', 'R']
+        rules = tuple(
+            (f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}", rng.choice(targets))
+            for _ in range(rng.randint(0, 4))
+        )
+        workflows.append((name, rules + ((None, rng.choice(targets)),)))
+    return (tuple(workflows),)
+
+
+def _cube_games(games):
+    """ The Games of Day 2 from (id, red, green, blue) maxima. """
+    records = "\n".join(f"Game {game_id}: {red} red, {green} green; {blue} blue" for game_id, red, green, blue in games)
+    return load_day(2).parse(records)
+
+
+def _possible_ids_by_game(games, limits):
+    games = _cube_games(games)
+    return [games.possible_ids_sum(*limit) for limit in limits]
+
+
+def _possible_ids_by_sweep(games, limits):
+    return _cube_games(games).possible_ids_sums(limits)
+
+
+def generate_cube_limits(rng, size):
+    """ Games with small maxima, so that limits often tie with them, and a batch of limits. """
+    games = tuple((game_id, *(rng.randint(0, 20) for _ in range(3))) for game_id in range(1, size + 2))
+    limits = tuple(tuple(rng.randint(0, 21) for _ in range(3)) for _ in range(rng.randint(1, size + 1)))
+    return games, limits
+
+
+def _register_builtin_pairs():
+    races = load_day(6)
+    register("day2-limits", _possible_ids_by_game, _possible_ids_by_sweep, generate_cube_limits)
+    register("day6-ways-to-win", races.calculate_ways_to_win, races.calculate_ways_to_win_formula, generate_race)
+    register("day18-lagoon", _lagoon_by_flood_fill, _lagoon_by_shoelace, generate_skyline)
+    register("day5-seed-ranges", _lowest_location_by_seed, _lowest_location_by_ranges, generate_almanac)
+    register("day19-combinations", _combinations_by_paths, _combinations_by_boxes, generate_workflows)
+    hail = load_day(24)
+    if hail.solve is not None:  # the symbolic reference needs sympy
+        register("day24-rock", hail.find_rock_trajectory, hail.find_rock_trajectory_exact, generate_rock_throw)
+
+
+_register_builtin_pairs()
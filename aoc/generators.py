@@ -0,0 +1,1227 @@
+"""
+Synthetic puzzle inputs with known answers.
+
+Every generator takes a scale (1 gives an input about the size of the real one, 10 one about
+ten times larger, fractions give smaller inputs) and a random.Random instance, and returns the
+input text together with a dictionary of answers per part. The answers are either planted by
+construction (e.g. the Day 18 lagoon area or the Day 25 cut) or computed with a small oracle
+that is written independently from the solver of the day, so they can be used to check the
+solvers and any faster engine.
+
+An answer is None when it is too expensive to compute independently (the Day 23 longest path
+on large maps).
+
+Like the real inputs, the generated ones stay away from the corner cases the puzzles never
+exercise: Day 3 gears touch at most two numbers, Day 15 labels are never a prefix of each other
+and Day 24 hailstones always move along every axis.
+"""
+import itertools
+import math
+import random
+import string
+from collections import deque
+from functools import reduce
+
+
+def _unique_names(rng, count, length=3, alphabet=string.ascii_lowercase, exclude=(), last_letters=None):
+    """ Random distinct names; ``last_letters`` restricts the final character of every name. """
+    names = set()
+    excluded = set(exclude)
+    while len(names) < count:
+        name = "".join(rng.choice(alphabet) for _ in range(length - 1))
+        name += rng.choice(last_letters or alphabet)
+        if name not in excluded:
+            names.add(name)
+    return rng.sample(sorted(names), count)
+
+
+def _scaled(value, scale, minimum=1):
+    return max(minimum, round(value * scale))
+
+
+def _grid_side(side, scale, minimum=5):
+    return max(minimum, round(side * math.sqrt(scale)))
+
+
+def _lcm(numbers):
+    return reduce(lambda a, b: a * b // math.gcd(a, b), numbers, 1)
+
+
+def _primes_between(low, high):
+    sieve = bytearray([1]) * (high + 1)
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, int(high ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(sieve[i * i::i]))
+    return [p for p in range(max(low, 2), high + 1) if sieve[p]]
+
+
+# --- Day 1 -----------------------------------------------------------------------------------
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+# Letters that do not appear in any digit word, so the noise can never spell a digit
+NOISE_LETTERS = "abcdjklmpqyz"
+# Overlapping words with the digits they spell, e.g. "eightwo" reads as 8 and then 2
+OVERLAPPING_WORDS = {
+    "oneight": (1, 8), "twone": (2, 1), "threeight": (3, 8), "fiveight": (5, 8),
+    "sevenine": (7, 9), "eightwo": (8, 2), "eighthree": (8, 3), "nineight": (9, 8),
+}
+
+
+def generate_day1(scale, rng):
+    lines = []
+    sum_digits = sum_words = 0
+    for _ in range(_scaled(1000, scale)):
+        pieces, digits, values = [], [], []
+        tokens = rng.randint(1, 6)
+        digit_position = rng.randrange(tokens)  # every line has at least one digit
+        for position in range(tokens):
+            pieces.append("".join(rng.choice(NOISE_LETTERS) for _ in range(rng.randint(1, 4))))
+            kind = "digit" if position == digit_position else rng.choice(("digit", "word", "overlap"))
+            if kind == "digit":
+                value = rng.randint(1, 9)
+                pieces.append(str(value))
+                digits.append(value)
+                values.append(value)
+            elif kind == "word":
+                value = rng.randint(1, 9)
+                pieces.append(DIGIT_WORDS[value - 1])
+                values.append(value)
+            else:
+                word = rng.choice(sorted(OVERLAPPING_WORDS))
+                pieces.append(word)
+                values.extend(OVERLAPPING_WORDS[word])
+        if rng.random() < 0.5:
+            pieces.append("".join(rng.choice(NOISE_LETTERS) for _ in range(rng.randint(1, 4))))
+        lines.append("".join(pieces))
+        sum_digits += digits[0] * 10 + digits[-1]
+        sum_words += values[0] * 10 + values[-1]
+    return "\n".join(lines), {1: sum_digits, 2: sum_words}
+
+
+# --- Day 2 -----------------------------------------------------------------------------------
+
+def generate_day2(scale, rng):
+    lines = []
+    possible = power = 0
+    for game_id in range(1, _scaled(100, scale) + 1):
+        maxima = {color: rng.choice((0, *range(1, 21))) for color in ("red", "green", "blue")}
+        if not any(maxima.values()):
+            maxima["red"] = rng.randint(1, 20)
+        shown = [color for color, maximum in maxima.items() if maximum]
+
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(shown, rng.randint(1, len(shown)))
+            sets.append({color: rng.randint(1, maxima[color]) for color in colors})
+        # Make sure every maximum is revealed at least once
+        for color in shown:
+            rng.choice(sets)[color] = maxima[color]
+
+        revealed = "; ".join(", ".join(f"{count} {color}" for color, count in cubes.items()) for cubes in sets)
+        lines.append(f"Game {game_id}: {revealed}")
+        if maxima["red"] <= 12 and maxima["green"] <= 13 and maxima["blue"] <= 14:
+            possible += game_id
+        power += maxima["red"] * maxima["green"] * maxima["blue"]
+    return "\n".join(lines), {1: possible, 2: power}
+
+
+# --- Day 3 -----------------------------------------------------------------------------------
+
+SYMBOLS = "*#+$/@=%-&"
+
+
+def generate_day3(scale, rng):
+    side = _grid_side(140, scale)
+    grid = [["."] * side for _ in range(side)]
+    numbers = []
+
+    def area_is_free(row, first, last):
+        return all(grid[row][c] == "." for c in range(max(0, first), min(side, last + 1)))
+
+    for _ in range(side * side // 16):
+        row, length = rng.randrange(side), rng.randint(1, 3)
+        col = rng.randrange(side - length + 1)
+        # Keep a free cell on both sides so numbers never run into each other
+        if area_is_free(row, col - 1, col + length):
+            value = rng.randint(10 ** (length - 1) if length > 1 else 1, 10 ** length - 1)
+            grid[row][col:col + length] = str(value)
+            numbers.append((row, col, col + length - 1, value))
+
+    def adjacent_numbers(r, c):
+        return [n for n in numbers if n[0] - 1 <= r <= n[0] + 1 and n[1] - 1 <= c <= n[2] + 1]
+
+    symbols = {}
+    for _ in range(side * side // 40):
+        r, c = rng.randrange(side), rng.randrange(side)
+        symbol = rng.choice(SYMBOLS)
+        if grid[r][c] != "." or (symbol == "*" and len(adjacent_numbers(r, c)) > 2):
+            continue
+        grid[r][c] = symbol
+        symbols[(r, c)] = symbol
+
+    part_sum = sum(value for row, first, last, value in numbers
+                   if any((r, c) in symbols for r in range(row - 1, row + 2) for c in range(first - 1, last + 2)))
+    gear_sum = 0
+    for (r, c), symbol in symbols.items():
+        touching = adjacent_numbers(r, c)
+        if symbol == "*" and len(touching) == 2:
+            gear_sum += touching[0][3] * touching[1][3]
+    return "\n".join("".join(row) for row in grid), {1: part_sum, 2: gear_sum}
+
+
+# --- Day 4 -----------------------------------------------------------------------------------
+
+def generate_day4(scale, rng):
+    count = _scaled(200, scale)
+    lines, matches = [], []
+    for card in range(1, count + 1):
+        # Cards never make you win copies of cards past the end of the table
+        match_count = rng.randint(0, min(10, count - card))
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        own = rng.sample(winning, match_count) + rng.sample(others, 25 - match_count)
+        rng.shuffle(own)
+        lines.append(f"Card {card:>3}: {' '.join(f'{n:>2}' for n in winning)} | {' '.join(f'{n:>2}' for n in own)}")
+        matches.append(match_count)
+
+    points = sum(2 ** (m - 1) for m in matches if m)
+    copies = [1] * count
+    for i, m in enumerate(matches):
+        for j in range(i + 1, i + 1 + m):
+            copies[j] += copies[i]
+    return "\n".join(lines), {1: points, 2: sum(copies)}
+
+
+# --- Day 5 -----------------------------------------------------------------------------------
+
+ALMANAC_CATEGORIES = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+
+
+def generate_day5(scale, rng):
+    """ Small numbers, so the answers can be found by mapping every single seed. """
+    universe = _scaled(10000, scale, minimum=100)
+    seed_ranges = []
+    for _ in range(_scaled(10, scale)):
+        length = rng.randint(1, 100)
+        seed_ranges.append((rng.randrange(universe - length), length))
+
+    maps = []
+    for _ in range(len(ALMANAC_CATEGORIES) - 1):
+        cuts = sorted(rng.sample(range(1, universe), min(universe - 1, _scaled(20, scale, minimum=2))))
+        rules = []
+        for start, end in zip([0] + cuts, cuts + [universe]):
+            if rng.random() < 0.8:
+                rules.append((rng.randrange(universe), start, end - start))
+        rng.shuffle(rules)
+        maps.append(rules)
+
+    def location(seed):
+        for rules in maps:
+            for destination, source, length in rules:
+                if source <= seed < source + length:
+                    seed = destination + seed - source
+                    break
+        return seed
+
+    lines = ["seeds: " + " ".join(f"{start} {length}" for start, length in seed_ranges)]
+    for source, destination, rules in zip(ALMANAC_CATEGORIES, ALMANAC_CATEGORIES[1:], maps):
+        lines += ["", f"{source}-to-{destination} map:"] + [" ".join(map(str, rule)) for rule in rules]
+
+    seeds = [number for pair in seed_ranges for number in pair]
+    lowest_single = min(location(seed) for seed in seeds)
+    lowest_range = min(location(seed) for start, length in seed_ranges for seed in range(start, start + length))
+    return "\n".join(lines), {1: lowest_single, 2: lowest_range}
+
+
+# --- Day 6 -----------------------------------------------------------------------------------
+
+def generate_day6(scale, rng):
+    """
+    The record of each race is planted between the distances of two consecutive hold times, so
+    only the longer hold and the ones after it win. Half of the records are ties with the shorter one.
+    The second part reads the sheet as one long race, solved by bisection on the hold time.
+    """
+    times, records, ways = [], [], []
+    for _ in range(4):
+        time = max(5, round(rng.randint(40, 100) * scale))
+        hold = rng.randint(1, (time - 2) // 2)
+        tie, next_distance = hold * (time - hold), (hold + 1) * (time - hold - 1)
+        times.append(time)
+        records.append(tie if rng.random() < 0.5 else rng.randrange(tie, next_distance))
+        ways.append(time - 2 * hold - 1)
+    text = "Time:     " + " ".join(f"{t:>6}" for t in times) + "\nDistance: " + " ".join(f"{r:>6}" for r in records)
+    return text, {1: math.prod(ways), 2: _race_ways(int("".join(map(str, times))), int("".join(map(str, records))))}
+
+
+def _race_ways(time, record):
+    """ Hold times that beat the record: the distance grows with the hold time up to time // 2. """
+    low, high = 0, time // 2 + 1
+    while low < high:
+        hold = (low + high) // 2
+        if hold * (time - hold) > record:
+            high = hold
+        else:
+            low = hold + 1
+    return 0 if low > time // 2 else time - 2 * low + 1
+
+
+# --- Day 7 -----------------------------------------------------------------------------------
+
+CARDS = "23456789TJQKA"
+
+
+def _hand_type(hand):
+    return sorted((hand.count(card) for card in set(hand)), reverse=True)
+
+
+def _hand_type_with_jokers(hand):
+    return max(_hand_type(hand.replace("J", card)) for card in CARDS if card != "J")
+
+
+def generate_day7(scale, rng):
+    hands = {}
+    while len(hands) < _scaled(1000, scale):
+        weights = [rng.random() ** 3 for _ in CARDS]  # uneven weights give more pairs and sets
+        hand = "".join(rng.choices(CARDS, weights, k=5))
+        hands.setdefault(hand, rng.randint(1, 1000))
+
+    def winnings(key):
+        ranked = sorted(hands, key=key)
+        return sum(rank * hands[hand] for rank, hand in enumerate(ranked, start=1))
+
+    plain_order = {card: i for i, card in enumerate(CARDS)}
+    joker_order = {card: i for i, card in enumerate("J23456789TQKA")}
+    plain = winnings(lambda h: (_hand_type(h), [plain_order[c] for c in h]))
+    jokers = winnings(lambda h: (_hand_type_with_jokers(h), [joker_order[c] for c in h]))
+    return "\n".join(f"{hand} {bid}" for hand, bid in hands.items()), {1: plain, 2: jokers}
+
+
+# --- Day 8 -----------------------------------------------------------------------------------
+
+def generate_day8(scale, rng):
+    """
+    Every ghost walks a ring that takes a chosen prime number of rounds of the instructions, as
+    in the real input. Some positions of a ring have two nodes that both lead to the next
+    position, so the instructions change the nodes that are visited but not how far along the
+    ring the ghost is.
+    """
+    instructions = "".join(rng.choice("LR") for _ in range(max(2, round(rng.randint(3, 8) * math.sqrt(scale)))))
+    rounds_limit = max(60, round(80 * math.sqrt(scale)))
+    rounds = rng.sample(_primes_between(rounds_limit // 2, rounds_limit), 6)
+    periods = [len(instructions) * r for r in rounds]
+
+    prefixes = ["AA"] + _unique_names(rng, 5, length=2, alphabet=string.ascii_uppercase, exclude={"AA", "ZZ"})
+    starts = [prefix + "A" for prefix in prefixes]
+    ends = ["ZZZ"] + [prefix + "Z" for prefix in prefixes[1:]]
+    # The middle nodes never end with A or Z, so they cannot be taken for a start or an end
+    middle_count = 2 * sum(periods)
+    middles = iter(_unique_names(rng, middle_count, length=3 if middle_count < 4000 else 4,
+                                 alphabet=string.ascii_uppercase, last_letters="BCDEFGHIJKLMNOPQRSTUVWXY"))
+
+    nodes = {}
+    for start, end, period in zip(starts, ends, periods):
+        ring = []
+        for _ in range(period - 1):
+            node = next(middles)
+            ring.append((node, next(middles)) if rng.random() < 0.25 else (node, node))
+        ring.append((end, end))
+        nodes[start] = ring[0]
+        for position, pair in enumerate(ring[:-1]):
+            for node in set(pair):
+                nodes[node] = ring[position + 1]
+        nodes[end] = ring[0]
+
+    lines = [instructions, ""] + [f"{node} = ({left}, {right})" for node, (left, right) in
+                                  rng.sample(sorted(nodes.items()), len(nodes))]
+    return "\n".join(lines), {1: periods[0], 2: _lcm(periods)}
+
+
+# --- Day 9 -----------------------------------------------------------------------------------
+
+def generate_day9(scale, rng):
+    lines = []
+    next_sum = previous_sum = 0
+    for _ in range(_scaled(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+
+        def value(x):
+            return sum(c * x ** power for power, c in enumerate(coefficients))
+
+        lines.append(" ".join(str(value(x)) for x in range(21)))
+        next_sum += value(21)
+        previous_sum += value(-1)
+    return "\n".join(lines), {1: next_sum, 2: previous_sum}
+
+
+# --- Day 10 and Day 18 -----------------------------------------------------------------------
+
+def skyline_polygon(rng, columns, max_width, max_depth):
+    """
+    A rectilinear polygon with a flat top edge and a bottom made of columns of different depths,
+    given as a list of (direction, distance) moves that starts east along the top edge from the
+    top left corner. Returns the moves, the column widths and the column depths.
+    """
+    widths = [rng.randint(1, max_width) for _ in range(columns)]
+    wide = rng.randrange(columns)
+    widths[wide] = max(2, widths[wide])
+    # Every column is at least two deep, a column of depth one would cut the inside in two
+    depths = [rng.randint(2, max_depth)]
+    while len(depths) < columns:
+        depth = rng.randint(2, max_depth)
+        if depth != depths[-1]:
+            depths.append(depth)
+    return skyline_moves(widths, depths), widths, depths
+
+
+def skyline_moves(widths, depths):
+    """ The moves that draw the skyline polygon of the given columns, see skyline_polygon. """
+    if not widths or len(widths) != len(depths) or min(widths) < 1 or min(depths) < 2 or sum(widths) < 2 \
+            or any(a == b for a, b in zip(depths, depths[1:])):
+        raise ValueError("not a valid skyline")
+    moves = [("R", sum(widths)), ("D", depths[-1])]
+    for j in range(len(widths) - 1, 0, -1):
+        moves.append(("L", widths[j]))
+        step = depths[j - 1] - depths[j]
+        moves.append(("D" if step > 0 else "U", abs(step)))
+    moves += [("L", widths[0]), ("U", depths[0])]
+    return moves
+
+
+def skyline_cells(widths, depths):
+    """ Number of lattice points inside or on the border of a skyline polygon, column by column. """
+    cells = depths[0] + 1 + depths[-1] + 1  # left and right sides
+    for j, (width, depth) in enumerate(zip(widths, depths)):
+        cells += (width - 1) * (depth + 1)  # inside the column
+        if j:
+            cells += max(depths[j - 1], depth) + 1  # boundary with the previous column
+    return cells
+
+
+MOVES = {"R": (1, 0), "L": (-1, 0), "U": (0, -1), "D": (0, 1)}
+PIPES = {"|": {"N", "S"}, "-": {"E", "W"}, "L": {"N", "E"}, "J": {"N", "W"}, "7": {"S", "W"}, "F": {"S", "E"}}
+HEADINGS = {(1, 0): "E", (-1, 0): "W", (0, -1): "N", (0, 1): "S"}
+
+
+def _pipe(connections):
+    return next(pipe for pipe, sides in PIPES.items() if sides == connections)
+
+
+def generate_day10(scale, rng):
+    side = _grid_side(140, scale, minimum=8)
+    margin = rng.randint(1, max(1, side // 10))
+    inner = side - 2 * margin
+    columns = rng.randint(max(1, inner // 4), max(1, inner // 2))
+    moves, widths, depths = skyline_polygon(rng, columns, max(1, (inner - 1) // columns), inner - 1)
+
+    # Walk the loop and draw every tile with the two sides it connects
+    loop = []
+    x, y = 0, 0
+    for direction, distance in moves:
+        dx, dy = MOVES[direction]
+        for _ in range(distance):
+            loop.append((x, y))
+            x, y = x + dx, y + dy
+    tiles = {}
+    for i, (x, y) in enumerate(loop):
+        before, after = loop[i - 1], loop[(i + 1) % len(loop)]
+        sides = {HEADINGS[(before[0] - x, before[1] - y)], HEADINGS[(after[0] - x, after[1] - y)]}
+        tiles[(x + margin, y + margin)] = _pipe(sides)
+
+    grid = [[rng.choice("|-LJ7F...") for _ in range(side)] for _ in range(side)]
+    for (x, y), tile in tiles.items():
+        grid[y][x] = tile
+    start = rng.choice(sorted(tiles))
+    grid[start[1]][start[0]] = "S"
+    # Junk pipes around the start could make a different start tile fit
+    for dx, dy in MOVES.values():
+        neighbor = (start[0] + dx, start[1] + dy)
+        if neighbor not in tiles and 0 <= neighbor[0] < side and 0 <= neighbor[1] < side:
+            grid[neighbor[1]][neighbor[0]] = "."
+
+    grid = _random_orientation(rng, grid)
+    area = abs(sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(loop, loop[1:] + loop[:1]))) // 2
+    enclosed = area - len(loop) // 2 + 1  # Pick's theorem
+    return "\n".join("".join(row) for row in grid), {1: len(loop) // 2, 2: enclosed}
+
+
+def _random_orientation(rng, grid):
+    """ Mirror and transpose a pipe grid at random, redrawing the pipes to match. """
+    mirror_x, mirror_y, transpose = rng.random() < 0.5, rng.random() < 0.5, rng.random() < 0.5
+    swap = {}
+    if mirror_x:
+        swap.update({"E": "W", "W": "E"})
+    if mirror_y:
+        swap.update({"N": "S", "S": "N"})
+
+    def redraw(tile, mapping):
+        if tile not in PIPES:
+            return tile
+        return _pipe({mapping.get(side, side) for side in PIPES[tile]})
+
+    grid = [[redraw(tile, swap) for tile in (row[::-1] if mirror_x else row)] for row in (grid[::-1] if mirror_y else grid)]
+    if transpose:
+        transposed = {"N": "W", "W": "N", "S": "E", "E": "S"}
+        grid = [[redraw(tile, transposed) for tile in column] for column in zip(*grid)]
+    return grid
+
+
+# --- Day 11 ----------------------------------------------------------------------------------
+
+def _pairwise_distance_sum(values):
+    """ Sum of |a - b| over all pairs, using prefix sums over the sorted values. """
+    total = prefix = 0
+    for i, value in enumerate(sorted(values)):
+        total += i * value - prefix
+        prefix += value
+    return total
+
+
+def generate_day11(scale, rng):
+    side = _grid_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 10))
+    empty_cols = set(rng.sample(range(side), side // 10))
+    rows = [r for r in range(side) if r not in empty_rows]
+    cols = [c for c in range(side) if c not in empty_cols]
+
+    galaxies = set()
+    # Every row and column that is not meant to be empty gets a galaxy
+    for r in rows:
+        galaxies.add((r, rng.choice(cols)))
+    for c in cols:
+        galaxies.add((rng.choice(rows), c))
+    for _ in range(side * side // 80):
+        galaxies.add((rng.choice(rows), rng.choice(cols)))
+
+    grid = [["."] * side for _ in range(side)]
+    for r, c in galaxies:
+        grid[r][c] = "#"
+
+    def distance_sum(factor):
+        expanded_rows = [r + (factor - 1) * sum(1 for e in empty_rows if e < r) for r, _ in galaxies]
+        expanded_cols = [c + (factor - 1) * sum(1 for e in empty_cols if e < c) for _, c in galaxies]
+        return _pairwise_distance_sum(expanded_rows) + _pairwise_distance_sum(expanded_cols)
+
+    return "\n".join("".join(row) for row in grid), {1: distance_sum(2), 2: distance_sum(1000000)}
+
+
+# --- Day 12 ----------------------------------------------------------------------------------
+
+def count_spring_arrangements(springs, groups):
+    """
+    Count the arrangements by running the springs through the automaton of the pattern
+    ``.*#{g1}.+#{g2}.+ ... #{gn}.*``, tracking how many arrangements end in every state.
+    """
+    pattern = "." + ".".join("#" * group for group in groups) + "."
+    states = {0: 1}
+    for spring in springs:
+        following = {}
+        for state, count in states.items():
+            options = ".#" if spring == "?" else spring
+            for option in options:
+                if state + 1 < len(pattern) and pattern[state + 1] == option:
+                    following[state + 1] = following.get(state + 1, 0) + count
+                if pattern[state] == "." and option == ".":
+                    following[state] = following.get(state, 0) + count
+        states = following
+    return states.get(len(pattern) - 1, 0) + states.get(len(pattern) - 2, 0)
+
+
+def generate_day12(scale, rng):
+    lines = []
+    folded = unfolded = 0
+    for _ in range(_scaled(1000, scale)):
+        truth = "".join(rng.choice("..#") for _ in range(rng.randint(4, 20)))
+        groups = [len(run) for run in truth.split(".") if run]
+        if not groups:
+            continue
+        springs = "".join("?" if rng.random() < 0.5 else cell for cell in truth)
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+        folded += count_spring_arrangements(springs, groups)
+        unfolded += count_spring_arrangements("?".join([springs] * 5), groups * 5)
+    return "\n".join(lines), {1: folded, 2: unfolded}
+
+
+# --- Day 13 ----------------------------------------------------------------------------------
+
+def _reflection_mismatches(pattern):
+    """ Map every reflection line of a pattern to the number of cells that do not match across it. """
+    lines = {}
+    height, width = len(pattern), len(pattern[0])
+    for col in range(1, width):
+        lines[("vertical", col)] = sum(row[col - 1 - i] != row[col + i] for row in pattern for i in range(min(col, width - col)))
+    for row in range(1, height):
+        lines[("horizontal", row)] = sum(pattern[row - 1 - i][c] != pattern[row + i][c]
+                                         for i in range(min(row, height - row)) for c in range(width))
+    return lines
+
+
+def _summary(line):
+    kind, index = line
+    return index if kind == "vertical" else 100 * index
+
+
+def _mirrored_pattern(rng):
+    """
+    A pattern that is symmetric across a vertical line, except for a smudge that breaks the
+    symmetry across a horizontal line it also has.
+    """
+    height, width = rng.randint(5, 17), rng.randint(5, 17)
+    col = rng.randint(1, width - 1)
+    row = rng.randint(1, height - 1)
+    if min(col, width - col) == width / 2:
+        return None  # every column has a mirror image, the smudge has nowhere to go
+
+    # Cells that must be equal to keep both symmetries form groups that share a random value
+    parent = {}
+
+    def find(cell):
+        while parent.setdefault(cell, cell) != cell:
+            cell = parent[cell]
+        return cell
+
+    for r in range(height):
+        for c in range(width):
+            if 0 <= 2 * col - 1 - c < width:
+                parent[find((r, c))] = find((r, 2 * col - 1 - c))
+            if 0 <= 2 * row - 1 - r < height:
+                parent[find((r, c))] = find((2 * row - 1 - r, c))
+    values = {}
+    pattern = [[values.setdefault(find((r, c)), rng.choice("#.")) for c in range(width)] for r in range(height)]
+
+    # The smudge is a column without a mirror image across the vertical line, in a row that has one
+    smudge_cols = [c for c in range(width) if not 0 <= 2 * col - 1 - c < width]
+    smudge_rows = [r for r in range(height) if 0 <= 2 * row - 1 - r < height]
+    r, c = rng.choice(smudge_rows), rng.choice(smudge_cols)
+    pattern[r][c] = "#" if pattern[r][c] == "." else "."
+    pattern = ["".join(line) for line in pattern]
+    if rng.random() < 0.5:
+        pattern = ["".join(line) for line in zip(*pattern)]
+    return pattern
+
+
+def generate_day13(scale, rng):
+    patterns = []
+    clean = smudged = 0
+    while len(patterns) < _scaled(100, scale):
+        pattern = _mirrored_pattern(rng)
+        if pattern is None:
+            continue
+        mismatches = _reflection_mismatches(pattern)
+        exact = [line for line, count in mismatches.items() if count == 0]
+        almost = [line for line, count in mismatches.items() if count == 1]
+        # Random cells can add more reflections by accident, keep the unambiguous patterns only
+        if len(exact) == 1 and len(almost) == 1:
+            patterns.append("\n".join(pattern))
+            clean += _summary(exact[0])
+            smudged += _summary(almost[0])
+    return "\n\n".join(patterns), {1: clean, 2: smudged}
+
+
+# --- Day 14 ----------------------------------------------------------------------------------
+
+def _tilt_west(rows):
+    return ["#".join("".join(sorted(part, reverse=True)) for part in row.split("#")) for row in rows]
+
+
+def _rotate_clockwise(rows):
+    return ["".join(column) for column in zip(*rows[::-1])]
+
+
+def _north_load(rows):
+    return sum(row.count("O") * (len(rows) - i) for i, row in enumerate(rows))
+
+
+def generate_day14(scale, rng):
+    side = _grid_side(100, scale)
+    rows = ["".join(rng.choices("O#.", (20, 15, 65), k=side)) for _ in range(side)]
+
+    # North is west after a counterclockwise turn, which is three clockwise turns
+    def tilt_north(rows):
+        turned = _rotate_clockwise(_rotate_clockwise(_rotate_clockwise(rows)))
+        return _rotate_clockwise(_tilt_west(turned))
+
+    def cycle(rows):
+        turned = _rotate_clockwise(_rotate_clockwise(_rotate_clockwise(rows)))  # north is west
+        for _ in range(4):
+            turned = _rotate_clockwise(_tilt_west(turned))  # west, then south, east and north
+        return _rotate_clockwise(turned)
+
+    seen, history = {}, []
+    state = tuple(rows)
+    while state not in seen:
+        seen[state] = len(history)
+        history.append(state)
+        state = tuple(cycle(list(state)))
+    first = seen[state]
+    final = history[first + (1000000000 - first) % (len(history) - first)]
+    return "\n".join(rows), {1: _north_load(tilt_north(rows)), 2: _north_load(final)}
+
+
+# --- Day 15 ----------------------------------------------------------------------------------
+
+def _holiday_hash(text):
+    value = 0
+    for char in text:
+        value = (value + ord(char)) * 17 % 256
+    return value
+
+
+def generate_day15(scale, rng):
+    labels = set()
+    while len(labels) < _scaled(500, scale):
+        labels.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 6))))
+    # Real inputs never have a label that is the beginning of another one
+    labels = sorted(label for label in labels if not any(o != label and o.startswith(label) for o in labels))
+
+    steps = []
+    boxes = [dict() for _ in range(256)]
+    for _ in range(_scaled(4000, scale)):
+        label = rng.choice(labels)
+        box = boxes[_holiday_hash(label)]
+        if rng.random() < 0.4:
+            steps.append(f"{label}-")
+            box.pop(label, None)
+        else:
+            focal_length = rng.randint(1, 9)
+            steps.append(f"{label}={focal_length}")
+            box[label] = focal_length
+
+    power = sum((b + 1) * slot * focal for b, box in enumerate(boxes) for slot, focal in enumerate(box.values(), start=1))
+    return ",".join(steps), {1: sum(_holiday_hash(step) for step in steps), 2: power}
+
+
+# --- Day 16 ----------------------------------------------------------------------------------
+
+BEAM_TURNS = {
+    ("/", (1, 0)): [(0, -1)], ("/", (-1, 0)): [(0, 1)], ("/", (0, 1)): [(-1, 0)], ("/", (0, -1)): [(1, 0)],
+    ("\\", (1, 0)): [(0, 1)], ("\\", (-1, 0)): [(0, -1)], ("\\", (0, 1)): [(1, 0)], ("\\", (0, -1)): [(-1, 0)],
+    ("|", (1, 0)): [(0, -1), (0, 1)], ("|", (-1, 0)): [(0, -1), (0, 1)],
+    ("-", (0, 1)): [(-1, 0), (1, 0)], ("-", (0, -1)): [(-1, 0), (1, 0)],
+}
+
+
+def _energized(grid, start):
+    height, width = len(grid), len(grid[0])
+    seen = set()
+    pending = [start]
+    while pending:
+        x, y, dx, dy = pending.pop()
+        if not (0 <= x < width and 0 <= y < height) or (x, y, dx, dy) in seen:
+            continue
+        seen.add((x, y, dx, dy))
+        for ndx, ndy in BEAM_TURNS.get((grid[y][x], (dx, dy)), [(dx, dy)]):
+            pending.append((x + ndx, y + ndy, ndx, ndy))
+    return len({(x, y) for x, y, _, _ in seen})
+
+
+def generate_day16(scale, rng):
+    side = _grid_side(110, scale)
+    grid = ["".join(rng.choices(".\\/|-", (88, 3, 3, 3, 3), k=side)) for _ in range(side)]
+    starts = ([(x, 0, 0, 1) for x in range(side)] + [(x, side - 1, 0, -1) for x in range(side)] +
+              [(0, y, 1, 0) for y in range(side)] + [(side - 1, y, -1, 0) for y in range(side)])
+    best = max(_energized(grid, start) for start in starts)
+    return "\n".join(grid), {1: _energized(grid, (0, 0, 1, 0)), 2: best}
+
+
+# --- Day 17 ----------------------------------------------------------------------------------
+
+def _least_heat_loss(grid, least, most):
+    """ Dijkstra over (position, direction, steps taken in that direction) states. """
+    import heapq
+
+    height, width = len(grid), len(grid[0])
+    queue = [(0, 0, 0, 1, 0, 0), (0, 0, 0, 0, 1, 0)]
+    best = {}
+    while queue:
+        loss, y, x, dy, dx, run = heapq.heappop(queue)
+        if (y, x) == (height - 1, width - 1) and run >= least:
+            return loss
+        if best.get((y, x, dy, dx, run), math.inf) < loss:
+            continue
+        for ndy, ndx in ((dy, dx), (dx, dy), (-dx, -dy)):
+            straight = (ndy, ndx) == (dy, dx)
+            if (straight and run == most) or (not straight and 0 < run < least):
+                continue
+            ny, nx = y + ndy, x + ndx
+            if 0 <= ny < height and 0 <= nx < width:
+                state = (ny, nx, ndy, ndx, run + 1 if straight else 1)
+                new_loss = loss + grid[ny][nx]
+                if new_loss < best.get(state, math.inf):
+                    best[state] = new_loss
+                    heapq.heappush(queue, (new_loss, *state))
+    return None
+
+
+def generate_day17(scale, rng):
+    side = _grid_side(141, scale)
+    grid = [[rng.randint(1, 9) for _ in range(side)] for _ in range(side)]
+    answers = {1: _least_heat_loss(grid, 1, 3), 2: _least_heat_loss(grid, 4, 10)}
+    return "\n".join("".join(map(str, row)) for row in grid), answers
+
+
+# --- Day 18 ----------------------------------------------------------------------------------
+
+def generate_day18(scale, rng):
+    """ Both dig plans are skyline polygons with the same number of columns, so their areas are known. """
+    columns = _scaled(350, scale, minimum=2)
+    plan, widths, depths = skyline_polygon(rng, columns, 10, _scaled(250, math.sqrt(scale), minimum=3))
+    hex_plan, hex_widths, hex_depths = skyline_polygon(rng, columns, max(2, 0xfffff // (2 * columns)), 0x7ffff)
+
+    lines = []
+    for (direction, distance), (hex_direction, hex_distance) in zip(plan, hex_plan):
+        lines.append(f"{direction} {distance} (#{hex_distance:05x}{'RDLU'.index(hex_direction)})")
+    return "\n".join(lines), {1: skyline_cells(widths, depths), 2: skyline_cells(hex_widths, hex_depths)}
+
+
+# --- Day 19 ----------------------------------------------------------------------------------
+
+def _accepted_combinations(workflows, name, ranges):
+    if name == "R":
+        return 0
+    if name == "A":
+        return math.prod(high - low + 1 for low, high in ranges.values())
+    total = 0
+    for attribute, operator, value, destination in workflows[name]:
+        if attribute is None:
+            return total + _accepted_combinations(workflows, destination, ranges)
+        low, high = ranges[attribute]
+        matching = (low, min(high, value - 1)) if operator == "<" else (max(low, value + 1), high)
+        rest = (max(low, value), high) if operator == "<" else (low, min(high, value))
+        if matching[0] <= matching[1]:
+            total += _accepted_combinations(workflows, destination, {**ranges, attribute: matching})
+        if rest[0] > rest[1]:
+            return total
+        ranges = {**ranges, attribute: rest}
+    return total
+
+
+def _workflow_verdict(workflows, part):
+    name = "in"
+    while name not in "AR":
+        for attribute, operator, value, destination in workflows[name]:
+            if attribute is None or (part[attribute] < value if operator == "<" else part[attribute] > value):
+                name = destination
+                break
+    return name == "A"
+
+
+def generate_day19(scale, rng):
+    budget = _scaled(550, scale)
+    names = ["in"] + _unique_names(rng, budget, length=3, exclude={"in"})
+    workflows = {}
+    pending, created = deque(["in"]), 1
+    while pending:
+        name = pending.popleft()
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            rules.append([rng.choice("xmas"), rng.choice("<>"), rng.randint(2, 3999), None])
+        rules.append([None, None, None, None])
+        for rule in rules:
+            if created < len(names) and rng.random() < 0.6:
+                rule[3] = names[created]
+                pending.append(names[created])
+                created += 1
+            else:
+                rule[3] = rng.choice("AR")
+        workflows[name] = [tuple(rule) for rule in rules]
+
+    parts = [{attribute: rng.randint(1, 4000) for attribute in "xmas"} for _ in range(_scaled(200, scale))]
+    lines = []
+    for name, rules in rng.sample(sorted(workflows.items()), len(workflows)):
+        conditions = [f"{a}{o}{v}:{d}" if a else d for a, o, v, d in rules]
+        lines.append(f"{name}{{{','.join(conditions)}}}")
+    lines.append("")
+    lines += ["{" + ",".join(f"{a}={part[a]}" for a in "xmas") + "}" for part in parts]
+
+    accepted = sum(sum(part.values()) for part in parts if _workflow_verdict(workflows, part))
+    combinations = _accepted_combinations(workflows, "in", {a: (1, 4000) for a in "xmas"})
+    return "\n".join(lines), {1: accepted, 2: combinations}
+
+
+# --- Day 20 ----------------------------------------------------------------------------------
+
+def _pulse_product(config, presses=1000):
+    """ Count the low and high pulses of a module configuration with a plain simulation. """
+    kinds, targets, flip_flops, memories = {}, {}, {}, {}
+    for name, (kind, destinations) in config.items():
+        kinds[name], targets[name] = kind, destinations
+        flip_flops[name] = False
+    for name, (_, destinations) in config.items():
+        for destination in destinations:
+            memories.setdefault(destination, {})[name] = False
+
+    counts = [0, 0]
+    for _ in range(presses):
+        queue = deque([("button", "broadcaster", False)])
+        while queue:
+            source, name, high = queue.popleft()
+            counts[high] += 1
+            kind = kinds.get(name)
+            if kind == "%":
+                if high:
+                    continue
+                flip_flops[name] = output = not flip_flops[name]
+            elif kind == "&":
+                memories[name][source] = high
+                output = not all(memories[name].values())
+            elif kind == "":
+                output = high
+            else:
+                continue
+            queue.extend((name, destination, output) for destination in targets[name])
+    return counts[0] * counts[1]
+
+
+def generate_day20(scale, rng):
+    """
+    Binary counters like the real input: chains of flip-flops that a conjunction resets whenever
+    they count up to a chosen prime period. The conjunctions feed inverters that all go into the
+    conjunction in front of rx, so rx gets a low pulse after the product of the periods.
+    """
+    chains = max(2, min(6, round(4 * math.sqrt(scale))))
+    bits = max(10, min(16, 12 + round(math.log2(scale)) if scale > 0 else 10))
+    periods = rng.sample(_primes_between(2 ** (bits - 1), 2 ** bits - 1), chains)
+    names = iter(_unique_names(rng, chains * (bits + 2) + 1, length=2, exclude={"rx"}))
+
+    hub = next(names)
+    config = {"broadcaster": ("", []), hub: ("&", ["rx"])}
+    for period in periods:
+        flip_flops = [next(names) for _ in range(bits)]
+        counter, inverter = next(names), next(names)
+        config["broadcaster"][1].append(flip_flops[0])
+        config[counter] = ("&", [flip_flops[0], inverter])
+        config[inverter] = ("&", [hub])
+        for bit, flip_flop in enumerate(flip_flops):
+            destinations = [flip_flops[bit + 1]] if bit + 1 < bits else []
+            if period >> bit & 1:
+                destinations.append(counter)
+            elif bit:
+                config[counter][1].append(flip_flop)
+            config[flip_flop] = ("%", destinations)
+
+    lines = []
+    for name, (kind, destinations) in rng.sample(sorted(config.items()), len(config)):
+        rng.shuffle(destinations)
+        lines.append(f"{kind}{name} -> {', '.join(destinations)}")
+    return "\n".join(lines), {1: _pulse_product(config), 2: math.prod(periods)}
+
+
+# --- Day 21 ----------------------------------------------------------------------------------
+
+def _garden_counts(grid, start, steps):
+    """ Breadth-first search over the infinitely repeated garden, counting the plots per step budget. """
+    height, width = len(grid), len(grid[0])
+    limit = max(steps)
+    distances = {start: 0}
+    frontier = [start]
+    for distance in range(1, limit + 1):
+        following = []
+        for y, x in frontier:
+            for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if (ny, nx) not in distances and grid[ny % height][nx % width] != "#":
+                    distances[(ny, nx)] = distance
+                    following.append((ny, nx))
+        frontier = following
+    return [sum(1 for d in distances.values() if d <= s and d % 2 == s % 2) for s in steps]
+
+
+def generate_day21(scale, rng):
+    """
+    Gardens like the real one: the size divides 2 * 26501365 + 1, and the middle row and column,
+    the border and the diamond halfway to the border are free of rocks, so the number of plots
+    grows quadratically every time the steps cover one more copy of the garden.
+    """
+    side = 393 if scale >= 9 else 131
+    middle = side // 2
+    while True:
+        grid = [["."] * side for _ in range(side)]
+        for y in range(1, side - 1):
+            for x in range(1, side - 1):
+                if y != middle and x != middle and abs(abs(y - middle) + abs(x - middle) - middle) > 2 \
+                        and rng.random() < 0.12:
+                    grid[y][x] = "#"
+        grid[middle][middle] = "S"
+        # Fill the pockets that cannot be reached, they would skew the count
+        seen, pending = {(middle, middle)}, [(middle, middle)]
+        while pending:
+            y, x = pending.pop()
+            for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if 0 <= ny < side and 0 <= nx < side and (ny, nx) not in seen and grid[ny][nx] != "#":
+                    seen.add((ny, nx))
+                    pending.append((ny, nx))
+        for y in range(side):
+            for x in range(side):
+                if grid[y][x] == "." and (y, x) not in seen:
+                    grid[y][x] = "#"
+
+        counts = _garden_counts(grid, (middle, middle), [64] + [middle + k * side for k in range(4)])
+        reachable, samples = counts[0], counts[1:]
+        first = [b - a for a, b in zip(samples, samples[1:])]
+        second = [b - a for a, b in zip(first, first[1:])]
+        if second[0] == second[1]:
+            break
+
+    # Newton's forward differences, extended to 26501365 = middle + n * side steps
+    n = (26501365 - middle) // side
+    extrapolated = samples[0] + n * first[0] + n * (n - 1) // 2 * second[0]
+    return "\n".join("".join(row) for row in grid), {1: reachable, 2: extrapolated}
+
+
+# --- Day 22 ----------------------------------------------------------------------------------
+
+def generate_day22(scale, rng):
+    footprint = 10
+    count = _scaled(1200, scale)
+    occupied, bricks = set(), []
+    while len(bricks) < count:
+        axis, length = rng.randrange(3), rng.randint(1, 5)
+        start = [rng.randrange(footprint), rng.randrange(footprint), rng.randint(1, count // 3 + 5)]
+        end = list(start)
+        end[axis] += length - 1
+        if axis < 2 and end[axis] >= footprint:
+            continue
+        cells = {(x, y, z) for x in range(start[0], end[0] + 1) for y in range(start[1], end[1] + 1)
+                 for z in range(start[2], end[2] + 1)}
+        if cells & occupied:
+            continue
+        occupied |= cells
+        bricks.append((start, end))
+
+    # Let the bricks fall in order of their lowest point, keeping the highest brick of every column
+    order = sorted(range(count), key=lambda i: bricks[i][0][2])
+    top = {}
+    supporters = {i: set() for i in range(count)}
+    for i in order:
+        (x1, y1, z1), (x2, y2, z2) = bricks[i]
+        below = [top[(x, y)] for x in range(x1, x2 + 1) for y in range(y1, y2 + 1) if (x, y) in top]
+        rest = max((height for height, _ in below), default=0)
+        supporters[i] = {brick for height, brick in below if height == rest}
+        for x in range(x1, x2 + 1):
+            for y in range(y1, y2 + 1):
+                top[(x, y)] = (rest + 1 + z2 - z1, i)
+
+    safe = sum(1 for i in range(count) if all(supporters[j] != {i} for j in range(count)))
+    falling_total = 0
+    for removed in range(count):
+        fallen = {removed}
+        for i in order:
+            if i not in fallen and supporters[i] and supporters[i] <= fallen:
+                fallen.add(i)
+        falling_total += len(fallen) - 1
+
+    lines = [f"{s[0]},{s[1]},{s[2]}~{e[0]},{e[1]},{e[2]}" for s, e in bricks]
+    return "\n".join(lines), {1: safe, 2: falling_total}
+
+
+# --- Day 23 ----------------------------------------------------------------------------------
+
+def _longest_dag_path(edges, order, start, end):
+    best = {start: 0}
+    for node in order:
+        if node in best:
+            for neighbor, length in edges.get(node, ()):
+                best[neighbor] = max(best.get(neighbor, -1), best[node] + length)
+    return best.get(end)
+
+
+def _longest_simple_path(neighbors, start, end):
+    """ Exhaustive search over simple paths, with the visited nodes kept in a bit mask. """
+    index = {node: i for i, node in enumerate(neighbors)}
+    adjacency = [[(index[n], length) for n, length in neighbors[node]] for node in neighbors]
+    target, best = index[end], -1
+    # Once on the only way into the end, any other move would cut the end off
+    last = adjacency[target][0] if len(adjacency[target]) == 1 else None
+
+    def search(node, visited, length):
+        nonlocal best
+        if node == target:
+            best = max(best, length)
+            return
+        if last and node == last[0]:
+            search(target, visited, length + last[1])
+            return
+        for neighbor, step in adjacency[node]:
+            if not visited >> neighbor & 1:
+                search(neighbor, visited | 1 << neighbor, length + step)
+
+    search(index[start], 1 << index[start], 0)
+    return best
+
+
+def generate_day23(scale, rng):
+    """
+    A grid of junctions joined by straight trails. Slopes next to the junctions only allow going
+    right and down, like in the real input. The longest hike of part two is only computed for
+    grids of up to 6x6 junctions.
+    """
+    size = max(2, round(6 * math.sqrt(scale)))
+    gaps_x = [rng.randint(8, 30) for _ in range(size - 1)]
+    gaps_y = [rng.randint(8, 30) for _ in range(size - 1)]
+    xs = list(itertools.accumulate([rng.randint(1, 8)] + gaps_x))
+    ys = list(itertools.accumulate([rng.randint(2, 12)] + gaps_y))
+    width, height = xs[-1] + rng.randint(2, 8), ys[-1] + rng.randint(2, 12) + 1
+
+    trails = [((r, c), (r, c + 1)) for r in range(size) for c in range(size - 1)]
+    trails += [((r, c), (r + 1, c)) for r in range(size - 1) for c in range(size)]
+    rng.shuffle(trails)
+
+    def connected(kept):
+        neighbors = {}
+        for a, b in kept:
+            neighbors.setdefault(a, []).append(b)
+            neighbors.setdefault(b, []).append(a)
+        seen, pending = {(0, 0)}, [(0, 0)]
+        while pending:
+            for neighbor in neighbors.get(pending.pop(), []):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    pending.append(neighbor)
+        return len(seen) == size * size
+
+    kept = list(trails)
+    for trail in trails[:len(trails) // 6]:
+        remaining = [t for t in kept if t != trail]
+        if connected(remaining):
+            kept = remaining
+
+    grid = [["#"] * width for _ in range(height)]
+    for y in range(0, ys[0] + 1):
+        grid[y][xs[0]] = "."
+    for y in range(ys[-1], height):
+        grid[y][xs[-1]] = "."
+    for (r1, c1), (r2, c2) in kept:
+        if r1 == r2:
+            y = ys[r1]
+            for x in range(xs[c1], xs[c2] + 1):
+                grid[y][x] = "."
+            grid[y][xs[c1] + 1] = grid[y][xs[c2] - 1] = ">"
+        else:
+            x = xs[c1]
+            for y in range(ys[r1], ys[r2] + 1):
+                grid[y][x] = "."
+            grid[ys[r1] + 1][x] = grid[ys[r2] - 1][x] = "v"
+
+    def length(a, b):
+        return abs(xs[a[1]] - xs[b[1]]) + abs(ys[a[0]] - ys[b[0]])
+
+    start, end = "start", "end"
+    downhill = {start: [((0, 0), ys[0])], (size - 1, size - 1): [(end, height - 1 - ys[-1])]}
+    for a, b in kept:
+        downhill.setdefault(a, []).append((b, length(a, b)))
+    order = [start] + [(r, c) for r in range(size) for c in range(size)] + [end]
+    answers = {1: _longest_dag_path(downhill, order, start, end), 2: None}
+
+    if size <= 6:
+        neighbors = {node: [] for node in order}
+        for node, edges in downhill.items():
+            for neighbor, step in edges:
+                neighbors[node].append((neighbor, step))
+                neighbors[neighbor].append((node, step))
+        answers[2] = _longest_simple_path(neighbors, start, end)
+    return "\n".join("".join(row) for row in grid), answers
+
+
+# --- Day 24 ----------------------------------------------------------------------------------
+
+def _crossings_in_area(hailstones, low, high):
+    """ Count the future crossings of the paths in the x-y plane with exact fractions. """
+    from fractions import Fraction
+
+    count = 0
+    for (p1, v1), (p2, v2) in itertools.combinations(hailstones, 2):
+        determinant = v1[0] * v2[1] - v1[1] * v2[0]
+        if determinant == 0:
+            continue
+        dx, dy = p2[0] - p1[0], p2[1] - p1[1]
+        t = Fraction(dx * v2[1] - dy * v2[0], determinant)
+        s = Fraction(dx * v1[1] - dy * v1[0], determinant)
+        if t < 0 or s < 0:
+            continue
+        x, y = p1[0] + t * v1[0], p1[1] + t * v1[1]
+        if low <= x <= high and low <= y <= high:
+            count += 1
+    return count
+
+
+def generate_day24(scale, rng):
+    """ The hailstones are planted on the path of a rock thrown from a chosen position. """
+    rock = [rng.randint(250000000000000, 350000000000000) for _ in range(3)]
+    rock_velocity = [rng.randint(-250, 250) for _ in range(3)]
+    hailstones, times = [], set()
+    while len(hailstones) < _scaled(300, scale, minimum=3):
+        time = rng.randint(10 ** 11, 6 * 10 ** 11)
+        velocity = [rng.randint(-300, 300) for _ in range(3)]
+        if time in times or 0 in velocity or velocity == rock_velocity:
+            continue
+        times.add(time)
+        position = [r + time * (rv - v) for r, rv, v in zip(rock, rock_velocity, velocity)]
+        hailstones.append((position, velocity))
+
+    lines = [f"{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}" for p, v in hailstones]
+    crossings = _crossings_in_area(hailstones, 200000000000000, 400000000000000)
+    return "\n".join(lines), {1: crossings, 2: sum(rock)}
+
+
+# --- Day 25 ----------------------------------------------------------------------------------
+
+def generate_day25(scale, rng):
+    """ Two well connected groups of components joined by exactly three wires. """
+    count = _scaled(1500, scale, minimum=20)
+    names = _unique_names(rng, count)
+    split = rng.randint(int(count * 0.4), int(count * 0.6))
+    groups = [names[:split], names[split:]]
+
+    wires = set()
+    for group in groups:
+        for i, name in enumerate(group):
+            wires.add(frozenset((name, group[i - 1])))  # a ring keeps the group connected
+            while sum(1 for wire in wires if name in wire) < 4:
+                other = rng.choice(group)
+                if other != name:
+                    wires.add(frozenset((name, other)))
+    # Six distinct ends, so the cut wires never share a neighbor
+    ends = rng.sample(groups[0], 3), rng.sample(groups[1], 3)
+    for a, b in zip(*ends):
+        wires.add(frozenset((a, b)))
+
+    listed = {}
+    for wire in wires:
+        a, b = rng.sample(sorted(wire), 2)
+        listed.setdefault(a, []).append(b)
+    lines = [f"{name}: {' '.join(others)}" for name, others in rng.sample(sorted(listed.items()), len(listed))]
+    return "\n".join(lines), {1: len(groups[0]) * len(groups[1])}
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+    24: generate_day24,
+    25: generate_day25,
+}
+
+
+def generate(day, scale=1, seed=None):
+    """ Generate an input for a day. Returns the input text and the dictionary of answers per part. """
+    return GENERATORS[day](scale, random.Random(seed))
@@ -0,0 +1,251 @@
+"""
+Compressed sparse row graphs.
+
+A Graph numbers its nodes from 0 and keeps the edges of all of them in flat arrays: the edges of
+node ``n`` go to ``targets[offsets[n]:offsets[n + 1]]`` with the same slice of ``weights``, in
+the order they were given. A dict of dicts costs a hash table per node and a boxed int per
+weight, the arrays cost 8 bytes per edge, and the searches index them instead of hashing labels.
+
+Graphs of labelled nodes (the "AAA" nodes of Day 8, the components of Day 25) are built with
+``from_adjacency``, which numbers the labels in order of appearance and keeps them in ``labels``
+and ``ids``. Graphs of grid cells use the flat indices of the grid as node ids.
+
+The searches are functions of a graph:
+
+- ``bfs_distances``: number of edges from a source to every node;
+- ``shortest_path``: the nodes of a path with the fewest edges between two nodes;
+- ``dijkstra`` and ``shortest_distance``: weighted distances, with a bucket queue (Dial's
+  algorithm) instead of a heap, since the weights of the puzzles are small integers;
+- ``longest_path_in_dag``: the heaviest path between two nodes of a directed acyclic graph;
+- ``connected_components``: the nodes of every component, optionally without some edges.
+"""
+from array import array
+from collections import deque
+from itertools import accumulate, chain
+
+UNREACHED = -1
+
+
+class Graph:
+    """
+    A directed graph of ``len(neighbours)`` nodes, where ``neighbours[n]`` lists the targets of the
+    edges of node ``n`` and ``weights[n]`` their weights (every weight is 1 without ``weights``).
+    An undirected graph lists every edge from both of its ends.
+    """
+
+    def __init__(self, neighbours, weights=None, labels=None):
+        self.size = len(neighbours)
+        self.offsets = array('q', accumulate(map(len, neighbours), initial=0))
+        self.targets = array('q', chain.from_iterable(neighbours))
+        if weights is None:
+            self.weights = array('q', [1]) * len(self.targets)
+        else:
+            self.weights = array('q', chain.from_iterable(weights))
+        self.labels = labels
+        self.ids = None if labels is None else {label: node for node, label in enumerate(labels)}
+
+    @classmethod
+    def from_edges(cls, size, edges):
+        """ Build a graph of ``size`` nodes from (source, target, weight) triples. """
+        neighbours = [[] for _ in range(size)]
+        weights = [[] for _ in range(size)]
+        for source, target, weight in edges:
+            neighbours[source].append(target)
+            weights[source].append(weight)
+        return cls(neighbours, weights)
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """
+        Build a graph from a dict that maps every label to an iterable of neighbour labels, or to
+        a dict of neighbour labels and edge weights. Labels are numbered in order of appearance.
+        """
+        ids = {}
+        for label, others in adjacency.items():
+            ids.setdefault(label, len(ids))
+            for other in others:
+                ids.setdefault(other, len(ids))
+
+        neighbours = [[] for _ in ids]
+        weights = [[] for _ in ids] if any(isinstance(others, dict) for others in adjacency.values()) else None
+        for label, others in adjacency.items():
+            node = ids[label]
+            neighbours[node] = [ids[other] for other in others]
+            if weights is not None:
+                weights[node] = list(others.values())
+        return cls(neighbours, weights, list(ids))
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def neighbours(self, node):
+        """ Targets of the edges of a node. """
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def edges(self, node):
+        """ (target, weight) of the edges of a node. """
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+
+def bfs_distances(graph, source, max_distance=None):
+    """
+    Number of edges on a shortest path from the source to every node, UNREACHED for the nodes it
+    cannot reach (or that are further than ``max_distance``). The search expands one layer of
+    nodes at a time and marks a node when it is first reached, so every node is expanded once.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    distances = array('q', [UNREACHED]) * graph.size
+    distances[source] = 0
+    frontier = [source]
+    distance = 0
+    while frontier and distance != max_distance:
+        distance += 1
+        next_frontier = []
+        for node in frontier:
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if distances[target] == UNREACHED:
+                    distances[target] = distance
+                    next_frontier.append(target)
+        frontier = next_frontier
+    return distances
+
+
+def shortest_path(graph, source, target):
+    """ The nodes of a path with the fewest edges from source to target, or None if there is none. """
+    offsets, targets = graph.offsets, graph.targets
+    parents = {source: None}
+    queue = deque([source])
+    while queue and target not in parents:
+        node = queue.popleft()
+        for neighbour in targets[offsets[node]:offsets[node + 1]]:
+            if neighbour not in parents:
+                parents[neighbour] = node
+                queue.append(neighbour)
+    if target not in parents:
+        return None
+
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    return path[::-1]
+
+
+def settled_nodes(graph, sources, bucket_type=list):
+    """
+    Yield (node, distance) for every node reachable from the sources, in order of distance.
+
+    The queue is a list of buckets indexed by distance, so a push is an append and the next node
+    to settle is in the first non-empty bucket. A node is pushed again when its distance improves,
+    and the stale copies are skipped. ``bucket_type`` builds the buckets (aoc.metrics swaps in a
+    list that counts the pushes). The weights must be non-negative integers.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    sources = list(dict.fromkeys(sources))  # read once, and every source settled once
+    distances = array('q', [UNREACHED]) * graph.size
+    for source in sources:
+        distances[source] = 0
+    buckets = [bucket_type(sources)]
+    distance = 0
+    while distance < len(buckets):
+        # A zero weight edge appends to the bucket being read, which the loop still visits
+        for node in buckets[distance]:
+            if distances[node] != distance:
+                continue
+            yield node, distance
+            for edge in range(offsets[node], offsets[node + 1]):
+                target, new_distance = targets[edge], distance + weights[edge]
+                if distances[target] == UNREACHED or new_distance < distances[target]:
+                    distances[target] = new_distance
+                    while len(buckets) <= new_distance:
+                        buckets.append(bucket_type())
+                    buckets[new_distance].append(target)
+        buckets[distance] = None
+        distance += 1
+
+
+def dijkstra(graph, sources, bucket_type=list):
+    """ Weighted distance from the nearest source to every node, UNREACHED for unreachable nodes. """
+    distances = array('q', [UNREACHED]) * graph.size
+    for node, distance in settled_nodes(graph, sources, bucket_type):
+        distances[node] = distance
+    return distances
+
+
+def shortest_distance(graph, sources, targets, bucket_type=list):
+    """ Weighted distance from the nearest source to the nearest target, or None if none is reachable. """
+    targets = set(targets)
+    for node, distance in settled_nodes(graph, sources, bucket_type):
+        if node in targets:
+            return distance
+    return None
+
+
+def longest_path_in_dag(graph, source, target):
+    """
+    Weight of the heaviest path from source to target, or None if the target is unreachable.
+    The nodes reachable from the source are taken in topological order (Kahn's algorithm), so
+    every node is final before its edges are relaxed. Raises ValueError if they form a cycle.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    reachable = bfs_distances(graph, source)
+    in_degrees = array('q', [0]) * graph.size
+    for node in range(graph.size):
+        if reachable[node] != UNREACHED:
+            for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                in_degrees[neighbour] += 1
+    if in_degrees[source]:
+        raise ValueError("the graph has a cycle through the source")
+
+    longest = array('q', [UNREACHED]) * graph.size
+    longest[source] = 0
+    ready = [source]
+    ordered = 0
+    while ready:
+        node = ready.pop()
+        ordered += 1
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbour = targets[edge]
+            longest[neighbour] = max(longest[neighbour], longest[node] + weights[edge])
+            in_degrees[neighbour] -= 1
+            if not in_degrees[neighbour]:
+                ready.append(neighbour)
+
+    if ordered != sum(1 for distance in reachable if distance != UNREACHED):
+        raise ValueError("the graph has a cycle reachable from the source")
+    return None if longest[target] == UNREACHED else longest[target]
+
+
+def connected_components(graph, removed_edges=()):
+    """
+    Lists of the nodes of every connected component of an undirected graph, in order of their
+    first node, ignoring the (a, b) edges of ``removed_edges`` in both directions.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    removed = set()
+    for a, b in removed_edges:
+        removed.add((a, b))
+        removed.add((b, a))
+    component_of = array('q', [UNREACHED]) * graph.size
+    components = []
+    for start in range(graph.size):
+        if component_of[start] != UNREACHED:
+            continue
+        component_of[start] = len(components)
+        component = [start]
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                if component_of[neighbour] == UNREACHED and (node, neighbour) not in removed:
+                    component_of[neighbour] = len(components)
+                    component.append(neighbour)
+                    stack.append(neighbour)
+        components.append(component)
+    return components
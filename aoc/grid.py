@@ -0,0 +1,127 @@
+"""
+Compact grids of single-byte cells.
+
+A Grid keeps its cells row after row in one flat bytearray, surrounded by a border of sentinel
+cells. A cell is addressed by its flat index, and the neighbours of a cell are one of the
+offsets in ``directions`` (or ``neighbours``, with the diagonals) away. Every cell of the grid
+has all its neighbours inside the storage, so a walk can stop when it reaches the sentinel
+instead of checking the bounds of every step.
+
+Cells are bytes, so the solvers compare them with ``ord`` constants (``grid[i] == ROCK``).
+A grid of one-character strings costs a pointer per cell in a list per row, the bytearray
+costs a byte per cell.
+"""
+
+PAD = 1
+BORDER = 0
+
+
+class Grid:
+    """
+    A ``width`` by ``height`` grid of bytes with a ``pad`` cells wide border of ``border`` bytes.
+    Flat indices go from the first border cell, so ``index(0, 0)`` is ``pad * (stride + 1)``.
+    """
+
+    def __init__(self, width, height, pad=PAD, border=BORDER):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.border = border
+        self.stride = width + 2 * pad
+        self.cells = bytearray([border]) * (self.stride * (height + 2 * pad))
+
+        # Offsets to the four neighbours, clockwise from north, then to the diagonals
+        self.up, self.right, self.down, self.left = -self.stride, 1, self.stride, -1
+        self.directions = (self.up, self.right, self.down, self.left)
+        self.neighbours = self.directions + (self.up + 1, self.down + 1, self.down - 1, self.up - 1)
+
+    @classmethod
+    def from_lines(cls, lines, pad=PAD, border=BORDER):
+        """ Build a grid from rows given as str or bytes, which must all have the same length. """
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        grid = cls(len(rows[0]) if rows else 0, len(rows), pad, border)
+        for row, line in enumerate(rows):
+            grid.set_row(row, line)
+        return grid
+
+    @classmethod
+    def from_text(cls, text, pad=PAD, border=BORDER):
+        """ Build a grid from the lines of a str or bytes text, ignoring blank lines. """
+        return cls.from_lines([line for line in text.splitlines() if line.strip()], pad, border)
+
+    def index(self, row, col):
+        """ Flat index of a cell. """
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def position(self, index):
+        """ (row, col) of a flat index. """
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def inside(self, index):
+        """ Check if a flat index is a cell of the grid rather than of the border. """
+        row, col = self.position(index)
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def __eq__(self, other):
+        return isinstance(other, Grid) and (self.width, self.height, self.cells) == (other.width, other.height, other.cells)
+
+    def row(self, row):
+        start = self.index(row, 0)
+        return bytes(self.cells[start:start + self.width])
+
+    def set_row(self, row, line):
+        if len(line) != self.width:
+            raise ValueError(f"row {row} has {len(line)} cells, expected {self.width}")
+        start = self.index(row, 0)
+        self.cells[start:start + self.width] = line
+
+    def rows(self):
+        return [self.row(row) for row in range(self.height)]
+
+    def column(self, col):
+        start = self.index(0, col)
+        return bytes(self.cells[start:start + self.height * self.stride:self.stride])
+
+    def columns(self):
+        return [self.column(col) for col in range(self.width)]
+
+    def indices(self):
+        """ Flat indices of all the cells of the grid, row by row. """
+        for row in range(self.height):
+            start = self.index(row, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, value):
+        """ Flat index of the first cell equal to ``value``, or -1. Border bytes are never found. """
+        index = self.cells.find(value, self.index(0, 0))
+        # Only a value equal to the border can land between the rows
+        while index != -1 and not self.inside(index):
+            index = self.cells.find(value, index + 1)
+        return index
+
+    def find_all(self, value):
+        """ Flat indices of all the cells equal to ``value``. """
+        return [index for index in self.indices() if self.cells[index] == value]
+
+    def copy(self):
+        grid = Grid(self.width, self.height, self.pad, self.border)
+        grid.cells[:] = self.cells
+        return grid
+
+    def transposed(self):
+        """ A new grid whose rows are the columns of this one. """
+        return Grid.from_lines(self.columns(), self.pad, self.border)
+
+    def rotated(self):
+        """ A new grid turned a quarter clockwise. """
+        return Grid.from_lines([column[::-1] for column in self.columns()], self.pad, self.border)
+
+    def __str__(self):
+        return "\n".join(row.decode("latin-1") for row in self.rows())
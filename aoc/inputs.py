@@ -0,0 +1,137 @@
+"""
+Helpers for loading puzzle inputs.
+
+Every solver accepts its input as text (str), raw bytes, or a path to an input
+file (any os.PathLike, such as pathlib.Path). Plain strings are always treated
+as puzzle text, never as file names.
+
+Days whose inputs are long lists of independent records parse them into
+``Records``, which reads the records one at a time from a memory map of the
+file instead of holding the decoded text and a list of its lines.
+"""
+import contextlib
+import mmap
+import os
+import time
+from pathlib import Path
+
+RAW_INPUT_TYPES = (str, bytes, bytearray, memoryview, os.PathLike)
+
+
+def is_raw_input(puzzle):
+    """ Check if the value is an unparsed puzzle input (text, bytes or a path). """
+    return isinstance(puzzle, RAW_INPUT_TYPES)
+
+
+def read_bytes(source):
+    """ Return the puzzle input as bytes. """
+    if isinstance(source, os.PathLike):
+        return Path(source).read_bytes()
+    if isinstance(source, str):
+        return source.encode()
+    return bytes(source)
+
+
+def read_text(source):
+    """ Return the puzzle input as text. """
+    if isinstance(source, str):
+        return source
+    if isinstance(source, os.PathLike):
+        return Path(source).read_text()
+    return bytes(source).decode()
+
+
+@contextlib.contextmanager
+def mapped(source):
+    """
+    The puzzle input as a read-only buffer: a memory map of an input file, or the bytes of a
+    text. Only the pages that are read are loaded from a mapped file.
+    """
+    if not isinstance(source, os.PathLike):
+        yield read_bytes(source)
+        return
+    with open(source, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""  # empty files cannot be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def split_records(buffer, separator=b"\n"):
+    """
+    Yield the records of a buffer as bytes, without the separator. For lines, a trailing carriage
+    return is dropped too, and like str.splitlines a final newline does not start a last record.
+    """
+    lines = separator == b"\n"
+    start, size = 0, len(buffer)
+    while start < size:
+        end = buffer.find(separator, start)
+        if end < 0:
+            end = size
+        record = buffer[start:end]
+        yield record[:-1] if lines and record.endswith(b"\r") else record
+        start = end + len(separator)
+    if not lines and start == size and size:
+        yield b""  # a separator at the very end leaves an empty last record, like str.split
+
+
+def line_chunks(buffer, size):
+    """
+    (start, end) offsets that cut a buffer into chunks of about ``size`` bytes or more. Every
+    chunk but the last ends right after a newline, so no line is split between two chunks.
+    """
+    start, total = 0, len(buffer)
+    while start < total:
+        newline = buffer.find(b"\n", start + size - 1)
+        end = total if newline < 0 else newline + 1
+        yield start, end
+        start = end
+
+
+def follow(file, interval=1.0):
+    """
+    Yield the lines of a binary file as they are appended to it, like ``tail -f``: at the end of
+    the file it waits for more, and a last line still missing its newline is held back until
+    the rest of it is written. It never stops on its own.
+    """
+    pending = b""
+    while True:
+        line = file.readline()
+        if not line:
+            time.sleep(interval)
+            continue
+        pending += line
+        if pending.endswith(b"\n"):
+            yield pending
+            pending = b""
+
+
+class Records:
+    """
+    The records of a puzzle input, split on a separator (lines by default). Iterating maps the
+    input again and yields one bytes record at a time, so the records can be read any number of
+    times without keeping them all in memory.
+    """
+
+    def __init__(self, source, separator=b"\n"):
+        # Texts are kept as bytes, paths are mapped on every iteration
+        self.source = source if isinstance(source, os.PathLike) else read_bytes(source)
+        self.separator = separator
+
+    def __iter__(self):
+        with mapped(self.source) as buffer:
+            yield from split_records(buffer, self.separator)
+
+
+def ensure_parsed(puzzle, parse):
+    """
+    Return the parsed form of the puzzle. Raw inputs are run through the day's parse function,
+    anything else is assumed to be the result of a previous parse call and is returned as is.
+    """
+    return parse(puzzle) if is_raw_input(puzzle) else puzzle
+
+
+def default_input(module_file):
+    """ Return the path of the input.txt file that sits next to a solver module. """
+    return Path(module_file).with_name("input.txt")
@@ -0,0 +1,229 @@
+"""
+Sets of integer intervals and axis-aligned boxes.
+
+Intervals are half-open: (start, end) holds start, start + 1, ..., end - 1. The length of an
+interval is end - start, and splitting it at a threshold gives (start, threshold) and
+(threshold, end) without any +1 or -1.
+
+An IntervalSet keeps its intervals sorted, disjoint and coalesced (touching intervals are
+merged), so it never holds more intervals than the number of boundaries it has seen. A
+PiecewiseLinear function shifts the numbers of some intervals by an offset and leaves the others
+unchanged. Day 5 pushes its seed ranges through one of them per almanac map.
+
+A box is a tuple of one (start, end) interval per axis, and an empty box is None. Day 19 splits
+the box of every rating combination on the thresholds of the workflow rules.
+"""
+from bisect import bisect_right
+from math import prod
+
+
+def coalesce(intervals):
+    """ Sorted, disjoint and merged copies of intervals, without the empty ones. """
+    merged = []
+    for start, end in sorted(interval for interval in intervals if interval[0] < interval[1]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class IntervalSet:
+    """ A set of integers stored as sorted, disjoint, coalesced half-open intervals. """
+
+    def __init__(self, intervals=()):
+        self.intervals = coalesce(intervals)
+
+    @classmethod
+    def from_lengths(cls, pairs):
+        """ Build a set from (start, length) pairs. """
+        return cls((start, start + length) for start, length in pairs)
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def __bool__(self):
+        return bool(self.intervals)
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __repr__(self):
+        return f"IntervalSet({self.intervals})"
+
+    def __contains__(self, number):
+        index = bisect_right(self.intervals, (number, float('inf'))) - 1
+        return index >= 0 and number < self.intervals[index][1]
+
+    @property
+    def size(self):
+        """ Number of integers in the set. """
+        return sum(end - start for start, end in self.intervals)
+
+    def min(self):
+        if not self.intervals:
+            raise ValueError("min() of an empty IntervalSet")
+        return self.intervals[0][0]
+
+    def union(self, other):
+        return IntervalSet(self.intervals + list(other))
+
+    def intersection(self, other):
+        """ The numbers in both sets, by walking the two sorted lists side by side. """
+        result = []
+        mine, theirs = self.intervals, list(other)
+        i = j = 0
+        while i < len(mine) and j < len(theirs):
+            start, end = max(mine[i][0], theirs[j][0]), min(mine[i][1], theirs[j][1])
+            if start < end:
+                result.append((start, end))
+            if mine[i][1] < theirs[j][1]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(result)
+
+    def difference(self, other):
+        """ The numbers of this set that are not in the other one. """
+        result = []
+        theirs = list(other)
+        j = 0
+        for start, end in self.intervals:
+            # Skip the intervals of the other set that end before this one starts
+            while j < len(theirs) and theirs[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(theirs) and theirs[k][0] < end:
+                if theirs[k][0] > start:
+                    result.append((start, theirs[k][0]))
+                start = max(start, theirs[k][1])
+                k += 1
+            if start < end:
+                result.append((start, end))
+        return IntervalSet(result)
+
+    __or__, __and__, __sub__ = union, intersection, difference
+
+    def split(self, threshold):
+        """ The numbers below the threshold and the ones at or above it, as two sets. """
+        below, above = [], []
+        for start, end in self.intervals:
+            if end <= threshold:
+                below.append((start, end))
+            elif start >= threshold:
+                above.append((start, end))
+            else:
+                below.append((start, threshold))
+                above.append((threshold, end))
+        return IntervalSet(below), IntervalSet(above)
+
+
+class PiecewiseLinear:
+    """
+    A function that adds an offset to the numbers of some intervals and maps every other number
+    to itself, given as (start, end, offset) pieces. Where pieces overlap the one that starts
+    first applies, and among pieces with the same start the first one given.
+    """
+
+    def __init__(self, pieces):
+        # One sweep in order of start: a piece only keeps what lies past the end of the pieces before it
+        disjoint = []
+        covered = float('-inf')
+        for start, end, offset in sorted(pieces, key=lambda piece: piece[0]):
+            start = max(start, covered)
+            if start < end:
+                disjoint.append((start, end, offset))
+                covered = end
+        self.pieces = disjoint
+        self.starts = [start for start, _, _ in self.pieces]
+
+    def __call__(self, number):
+        index = bisect_right(self.starts, number) - 1
+        if index >= 0 and number < self.pieces[index][1]:
+            return number + self.pieces[index][2]
+        return number
+
+    def image(self, intervals):
+        """ The set of the images of the numbers of a set, shifted piece by piece. """
+        result = []
+        for start, end in intervals:
+            index = max(0, bisect_right(self.starts, start) - 1)
+            while start < end:
+                if index < len(self.pieces) and self.pieces[index][1] <= start:
+                    index += 1  # The piece ends before the interval starts
+                    continue
+                if index == len(self.pieces) or self.pieces[index][0] >= end:
+                    result.append((start, end))  # No piece left in the interval
+                    break
+                piece_start, piece_end, offset = self.pieces[index]
+                if start < piece_start:
+                    result.append((start, piece_start))  # The gap before the piece is unchanged
+                    start = piece_start
+                stop = min(end, piece_end)
+                result.append((start + offset, stop + offset))
+                start = stop
+                index += 1
+        return IntervalSet(result)
+
+
+# --- Boxes ---------------------------------------------------------------------------------
+
+def box_volume(box):
+    """ Number of integer points in a box (0 for None). """
+    return 0 if box is None else prod(end - start for start, end in box)
+
+
+def split_box(box, axis, threshold):
+    """ The parts of a box below the threshold and at or above it along an axis, None if empty. """
+    start, end = box[axis]
+    below = box[:axis] + ((start, min(end, threshold)),) + box[axis + 1:] if start < threshold else None
+    above = box[:axis] + ((max(start, threshold), end),) + box[axis + 1:] if end > threshold else None
+    return below, above
+
+
+def intersect_boxes(box, other):
+    """ The common part of two boxes, or None. """
+    common = tuple((max(a[0], b[0]), min(a[1], b[1])) for a, b in zip(box, other))
+    return common if all(start < end for start, end in common) else None
+
+
+def subtract_box(box, other):
+    """
+    The part of a box outside another one, as at most two disjoint boxes per axis: the slabs
+    below and above the other box along the first axis, then along the next one within it, ...
+    """
+    if intersect_boxes(box, other) is None:
+        return [box]
+    pieces = []
+    for axis, (start, end) in enumerate(other):
+        below, box = split_box(box, axis, start)
+        if below is not None:
+            pieces.append(below)
+        box, above = split_box(box, axis, end)
+        if above is not None:
+            pieces.append(above)
+    return pieces
+
+
+def union_volume(boxes):
+    """
+    Number of integer points in the union of boxes that may overlap. The boxes are swept along
+    the first axis: between two consecutive box boundaries the union is a slab whose section is
+    the union of the sections of the boxes that span it, measured the same way.
+    """
+    boxes = [box for box in boxes if box is not None and box_volume(box)]
+    if not boxes:
+        return 0
+    if len(boxes[0]) == 1:
+        return IntervalSet(box[0] for box in boxes).size
+    cuts = sorted({bound for box in boxes for bound in box[0]})
+    total = 0
+    for low, high in zip(cuts, cuts[1:]):
+        sections = [box[1:] for box in boxes if box[0][0] <= low and high <= box[0][1]]
+        if sections:
+            total += (high - low) * union_volume(sections)
+    return total
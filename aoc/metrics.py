@@ -0,0 +1,83 @@
+"""
+Opt-in counters of the work done by the solvers.
+
+The hot loops of the instrumented days build their containers through module-level names
+(``Stack = list`` in Day 23, ``Memo = dict`` in Day 12, ...) or pass them to the shared
+searches (``Bucket`` in Day 17). ``instrument`` rebinds those names to counting subclasses for
+the time of a run, so when metrics are off the loops run exactly the code they would run
+without this module, with no extra branch.
+
+Counts are gathered in the module-level ``counts`` Counter under names like ``day17.queue_pushes``.
+"""
+from collections import Counter, deque
+
+counts = Counter()
+
+
+def counting_list(name):
+    """ A list subclass that counts its appends under ``name``. """
+    class CountingList(list):
+        def append(self, item):
+            counts[name] += 1
+            list.append(self, item)
+
+    return CountingList
+
+
+def counting_memo(hit, miss):
+    """ A dict subclass that counts membership tests that find their key (``hit``) or not (``miss``). """
+    class CountingMemo(dict):
+        def __contains__(self, key):
+            found = dict.__contains__(self, key)
+            counts[hit if found else miss] += 1
+            return found
+
+    return CountingMemo
+
+
+def counting_deque(name):
+    """ A deque subclass that counts the items taken with popleft under ``name``. """
+    class CountingDeque(deque):
+        def popleft(self):
+            counts[name] += 1
+            return deque.popleft(self)
+
+    return CountingDeque
+
+
+# Module globals of each day that are rebound while collecting metrics
+PROBES = {
+    12: {"Memo": lambda: counting_memo("day12.cache_hits", "day12.cache_misses")},
+    14: {"States": lambda: counting_list("day14.states_stored")},
+    17: {"Bucket": lambda: counting_list("day17.queue_pushes")},
+    20: {"deque": lambda: counting_deque("day20.pulses")},
+    23: {"Stack": lambda: counting_list("day23.stack_pushes")},
+}
+
+
+def instrument(day, module):
+    """
+    Rebind the probed globals of a day module to their counting versions. Returns a function
+    that puts the original globals back.
+    """
+    originals = {}
+    for name, factory in PROBES.get(day, {}).items():
+        originals[name] = getattr(module, name)
+        setattr(module, name, factory())
+
+    def restore():
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+    return restore
+
+
+def collect(day, module, function, *args):
+    """ Call a function of a day module with its probes in place. Returns (result, counts). """
+    counts.clear()
+    restore = instrument(day, module)
+    try:
+        result = function(*args)
+    finally:
+        restore()
+    return result, dict(counts)
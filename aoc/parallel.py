@@ -0,0 +1,55 @@
+"""
+Parallel loops over independent items.
+
+``parallel_map`` applies a function to items on a pool of workers and returns the results in
+order. On a free-threaded CPython (3.13t and later, running with the GIL disabled) the pool is
+made of threads, which share the inputs without copying them. With the GIL, threads would take
+turns, so the pool is made of processes, which receive the function and the items pickled.
+
+Either way the function must be a module-level function (or a functools.partial of one) that
+only reads its inputs. Module-level mutable state, such as a cache, would be shared without
+locks between threads and silently not shared between processes.
+
+Loops run serially in the calling thread unless $AOC_WORKERS asks for more than one worker,
+``aoc run --workers N`` sets it for the solver processes.
+"""
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def gil_enabled():
+    """ Check if the GIL is enabled, which it always is before Python 3.13. """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def worker_count():
+    """ The number of workers of the parallel loops, from $AOC_WORKERS (1 by default). """
+    try:
+        return max(1, int(os.environ.get("AOC_WORKERS", 1)))
+    except ValueError:
+        return 1
+
+
+def parallel_map(function, *iterables):
+    """ Like list(map(function, *iterables)), on threads or processes when there are workers. """
+    workers = worker_count()
+    if workers == 1:
+        return list(map(function, *iterables))
+
+    columns = [list(iterable) for iterable in iterables]
+    size = min(map(len, columns))
+    if size < 2:
+        return list(map(function, *columns))
+
+    if not gil_enabled():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(function, *columns))
+
+    # A few chunks per worker balance the load without pickling every item on its own
+    chunksize = max(1, size // (workers * 4))
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, size), mp_context=context) as executor:
+        return list(executor.map(function, *columns, chunksize=chunksize))
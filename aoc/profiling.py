@@ -0,0 +1,140 @@
+"""
+Profiling of the day solvers.
+
+``profile(directory, name)`` runs a block under three profilers at once and writes their reports
+next to each other in ``directory``:
+
+- ``name.pstats``: cProfile statistics, for pstats, snakeviz and the like, with a ``name.txt``
+  summary of the functions that take the most time;
+- ``name.folded``: collapsed stacks sampled every few milliseconds from a background thread, one
+  ``frame;frame;frame count`` line per distinct stack, ready for flamegraph.pl or speedscope;
+- ``name.alloc.txt``: the lines that hold the most memory at the peak of the traced allocations,
+  from tracemalloc.
+
+The tracing slows the block down a lot, so the times in these reports are only meaningful
+relative to each other. PyPy has no tracemalloc, so there the allocation report stays empty.
+"""
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+try:
+    import tracemalloc
+except ImportError:  # Not available on PyPy
+    tracemalloc = None
+
+SAMPLE_INTERVAL = 0.005
+TOP = 25
+
+
+def frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"
+
+
+class Sampler(threading.Thread):
+    """
+    Sample the stack of a thread at a fixed interval into collapsed stacks, and keep a tracemalloc
+    snapshot of every new peak of the traced memory.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.peak = 0
+        self.peak_snapshot = None
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+            if tracemalloc is None:
+                continue
+            # Snapshots are expensive, only take one when the peak grew by a tenth
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.peak * 1.1:
+                self.peak = current
+                self.peak_snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        self.done.set()
+        self.join()
+
+
+def hotspots(stats, count=3):
+    """ The functions with the most time spent in their own code, as "file:line(function) seconds". """
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:count]
+    return [f"{os.path.basename(file)}:{line}({function}) {own:.3f}s"
+            for (file, line, function), (_, _, own, _, _) in entries]
+
+
+def allocation_sites(snapshot, count=TOP):
+    """ The source lines holding the most memory in a snapshot, as "file:line size". """
+    if snapshot is None:
+        return []
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                       tracemalloc.Filter(False, __file__)])
+    return [f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno} "
+            f"{stat.size / 1024:.1f}KB in {stat.count} blocks"
+            for stat in snapshot.statistics("lineno")[:count]]
+
+
+@contextlib.contextmanager
+def profile(directory, name, summary=None):
+    """
+    Profile the block and write the reports as ``directory/name.*``. If ``summary`` is a dict,
+    it receives the report files, the top hotspots and the top allocation sites.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+    sampler = Sampler(threading.get_ident())
+    profiler = cProfile.Profile()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+        peak = 0
+        if tracemalloc is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            if sampler.peak_snapshot is None or current >= sampler.peak:
+                sampler.peak_snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+        base = directory / name
+        profiler.dump_stats(f"{base}.pstats")
+        text = io.StringIO()
+        stats = pstats.Stats(profiler, stream=text)
+        stats.sort_stats("tottime").print_stats(TOP)
+        stats.sort_stats("cumulative").print_stats(TOP)
+        Path(f"{base}.txt").write_text(text.getvalue())
+
+        Path(f"{base}.folded").write_text("".join(f"{stack} {count}\n" for stack, count in sampler.stacks.most_common()))
+
+        sites = allocation_sites(sampler.peak_snapshot)
+        Path(f"{base}.alloc.txt").write_text(f"Peak traced memory: {peak / 1024:.1f}KB\n" + "".join(f"{site}\n" for site in sites))
+
+        if summary is not None:
+            summary["files"] = [f"{base}{suffix}" for suffix in (".pstats", ".txt", ".folded", ".alloc.txt")]
+            summary["hotspots"] = hotspots(stats)
+            summary["allocations"] = sites[:3]
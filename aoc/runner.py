@@ -0,0 +1,194 @@
+"""
+Parallel execution of the day solvers.
+
+Every (day, part) pair runs in its own fresh worker process of a process pool. The heavy days
+overlap with the cheap ones, and the peak RSS reported for a part only covers that part.
+
+Batches of inputs of one day run on long-lived workers instead, which import the day once and
+then solve input after input.
+"""
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from aoc import cache, metrics, profiling
+from aoc.days import input_path, load_day
+from aoc.inputs import read_bytes
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:  # Not available on PyPy
+    tracemalloc = None
+
+PARTS = (1, 2)
+
+# Days that dominate a full run. They are submitted first so they are already running
+# while the cheap days fill up the remaining workers.
+HEAVY_DAYS = (23, 16, 17, 22, 20, 14, 12, 25, 24)
+
+
+def peak_rss():
+    """ Peak resident set size of the current process in bytes, or None if it is unknown. """
+    # On Linux ru_maxrss survives fork and exec, so a fresh worker would report the peak of the
+    # process that started it. VmHWM is tracked per address space and starts over on exec.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes everywhere else
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@contextlib.contextmanager
+def tracing_memory(result):
+    """ Trace the Python allocations of the block and record their peak as ``traced_peak``. """
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        result["traced_peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+
+def solve_part(day, part, input_file=None, cache_dir=None, collect_metrics=False, profile_dir=None,
+               trace_memory=False):
+    """
+    Parse the input of a day and solve one part in the current process. The input is a file,
+    the checked-in input by default, or the raw bytes of one.
+    Returns a dictionary with the answer, the parse time, the wall and CPU time of the part
+    and the peak RSS of the process. Errors are reported in the dictionary instead of raised.
+    With a cache directory, the parsed input and the answer go through the on-disk cache; an
+    answer found there is reported with ``cached`` set and no timings. With ``collect_metrics``
+    the work counters of aoc.metrics are added as ``metrics``. With a profile directory, parse
+    and part run under aoc.profiling, which writes its reports there and adds a summary of them
+    as ``profile``; the answer is then never taken from the cache. With ``trace_memory`` the
+    peak of the allocations traced by tracemalloc during parse and part is added as
+    ``traced_peak`` (not while profiling, which traces them itself, nor on PyPy).
+    """
+    source = input_file or input_path(day)
+    result = {"day": day, "part": part, "input": str(source) if isinstance(source, os.PathLike) else "<text>"}
+    try:
+        module = load_day(day)
+        solver = getattr(module, f"part{part}", None)
+        if solver is None:
+            result["skipped"] = True
+            return result
+
+        store = cache.enable(cache_dir) if cache_dir else None
+        if store:
+            source = read_bytes(source)
+            key = cache.answer_key(module, part, source)
+            missing = object()
+            answer = missing if profile_dir else store.get(key, missing)
+            if answer is not missing:
+                result.update(answer=answer, cached=True)
+                return result
+
+        if profile_dir:
+            profiled = profiling.profile(profile_dir, f"day{day}-part{part}", result.setdefault("profile", {}))
+        elif trace_memory and tracemalloc is not None:
+            profiled = tracing_memory(result)
+        else:
+            profiled = contextlib.nullcontext()
+        with profiled:
+            start = time.perf_counter()
+            data = cache.cached_parse(module, source)
+            result["parse_time"] = time.perf_counter() - start
+
+            start, start_cpu = time.perf_counter(), time.process_time()
+            if collect_metrics:
+                result["answer"], result["metrics"] = metrics.collect(day, module, solver, data)
+            else:
+                result["answer"] = solver(data)
+            result["wall_time"] = time.perf_counter() - start
+            result["cpu_time"] = time.process_time() - start_cpu
+        if store:
+            store.put(key, result["answer"])
+    except Exception:
+        result["error"] = traceback.format_exc()
+    finally:
+        result["peak_rss"] = peak_rss()
+    return result
+
+
+def to_json(result):
+    """ Make a result dictionary JSON serializable, answers that are not numbers are turned into text. """
+    answer = result.get("answer")
+    if answer is not None and not isinstance(answer, (int, float)):
+        result = {**result, "answer": str(answer)}
+    return json.dumps(result)
+
+
+def schedule(days, parts=PARTS):
+    """ Return the (day, part) tasks for the selected days, heaviest days first. """
+    heavy = [day for day in HEAVY_DAYS if day in days]
+    ordered = heavy + [day for day in days if day not in heavy]
+    return [(day, part) for day in ordered for part in parts]
+
+
+def run_parts(tasks, jobs=None, input_file=None, cache_dir=None, collect_metrics=False, profile_dir=None,
+              trace_memory=False):
+    """
+    Solve the (day, part) tasks in a process pool and yield the results as they complete.
+    Each task gets a fresh worker process so the peak RSS is measured per part.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as executor:
+        futures = [executor.submit(solve_part, day, part, input_file, cache_dir, collect_metrics, profile_dir, trace_memory)
+                   for day, part in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def collect_inputs(paths, pattern="*.txt"):
+    """
+    Expand input paths into a sorted list of input files. A directory stands for the files in it
+    that match ``pattern``, a ``.list`` file is a manifest with one input path per line (relative
+    to the manifest, blank lines and ``#`` comments are skipped) and any other file is an input.
+    """
+    inputs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            inputs.extend(sorted(file for file in path.glob(pattern) if file.is_file()))
+        elif path.suffix == ".list":
+            for line in path.read_text().splitlines():
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    inputs.append(path.parent / line)
+        else:
+            inputs.append(path)
+    return inputs
+
+
+def run_batch(day, inputs, parts=PARTS, jobs=None, cache_dir=None):
+    """
+    Solve the parts of one day for every input in a process pool and yield the results as they
+    complete. The workers import the day once and are reused, so the peak RSS of a result is the
+    one of its worker so far.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=load_day, initargs=(day,)) as executor:
+        futures = [executor.submit(solve_part, day, part, Path(input_file), cache_dir)
+                   for input_file in inputs for part in parts]
+        for future in as_completed(futures):
+            yield future.result()
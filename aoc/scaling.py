@@ -0,0 +1,191 @@
+"""
+Scaled-up variants of the checked-in puzzle inputs for the benchmarks.
+
+Each scaler takes the text of a real input, a scale factor and a random.Random instance, and
+returns a valid input for the same day that is roughly ``factor`` times larger (more lines, more
+tiles or longer distances, depending on what drives the cost of the day). Days whose input only
+makes sense with its exact structure (the Day 8 and Day 20 networks, the Day 10 loop, the Day 21
+and Day 23 maps and the Day 25 graph) have no scaler; the benchmarks generate a synthetic input
+for them with aoc.generators.
+"""
+import math
+import re
+
+
+def grid_tiling(factor):
+    """ Split a scale factor into a number of horizontal and vertical copies of a grid. """
+    across = max(1, round(math.sqrt(factor)))
+    down = max(1, round(factor / across))
+    return across, down
+
+
+def tile_grid(text, factor, separator=None):
+    """
+    Tile a grid next to and below itself. The optional separator character is placed between
+    the copies so they cannot interact (e.g. numbers merging across copies).
+    """
+    rows = text.strip().split("\n")
+    across, down = grid_tiling(factor)
+    gap = separator or ""
+    tiled_rows = [gap.join([row] * across) for row in rows]
+    width = len(tiled_rows[0])
+
+    tiled = []
+    for copy in range(down):
+        if copy and separator:
+            tiled.append(separator * width)
+        tiled.extend(tiled_rows)
+    return "\n".join(tiled)
+
+
+def repeat_lines(text, factor):
+    """ Repeat every line of the input ``factor`` times (the whole block, in order). """
+    return "\n".join([text.strip()] * factor)
+
+
+def scale_day1(text, factor, rng):
+    return repeat_lines(text, factor)
+
+
+def scale_day2(text, factor, rng):
+    games = [line.split(": ", 1)[1] for line in text.strip().split("\n")]
+    return "\n".join(f"Game {i}: {games[(i - 1) % len(games)]}" for i in range(1, len(games) * factor + 1))
+
+
+def scale_day3(text, factor, rng):
+    return tile_grid(text, factor, separator=".")
+
+
+def scale_day4(text, factor, rng):
+    cards = [line.split(":", 1)[1] for line in text.strip().split("\n")]
+    return "\n".join(f"Card {i}:{cards[(i - 1) % len(cards)]}" for i in range(1, len(cards) * factor + 1))
+
+
+def scale_day5(text, factor, rng):
+    """ Add seed ranges around the existing ones; the maps stay the same. """
+    seeds_line, rest = text.split("\n", 1)
+    seeds = [int(seed) for seed in seeds_line.split()[1:]]
+    pairs = [(seeds[i], seeds[i + 1]) for i in range(0, len(seeds), 2)]
+    scaled = list(pairs)
+    while len(scaled) < len(pairs) * factor:
+        start, length = rng.choice(pairs)
+        scaled.append((start + rng.randrange(length), rng.randrange(1, length + 1)))
+    return "seeds: " + " ".join(f"{start} {length}" for start, length in scaled) + "\n" + rest
+
+
+def scale_day6(text, factor, rng):
+    """ Make the races longer; the records grow quadratically so the races stay winnable. """
+    times_line, records_line = text.strip().split("\n")[:2]
+    times = [int(x) * factor for x in times_line.split()[1:]]
+    records = [int(x) * factor * factor for x in records_line.split()[1:]]
+    return "Time: " + " ".join(map(str, times)) + "\nDistance: " + " ".join(map(str, records))
+
+
+def scale_day7(text, factor, rng):
+    """ Add shuffled copies of the hands, which keeps the distribution of hand types. """
+    hands = [line.split() for line in text.strip().split("\n")]
+    lines = []
+    for _ in range(factor):
+        for hand, bid in hands:
+            lines.append(f"{''.join(rng.sample(hand, len(hand)))} {bid}")
+    return "\n".join(lines)
+
+
+def scale_day9(text, factor, rng):
+    return repeat_lines(text, factor)
+
+
+def scale_day11(text, factor, rng):
+    return tile_grid(text, factor)
+
+
+def scale_day12(text, factor, rng):
+    return repeat_lines(text, factor)
+
+
+def scale_day13(text, factor, rng):
+    return "\n\n".join([text.strip()] * factor)
+
+
+def scale_day14(text, factor, rng):
+    return tile_grid(text, factor)
+
+
+def scale_day15(text, factor, rng):
+    return ",".join([text.strip()] * factor)
+
+
+def scale_day16(text, factor, rng):
+    return tile_grid(text, factor)
+
+
+def scale_day17(text, factor, rng):
+    return tile_grid(text, factor)
+
+
+def scale_day18(text, factor, rng):
+    """
+    Stretch the plain dig plan so the lagoon area grows by ``factor``. The hex instructions
+    are kept as they are since they only allow five hex digits.
+    """
+    stretch = max(1, round(math.sqrt(factor)))
+    lines = []
+    for line in text.strip().split("\n"):
+        direction, distance, color = line.split()
+        lines.append(f"{direction} {int(distance) * stretch} {color}")
+    return "\n".join(lines)
+
+
+def scale_day19(text, factor, rng):
+    """ Add randomly rated parts; the workflows stay the same. """
+    workflows, parts = text.strip().split("\n\n")
+    count = len(parts.split("\n")) * factor
+    ratings = ("{x=%d,m=%d,a=%d,s=%d}" % tuple(rng.randint(1, 4000) for _ in range(4)) for _ in range(count))
+    return workflows + "\n\n" + "\n".join(ratings)
+
+
+def scale_day22(text, factor, rng):
+    """ Place copies of the whole pile of bricks next to each other along the x axis. """
+    bricks = [list(map(int, re.findall(r"\d+", line))) for line in text.strip().split("\n")]
+    width = max(max(brick[0], brick[3]) for brick in bricks) + 1
+    lines = []
+    for copy in range(factor):
+        shift = copy * width
+        for x1, y1, z1, x2, y2, z2 in bricks:
+            lines.append(f"{x1 + shift},{y1},{z1}~{x2 + shift},{y2},{z2}")
+    return "\n".join(lines)
+
+
+def scale_day24(text, factor, rng):
+    """ Add perturbed copies of the hailstones after the original ones. """
+    hailstones = [list(map(int, re.findall(r"-?\d+", line))) for line in text.strip().split("\n")]
+    lines = [line.strip() for line in text.strip().split("\n")]
+    for _ in range(len(hailstones) * (factor - 1)):
+        px, py, pz, vx, vy, vz = rng.choice(hailstones)
+        px, py, pz = (p + rng.randint(-10 ** 12, 10 ** 12) for p in (px, py, pz))
+        vx, vy, vz = (v + rng.randint(-5, 5) or 1 for v in (vx, vy, vz))
+        lines.append(f"{px}, {py}, {pz} @ {vx}, {vy}, {vz}")
+    return "\n".join(lines)
+
+
+SCALERS = {
+    1: scale_day1,
+    2: scale_day2,
+    3: scale_day3,
+    4: scale_day4,
+    5: scale_day5,
+    6: scale_day6,
+    7: scale_day7,
+    9: scale_day9,
+    11: scale_day11,
+    12: scale_day12,
+    13: scale_day13,
+    14: scale_day14,
+    15: scale_day15,
+    16: scale_day16,
+    17: scale_day17,
+    18: scale_day18,
+    19: scale_day19,
+    22: scale_day22,
+    24: scale_day24,
+}
@@ -0,0 +1,138 @@
+"""
+A warm solver daemon on a Unix domain socket.
+
+``serve`` starts a pool of long-lived worker processes that import every day module once, along
+with the libraries they use (sympy for the Day 24 reference solver, if it is installed), and then
+answers requests from a socket. Requests and responses are JSON objects, one per line, any
+number of them per connection:
+
+- ``{"day": 7, "part": 1, "path": "/abs/input.txt"}`` or ``{"day": 7, "part": 1, "input": "..."}``
+  solves a part and answers with the result dictionary of aoc.runner.solve_part;
+- ``{"command": "ping"}`` answers with the available days.
+
+Requests of one connection are answered in order, connections are served concurrently. The peak
+RSS of a result is the one of the long-lived worker that solved it, not of that part alone.
+"""
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aoc.days import find_days, load_day
+from aoc.runner import solve_part, to_json
+
+# Workers are replaced after this many requests, which bounds what module-level caches can hold
+MAX_TASKS_PER_WORKER = 1000
+
+
+def default_socket():
+    """ $AOC_SOCKET, or aoc.sock in $XDG_RUNTIME_DIR or in the temporary directory. """
+    if os.environ.get("AOC_SOCKET"):
+        return Path(os.environ["AOC_SOCKET"])
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(directory) / f"aoc-{os.getuid()}.sock"
+
+
+def warm_up():
+    """ Import every day module, and with them the libraries they use. """
+    for day in find_days():
+        load_day(day)
+
+
+def solve_request(message):
+    """ Solve the part described by a request in a worker. """
+    day, part = int(message["day"]), int(message.get("part", 1))
+    if "path" in message:
+        return solve_part(day, part, Path(message["path"]), message.get("cache_dir"))
+    if "input" in message:
+        return solve_part(day, part, message["input"].encode(), message.get("cache_dir"))
+    return solve_part(day, part, cache_dir=message.get("cache_dir"))
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.answer(json.loads(line))
+            except Exception as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+            self.wfile.write((to_json(response) + "\n").encode())
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, executor):
+        self.executor = executor
+        super().__init__(str(socket_path), RequestHandler)
+
+    def answer(self, message):
+        if message.get("command") == "ping":
+            return {"ok": True, "days": list(find_days())}
+        if message.get("day") not in find_days():
+            return {"error": f"unknown day: {message.get('day')}"}
+        return self.executor.submit(solve_request, message).result()
+
+
+def serve(socket_path=None, workers=None, ready=None):
+    """
+    Serve requests on a Unix socket until interrupted. The workers are warmed up before the
+    socket is created, so a client that can connect is answered by warm workers. ``ready`` is
+    called with the socket path once the server accepts connections.
+    """
+    socket_path = Path(socket_path or default_socket())
+    if socket_path.exists():
+        if is_running(socket_path):
+            raise RuntimeError(f"a server is already listening on {socket_path}")
+        socket_path.unlink()  # left behind by a server that did not shut down cleanly
+
+    workers = workers or os.cpu_count() or 1
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=warm_up,
+                             max_tasks_per_child=MAX_TASKS_PER_WORKER) as executor:
+        # The pool starts its workers lazily, so give every worker something to do
+        for future in [executor.submit(warm_up) for _ in range(workers)]:
+            future.result()
+
+        with SolverServer(socket_path, executor) as server:
+            try:
+                if ready:
+                    ready(socket_path)
+                server.serve_forever()
+            finally:
+                socket_path.unlink(missing_ok=True)
+
+
+# --- Client ----------------------------------------------------------------------------------
+
+def is_running(socket_path=None):
+    """ Check if a server answers on the socket. """
+    try:
+        return request({"command": "ping"}, socket_path).get("ok", False)
+    except OSError:
+        return False
+
+
+def request(message, socket_path=None):
+    """ Send one request to the server and return its response. """
+    [response] = requests([message], socket_path)
+    return response
+
+
+def requests(messages, socket_path=None):
+    """ Send requests over a single connection and yield the responses in order. """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path or default_socket()))
+        with client.makefile("rwb") as stream:
+            for message in messages:
+                stream.write((json.dumps(message) + "\n").encode())
+                stream.flush()
+                yield json.loads(stream.readline())
@@ -0,0 +1,152 @@
+"""
+Solve days again whenever their input or their solver changes.
+
+A Watcher keeps, per day, the parsed input and the fingerprints of the last solve in memory and
+polls the files it depends on:
+
+- the input is hashed again only when its size or modification time changed, and parsed again
+  only when its digest did, so touching a file or saving it unchanged costs nothing;
+- the solver module is reloaded when its source file changes. The fingerprints of aoc.cache then
+  tell which functions changed: a new ``parse`` parses the input again, a new ``partN`` solves
+  only that part again with the parsed input kept.
+
+Solver modules that define their own classes are parsed again after every reload, since the
+parsed objects would still be instances of the old classes. Changes to the helpers of the aoc
+package are not picked up, they need a restart.
+"""
+import importlib
+import os
+import time
+import traceback
+from pathlib import Path
+
+from aoc import cache
+from aoc.days import input_path, load_day
+from aoc.runner import PARTS
+
+DEFAULT_INTERVAL = 0.5
+
+
+def stamp(path):
+    """ (size, modification time) of a file, which changes when the file is written. """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def defines_classes(module):
+    """ Check if a module defines classes of its own. """
+    return any(isinstance(value, type) and value.__module__ == module.__name__ for value in vars(module).values())
+
+
+class WatchedDay:
+    """ The parsed input and the fingerprints of the last solve of one day. """
+
+    def __init__(self, day, parts, input_file=None):
+        self.day = day
+        self.parts = parts
+        self.input_file = Path(input_file or input_path(day))
+        self.module = load_day(day)
+        self.module_stamp = stamp(self.module.__file__)
+        self.input_stamp = None
+        self.input_digest = None
+        self.input_bytes = None
+        self.parse_fingerprint = None
+        self.data = None
+        self.error = None  # the last error reported by the watcher, not repeated every poll
+        self.solved = {}  # part -> (input digest, fingerprint of the part) of its last solve
+
+    def reload(self):
+        """ Reload the solver module if its source changed. Returns True if it was reloaded. """
+        module_stamp = stamp(self.module.__file__)
+        if module_stamp == self.module_stamp:
+            return False
+        self.module_stamp = module_stamp
+        self.module = importlib.reload(self.module)
+        if defines_classes(self.module):
+            self.parse_fingerprint = None
+        return True
+
+    def update(self):
+        """ Solve the parts affected by the changes since the last call and return their results. """
+        results = []
+        reason = "solver changed" if self.input_digest is not None and self.reload() else None
+
+        input_stamp = stamp(self.input_file)
+        if input_stamp != self.input_stamp:
+            self.input_stamp = input_stamp
+            input_bytes = self.input_file.read_bytes()
+            input_digest = cache.digest(input_bytes)
+            if input_digest != self.input_digest:
+                reason = "input changed" if self.input_digest is not None else "started"
+                self.input_digest = input_digest
+                self.input_bytes = input_bytes
+                self.parse_fingerprint = None
+
+        parse_time = None
+        parse_fingerprint = cache.fingerprint(self.module.parse)
+        if parse_fingerprint != self.parse_fingerprint:
+            self.parse_fingerprint = parse_fingerprint
+            self.solved.clear()
+            start = time.perf_counter()
+            try:
+                self.data = self.module.parse(self.input_bytes)
+            except Exception:
+                # Parsed again once the input or the parser changes
+                self.data = None
+                return [{"day": self.day, "part": None, "input": str(self.input_file), "reason": reason,
+                         "error": traceback.format_exc()}]
+            parse_time = time.perf_counter() - start
+        if self.data is None:
+            return results
+
+        for part in self.parts:
+            solver = getattr(self.module, f"part{part}", None)
+            if solver is None:
+                continue
+            key = (self.input_digest, cache.fingerprint(solver))
+            if self.solved.get(part) == key:
+                continue
+            result = {"day": self.day, "part": part, "input": str(self.input_file), "reason": reason or "solver changed"}
+            if parse_time is not None:
+                result["parse_time"] = parse_time
+            try:
+                start, start_cpu = time.perf_counter(), time.process_time()
+                result["answer"] = solver(self.data)
+                result["wall_time"] = time.perf_counter() - start
+                result["cpu_time"] = time.process_time() - start_cpu
+            except Exception:
+                result["error"] = traceback.format_exc()
+            # A failed part is not solved again until its input or its code changes
+            self.solved[part] = key
+            results.append(result)
+        return results
+
+
+class Watcher:
+    """ Watches several days and solves the affected parts of every day that changed. """
+
+    def __init__(self, days, parts=PARTS, input_file=None):
+        self.days = [WatchedDay(day, parts, input_file) for day in days]
+
+    def poll(self):
+        """ Check every day once and return the results of the parts solved again. """
+        results = []
+        for watched in self.days:
+            try:
+                results.extend(watched.update())
+                watched.error = None
+            except Exception:
+                # A file being replaced by an editor, or a solver that does not import yet
+                error = traceback.format_exc(limit=0)
+                if error != watched.error:
+                    watched.error = error
+                    results.append({"day": watched.day, "part": None, "input": str(watched.input_file), "error": error})
+        return results
+
+    def watch(self, report, interval=DEFAULT_INTERVAL):
+        """ Poll forever, calling ``report`` with the results of every poll that solved something. """
+        while True:
+            results = self.poll()
+            if results:
+                report(results)
+            time.sleep(interval)
@@ -0,0 +1,11 @@
+"""
+Puts the root of the repository on the path, so the tests import the aoc package and the
+solvers of the DayN directories however pytest is started.
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,96 @@
+import functools
+import sys
+
+from aoc import cache
+
+SCALE = 3
+NAMES = {"a": 1}
+
+
+def scaled(value):
+    return value * SCALE
+
+
+def named(name):
+    return NAMES[name]
+
+
+def through_helper(value):
+    return scaled(value) + 1
+
+
+@functools.lru_cache
+def memoized(value):
+    return scaled(value)
+
+
+def calls_memoized(value):
+    return memoized(value)
+
+
+def with_default(value, factor=SCALE):
+    return value * factor
+
+
+def test_fingerprint_covers_globals(monkeypatch):
+    module = sys.modules[__name__]
+    before = [cache.fingerprint(function) for function in (scaled, through_helper, calls_memoized, named)]
+    monkeypatch.setattr(module, "SCALE", 4)
+    monkeypatch.setattr(module, "NAMES", {"a": 2})
+    after = [cache.fingerprint(function) for function in (scaled, through_helper, calls_memoized, named)]
+    assert all(old != new for old, new in zip(before, after))
+
+
+def test_fingerprint_covers_defaults(monkeypatch):
+    before = cache.fingerprint(with_default)
+    monkeypatch.setattr(with_default, "__defaults__", (4,))
+    assert cache.fingerprint(with_default) != before
+
+
+def test_fingerprint_is_stable():
+    assert cache.fingerprint(named) == cache.fingerprint(named)
+    assert cache.fingerprint(scaled) != cache.fingerprint(named)
+
+
+def test_set_reprs_do_not_depend_on_the_hash_seed():
+    assert cache._data_repr({"b", "a", "c"}) == cache._data_repr({"c", "a", "b"})
+    assert cache._data_repr({"a": (1, b"x")}) != cache._data_repr({"a": (1, b"y")})
+    assert cache._data_repr(object()) is None
+
+
+def test_get_and_put(tmp_path):
+    disk = cache.DiskCache(tmp_path)
+    assert disk.put("ab" * 32, [1, 2, 3])
+    assert disk.get("ab" * 32) == [1, 2, 3]
+    assert disk.get("cd" * 32, "missing") == "missing"
+    assert not disk.put("ef" * 32, lambda: None)
+
+
+def test_get_ignores_unreadable_entries(tmp_path):
+    disk = cache.DiskCache(tmp_path)
+    path = disk.path("ab" * 32)
+    path.parent.mkdir(parents=True)
+    # An unsupported pickle protocol makes pickle.load raise ValueError
+    path.write_bytes(b"\x80\x63")
+    assert disk.get("ab" * 32, "missing") == "missing"
+    path.write_bytes(b"")
+    assert disk.get("ab" * 32, "missing") == "missing"
+
+
+def test_eviction_scans_only_past_the_limit(tmp_path, monkeypatch):
+    disk = cache.DiskCache(tmp_path, limit=1000)
+    scans = []
+    entries = disk.entries
+    monkeypatch.setattr(disk, "entries", lambda: scans.append(1) or entries())
+
+    disk.put("00" * 32, bytes(300))
+    assert len(scans) == 1  # the first put counts what is already there
+    disk.put("01" * 32, bytes(300))
+    disk.put("01" * 32, bytes(300))  # replacing an entry does not count it twice
+    assert len(scans) == 1
+    disk.put("02" * 32, bytes(300))
+    assert len(scans) == 1
+    disk.put("03" * 32, bytes(300))
+    assert len(scans) == 2
+    assert disk.size == sum(size for _, size, _ in entries()) <= disk.limit
+    assert disk.get("03" * 32) == bytes(300)
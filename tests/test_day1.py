@@ -0,0 +1,90 @@
+import pytest
+
+from aoc.days import load_day
+
+trebuchet = load_day(1)
+
+FIRST_EXAMPLE = b"""\
+1abc2
+pqr3stu8vwx
+a1b2c3d4e5f
+treb7uchet
+"""
+
+SECOND_EXAMPLE = b"""\
+two1nine
+eightwothree
+abcone2threexyz
+xtwone3four
+4nineeightseven2
+zoneight234
+7pqrstsixteen
+"""
+
+
+def test_examples():
+    assert trebuchet.part1(FIRST_EXAMPLE) == 142
+    assert trebuchet.part2(SECOND_EXAMPLE) == 281
+    assert trebuchet.part2(FIRST_EXAMPLE) == 142
+
+
+def test_examples_from_a_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(FIRST_EXAMPLE)
+    assert trebuchet.calibrate(path) == [142, 142]
+    path.write_bytes(SECOND_EXAMPLE)
+    assert trebuchet.part2(path) == 281
+
+
+def test_overlapping_words():
+    # The last word of "eightwo" is "two" even though it shares its "t" with "eight"
+    assert trebuchet.second_puzzle_solution(b"eightwo") == 82
+    assert trebuchet.second_puzzle_solution(b"oneight") == 18
+    assert trebuchet.second_puzzle_solution(b"twone") == 21
+    assert trebuchet.second_puzzle_solution(b"sevenine") == 79
+    assert trebuchet.part2(b"eightwo\noneight\n") == 82 + 18
+    matcher = trebuchet.digit_matcher()
+    assert (matcher.first(b"xeightwox"), matcher.last(b"xeightwox")) == (8, 2)
+
+
+def test_zero_is_a_digit_but_not_a_word():
+    assert trebuchet.part1(b"a0b\n50\n") == 0 + 50
+    assert trebuchet.part2(b"a0b\nzero5\n") == 0 + 55
+    with pytest.raises(ValueError):
+        trebuchet.second_puzzle_solution(b"zero")
+
+
+@pytest.mark.parametrize("part, expected", [(trebuchet.part1, 142), (trebuchet.part2, 142)])
+def test_crlf_line_endings(part, expected):
+    assert part(FIRST_EXAMPLE.replace(b"\n", b"\r\n")) == expected
+    assert part(FIRST_EXAMPLE.rstrip(b"\n")) == expected
+
+
+def test_text_and_bytes_give_the_same_answers():
+    assert trebuchet.part1(FIRST_EXAMPLE.decode()) == trebuchet.part1(FIRST_EXAMPLE) == 142
+    assert trebuchet.part2(SECOND_EXAMPLE.decode()) == trebuchet.part2(SECOND_EXAMPLE) == 281
+    for line in FIRST_EXAMPLE.decode().splitlines():
+        assert trebuchet.first_puzzle_solution(line) == trebuchet.first_puzzle_solution(line.encode())
+    for line in SECOND_EXAMPLE.decode().splitlines():
+        assert trebuchet.second_puzzle_solution(line) == trebuchet.second_puzzle_solution(line.encode())
+
+
+def test_text_lines_with_other_vocabularies():
+    assert trebuchet.second_puzzle_solution("fünfzehn3", "german") == 53
+    assert trebuchet.second_puzzle_solution("fünfzehn3".encode(), "german") == 53
+    assert trebuchet.part2("xdosx\nochoseis\n", "spanish") == 22 + 86
+
+
+def test_lines_without_digits():
+    for part in (trebuchet.part1, trebuchet.part2):
+        with pytest.raises(ValueError, match="nothing"):
+            part(b"1abc2\nnothing\n")
+    with pytest.raises(ValueError):
+        trebuchet.second_puzzle_solution("abc")
+    # A word of another vocabulary is not a digit
+    with pytest.raises(ValueError):
+        trebuchet.part2(b"eins\n")
+
+
+def test_empty_document():
+    assert trebuchet.calibrate(b"") == [0, 0]
@@ -0,0 +1,37 @@
+from aoc.days import load_day
+
+crucible = load_day(17)
+
+EXAMPLE = b"""\
+2413432311323
+3215453535623
+3255245654254
+3446585845452
+4546657867536
+1438598798454
+4457876987766
+3637877979653
+4654967986887
+4564679986453
+1224686865563
+2546548887735
+4322674655533
+"""
+
+
+def test_example():
+    assert crucible.part1(EXAMPLE) == 102
+    assert crucible.part2(EXAMPLE) == 94
+
+
+def test_zero_heat_loss_cell_is_not_a_wall():
+    # The cheapest path goes through the 0, which must not be taken for the border
+    assert crucible.part1(b"1111\n1011\n1111\n") == 4
+    assert crucible.part1(b"19\n09\n11\n") == 2
+
+
+def test_border_is_not_a_heat_loss_value():
+    grid = crucible.parse(b"00\n00\n")
+    assert grid.border not in grid.row(0) + grid.row(1)
+    assert [crucible.is_valid_position(index, grid) for index in range(grid.stride)] == [False] * grid.stride
+    assert all(crucible.is_valid_position(index, grid) for index in grid.indices())
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from aoc.days import load_day
+
+cubes = load_day(2)
+
+EXAMPLE = b"""\
+Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
+Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
+"""
+
+
+def test_example():
+    assert cubes.part1(EXAMPLE) == 8
+    assert cubes.part2(EXAMPLE) == 2286
+    assert cubes.part1(EXAMPLE.decode()) == 8
+    assert list(cubes.running_totals(EXAMPLE.splitlines()))[-1] == (8, 2286)
+
+
+def test_game_maxima_of_bytes_and_text():
+    record = "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red"
+    assert cubes.game_maxima(record) == cubes.game_maxima(record.encode()) == (4, 14, 3, 15)
+    assert cubes.game_maxima(b"Game 12: 2 green\r\n") == (12, 0, 2, 0)
+
+
+@pytest.mark.parametrize("record", [b"Game 1: 3 bogus", "Game 1: 2 red; 3 yellow", b"Game 1: 2 red, 1 greens"])
+def test_game_maxima_rejects_unknown_colors(record):
+    with pytest.raises(ValueError, match="unknown color"):
+        cubes.game_maxima(record)
+
+
+def random_games(rng, count, most):
+    colors = list(cubes.COLORS)
+    records = []
+    for game_id in rng.sample(range(1, 10 * count + 1), count):
+        reveals = ["; ".join(", ".join(f"{rng.randint(0, most)} {color}" for color in rng.sample(colors, rng.randint(1, 3)))
+                             for _ in range(rng.randint(1, 4)))]
+        records.append(f"Game {game_id}: {reveals[0]}")
+    return "\n".join(records).encode()
+
+
+def naive_possible_ids_sum(games, limits):
+    """ The per-bag filter: the games whose maxima all fit in the bag, one bag at a time. """
+    return sum(game_id for game_id, *maxima in map(cubes.game_maxima, games.splitlines())
+               if all(most <= limit for most, limit in zip(maxima, limits)))
+
+
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize("most", [5, 20, 10 ** 6])
+def test_batched_limits_against_the_per_bag_filter(seed, most):
+    rng = random.Random(seed)
+    source = random_games(rng, rng.randint(0, 60), most)
+    games = cubes.parse(source)
+    bounds = most + 2
+    limits = [tuple(rng.randint(-1, bounds) for _ in range(3)) for _ in range(rng.randint(0, 40))]
+    limits.append((cubes.red_limit, cubes.green_limit, cubes.blue_limit))
+    expected = [naive_possible_ids_sum(source, bag) for bag in limits]
+    assert games.possible_ids_sums(limits) == expected
+    assert cubes.possible_ids_sums(source, iter(limits)) == expected
+    assert [games.possible_ids_sum(*bag) for bag in limits] == expected
+
+
+def test_batched_limits_of_no_games():
+    assert cubes.possible_ids_sums(b"", [(1, 2, 3)]) == [0]
+    assert cubes.possible_ids_sums(EXAMPLE, []) == []
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fenwick_tree_against_brute_force(seed):
+    rng = random.Random(seed)
+    rows = rng.randint(1, 12)
+    points = [(rng.randint(1, rows), rng.randint(-5, 10 ** rng.randint(1, 9))) for _ in range(rng.randint(1, 40))]
+    tree = cubes.FenwickTree2D(rows, points)
+    added = {}
+    for _ in range(60):
+        row, column = rng.choice(points)
+        value = rng.randint(-3, 9)
+        tree.add(row, column, value)
+        added[row, column] = added.get((row, column), 0) + value
+        query_row, query_column = rng.randint(0, rows), rng.choice([column for _, column in points]) + rng.randint(-1, 1)
+        assert tree.prefix_sum(query_row, query_column) == sum(
+            total for (row, column), total in added.items() if row <= query_row and column <= query_column)
+
+
+def test_fenwick_tree_size_follows_the_points():
+    # Distinct maxima in every game: a dense tree would need a million cells, this one a few per point
+    points = [(row, 1000 * row) for row in range(1, 1001)]
+    tree = cubes.FenwickTree2D(1000, points)
+    assert sum(map(len, tree.sums)) <= len(points) * 12
@@ -0,0 +1,27 @@
+from aoc.days import load_day
+
+scratchcards = load_day(4)
+
+EXAMPLE = """\
+Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+Card 4: 41 92 73 84 69 | 59 84 76 51 32 83 77 11
+Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
+"""
+
+
+def test_example():
+    assert scratchcards.part1(EXAMPLE.encode()) == 13
+    assert scratchcards.part2(EXAMPLE.encode()) == 30
+    assert scratchcards.process_scratchcards(scratchcards.parse(EXAMPLE)) == [1, 2, 4, 8, 14, 1]
+
+
+def test_text_and_bytes_lines():
+    text_lines = EXAMPLE.splitlines()
+    byte_lines = EXAMPLE.encode().splitlines()
+    for lines in (text_lines, byte_lines, EXAMPLE):
+        assert scratchcards.part1(lines) == 13
+        assert scratchcards.part2(lines) == 30
+    assert [scratchcards.parse_and_calculate_card_points(line) for line in text_lines] == [8, 2, 2, 1, 0, 0]
@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from aoc import generators
+from aoc.days import load_day
+
+races = load_day(6)
+
+EXAMPLE = b"""\
+Time:      7  15   30
+Distance:  9  40  200
+"""
+
+
+def test_example():
+    assert races.part1(EXAMPLE) == 288
+    assert races.part2(EXAMPLE) == 71503
+
+
+def test_single_race_ignores_the_spaces():
+    assert races.single_race(*races.parse(EXAMPLE)) == (71530, 940200)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_generated_races(seed):
+    text, answers = generators.generate_day6(1, random.Random(seed))
+    assert races.part1(text) == answers[1]
+    assert races.part2(text) == answers[2]
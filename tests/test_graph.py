@@ -0,0 +1,205 @@
+import random
+
+import pytest
+
+from aoc.graph import (UNREACHED, Graph, bfs_distances, connected_components, dijkstra, longest_path_in_dag,
+                       settled_nodes, shortest_distance, shortest_path)
+
+SEEDS = range(20)
+
+
+def random_edges(rng, size, edge_count, max_weight=5):
+    return [(rng.randrange(size), rng.randrange(size), rng.randint(0, max_weight)) for _ in range(edge_count)]
+
+
+def reference_distances(size, edges, sources):
+    """ Bellman-Ford, relaxing every edge until nothing changes. """
+    distances = [None] * size
+    for source in sources:
+        distances[source] = 0
+    changed = True
+    while changed:
+        changed = False
+        for source, target, weight in edges:
+            if distances[source] is not None and (distances[target] is None or distances[source] + weight < distances[target]):
+                distances[target] = distances[source] + weight
+                changed = True
+    return [UNREACHED if distance is None else distance for distance in distances]
+
+
+def reference_components(size, edges):
+    """ Union-find over the undirected edges. """
+    parents = list(range(size))
+
+    def root(node):
+        while parents[node] != node:
+            node = parents[node]
+        return node
+
+    for a, b in edges:
+        parents[root(a)] = root(b)
+    groups = {}
+    for node in range(size):
+        groups.setdefault(root(node), []).append(node)
+    return sorted(map(sorted, groups.values()))
+
+
+def test_csr_layout():
+    graph = Graph([[1, 2], [], [0, 0, 1]], [[5, 6], [], [7, 8, 9]])
+    assert len(graph) == 3
+    assert graph.edge_count == 5
+    assert list(graph.offsets) == [0, 2, 2, 5]
+    assert list(graph.targets) == [1, 2, 0, 0, 1]
+    assert list(graph.neighbours(2)) == [0, 0, 1]
+    assert list(graph.edges(0)) == [(1, 5), (2, 6)]
+    assert list(graph.edges(1)) == []
+    assert list(Graph([[1], [0]]).weights) == [1, 1]
+
+
+def test_from_edges_keeps_the_order():
+    graph = Graph.from_edges(3, [(2, 0, 4), (0, 1, 3), (2, 1, 2)])
+    assert list(graph.edges(0)) == [(1, 3)]
+    assert list(graph.edges(2)) == [(0, 4), (1, 2)]
+
+
+def test_from_adjacency():
+    graph = Graph.from_adjacency({"AAA": ["BBB", "CCC"], "CCC": ["AAA"]})
+    assert graph.labels == ["AAA", "BBB", "CCC"]
+    assert graph.ids == {"AAA": 0, "BBB": 1, "CCC": 2}
+    assert [list(graph.neighbours(node)) for node in range(3)] == [[1, 2], [], [0]]
+    weighted = Graph.from_adjacency({"a": {"b": 3}, "b": {"a": 4}})
+    assert list(weighted.edges(1)) == [(0, 4)]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_bfs_against_unit_weights(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 30)
+    edges = [(a, b, 1) for a, b, _ in random_edges(rng, size, rng.randint(0, 60))]
+    graph = Graph.from_edges(size, edges)
+    expected = reference_distances(size, edges, [0])
+    assert list(bfs_distances(graph, 0)) == expected
+    assert list(bfs_distances(graph, 0, 2)) == [distance if distance <= 2 else UNREACHED for distance in expected]
+
+    target = rng.randrange(size)
+    path = shortest_path(graph, 0, target)
+    if expected[target] == UNREACHED:
+        assert path is None
+    else:
+        assert path[0] == 0 and path[-1] == target and len(path) == expected[target] + 1
+        assert all(b in graph.neighbours(a) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_dial_against_bellman_ford(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 40)
+    edges = random_edges(rng, size, rng.randint(0, 100))
+    graph = Graph.from_edges(size, edges)
+    sources = rng.sample(range(size), rng.randint(1, min(3, size)))
+    expected = reference_distances(size, edges, sources)
+    assert list(dijkstra(graph, sources)) == expected
+
+    targets = rng.sample(range(size), rng.randint(1, size))
+    reachable = [expected[target] for target in targets if expected[target] != UNREACHED]
+    assert shortest_distance(graph, sources, targets) == (min(reachable) if reachable else None)
+
+
+def test_dial_zero_weight_edges():
+    # 0 -> 1 -> 2 -> 3 all cost nothing and are found while the first bucket is being read
+    graph = Graph.from_edges(5, [(0, 1, 0), (1, 2, 0), (2, 3, 0), (0, 4, 1), (3, 4, 0)])
+    assert list(dijkstra(graph, [0])) == [0, 0, 0, 0, 0]
+    assert list(settled_nodes(graph, [0])) == [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)]
+
+
+def test_dial_skips_stale_entries():
+    # 3 is pushed at distance 9, then improved to 3 through 1 and 2: it is settled once, at 3
+    graph = Graph.from_edges(4, [(0, 3, 9), (0, 1, 1), (1, 2, 1), (2, 3, 1)])
+    assert list(settled_nodes(graph, [0])) == [(0, 0), (1, 1), (2, 2), (3, 3)]
+
+
+def test_dial_reads_its_sources_once():
+    graph = Graph.from_edges(3, [(0, 2, 2), (1, 2, 1)])
+    assert list(settled_nodes(graph, iter([0, 1, 0]))) == [(0, 0), (1, 0), (2, 1)]
+
+
+def test_dial_bucket_type():
+    pushes = []
+
+    class Bucket(list):
+        def append(self, node):
+            pushes.append(node)
+            super().append(node)
+
+    graph = Graph.from_edges(3, [(0, 1, 2), (0, 2, 5), (1, 2, 1)])
+    assert shortest_distance(graph, [0], [2], Bucket) == 3
+    assert pushes == [1, 2, 2]
+
+
+def test_longest_path_in_dag():
+    graph = Graph.from_edges(5, [(0, 1, 1), (0, 2, 5), (1, 3, 10), (2, 3, 1), (3, 4, 2)])
+    assert longest_path_in_dag(graph, 0, 4) == 13
+    assert longest_path_in_dag(graph, 2, 4) == 3
+    assert longest_path_in_dag(graph, 4, 0) is None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_longest_path_against_enumeration(seed):
+    rng = random.Random(seed)
+    size = rng.randint(2, 9)
+    # Edges only go to higher nodes, so the graph has no cycle
+    edges = [(a, b, w) for a, b, w in random_edges(rng, size, rng.randint(0, 25), 9) if a < b]
+    graph = Graph.from_edges(size, edges)
+
+    def heaviest(node):
+        if node == size - 1:
+            return 0
+        paths = [weight + rest for source, target, weight in edges if source == node
+                 for rest in [heaviest(target)] if rest is not None]
+        return max(paths, default=None)
+
+    assert longest_path_in_dag(graph, 0, size - 1) == heaviest(0)
+
+
+def test_kahn_detects_cycles():
+    cycle = Graph.from_edges(4, [(0, 1, 1), (1, 2, 1), (2, 1, 1), (2, 3, 1)])
+    with pytest.raises(ValueError):
+        longest_path_in_dag(cycle, 0, 3)
+    through_source = Graph.from_edges(2, [(0, 1, 1), (1, 0, 1)])
+    with pytest.raises(ValueError):
+        longest_path_in_dag(through_source, 0, 1)
+    # A cycle the source cannot reach does not matter
+    unreachable_cycle = Graph.from_edges(4, [(0, 1, 1), (2, 3, 1), (3, 2, 1)])
+    assert longest_path_in_dag(unreachable_cycle, 0, 1) == 1
+
+
+def undirected(size, pairs):
+    neighbours = [[] for _ in range(size)]
+    for a, b in pairs:
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+    return Graph(neighbours)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_connected_components_against_union_find(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 30)
+    pairs = [(a, b) for a, b, _ in random_edges(rng, size, rng.randint(0, 30))]
+    graph = undirected(size, pairs)
+    removed = rng.sample(pairs, len(pairs) // 3)
+    # Removed edges are given in either direction, and a generator is read only once
+    flipped = [(b, a) if rng.random() < 0.5 else (a, b) for a, b in removed]
+    kept = [pair for pair in pairs if pair not in removed and pair[::-1] not in removed]
+
+    components = connected_components(graph, (pair for pair in flipped))
+    assert [component[0] for component in components] == sorted(component[0] for component in components)
+    assert sorted(map(sorted, components)) == reference_components(size, kept)
+    assert sorted(map(sorted, connected_components(graph))) == reference_components(size, pairs)
+
+
+def test_connected_components_cut():
+    # Two triangles joined by one edge, cut like the wires of Day 25
+    graph = undirected(6, [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (2, 3)])
+    assert len(connected_components(graph)) == 1
+    assert sorted(map(sorted, connected_components(graph, [(3, 2)]))) == [[0, 1, 2], [3, 4, 5]]
@@ -0,0 +1,74 @@
+import pytest
+
+from aoc.grid import BORDER, Grid
+
+LINES = [b"abc", b"def"]
+
+
+def test_padded_indexing():
+    grid = Grid.from_lines(LINES, pad=2)
+    assert (grid.width, grid.height, grid.stride) == (3, 2, 7)
+    assert len(grid.cells) == 7 * 6
+    assert grid.index(0, 0) == 2 * 7 + 2
+    for row, line in enumerate(LINES):
+        for col, value in enumerate(line):
+            index = grid.index(row, col)
+            assert grid[index] == value
+            assert grid.position(index) == (row, col)
+            assert grid.inside(index)
+    assert list(grid.indices()) == [grid.index(row, col) for row in range(2) for col in range(3)]
+    assert grid.cells.count(BORDER) == len(grid.cells) - 6
+    assert not any(grid.inside(index) for index in range(len(grid.cells)) if grid[index] == BORDER)
+
+
+def test_neighbours_stay_in_the_storage():
+    grid = Grid.from_lines(LINES)
+    for index in grid.indices():
+        for offset in grid.neighbours:
+            assert 0 <= index + offset < len(grid.cells)
+    index = grid.index(1, 1)
+    assert [grid[index + offset] for offset in grid.directions] == [ord("b"), ord("f"), BORDER, ord("d")]
+
+
+def test_from_text_and_str():
+    grid = Grid.from_text("abc\r\ndef\r\n\r\n")
+    assert grid.rows() == LINES
+    assert str(grid) == "abc\ndef"
+    with pytest.raises(ValueError):
+        Grid.from_lines([b"abc", b"de"])
+
+
+def test_find():
+    grid = Grid.from_lines([b"ab.", b"b.b"], border=ord("#"))
+    assert grid.find(ord("b")) == grid.index(0, 1)
+    assert grid.find(ord("x")) == -1
+    assert grid.find_all(ord("b")) == [grid.index(0, 1), grid.index(1, 0), grid.index(1, 2)]
+
+
+def test_find_skips_border_bytes():
+    # The border is '.', so a plain search from the first cell runs into the padding between rows
+    grid = Grid.from_lines([b"ab", b".c"], border=ord("."))
+    assert grid.find(ord(".")) == grid.index(1, 0)
+    grid = Grid.from_lines([b"ab", b"cd"], border=ord("."))
+    assert grid.find(ord(".")) == -1
+
+
+def test_transposed_and_rotated():
+    grid = Grid.from_lines(LINES, pad=2, border=ord("#"))
+    transposed = grid.transposed()
+    assert transposed.rows() == [b"ad", b"be", b"cf"]
+    assert (transposed.pad, transposed.border) == (2, ord("#"))
+    assert transposed.transposed() == grid
+    rotated = grid.rotated()
+    assert rotated.rows() == [b"da", b"eb", b"fc"]
+    assert rotated.rotated().rotated().rotated() == grid
+
+
+def test_column_slicing():
+    grid = Grid.from_lines([b"abcd", b"efgh", b"ijkl"], pad=3)
+    assert grid.columns() == [b"aei", b"bfj", b"cgk", b"dhl"]
+    assert grid.column(3) == b"dhl"
+    copy = grid.copy()
+    copy[copy.index(2, 3)] = ord("x")
+    assert copy.column(3) == b"dhx"
+    assert grid.column(3) == b"dhl"
@@ -0,0 +1,159 @@
+"""
+Property tests of aoc.intervals against plain sets of the integers they hold, on random small
+intervals and boxes.
+"""
+import random
+from itertools import product
+
+import pytest
+
+from aoc.intervals import (IntervalSet, PiecewiseLinear, box_volume, coalesce, intersect_boxes, split_box,
+                           subtract_box, union_volume)
+
+SEEDS = range(50)
+LOW, HIGH = -10, 30
+
+
+def random_intervals(rng, count=None):
+    intervals = []
+    for _ in range(rng.randint(0, 6) if count is None else count):
+        start = rng.randint(LOW, HIGH)
+        # Empty and reversed intervals too, which hold nothing
+        intervals.append((start, start + rng.randint(-2, 12)))
+    return intervals
+
+
+def points(intervals):
+    return {number for start, end in intervals for number in range(start, end)}
+
+
+def random_box(rng, dimensions):
+    return tuple((start, start + rng.randint(1, 5)) for start in (rng.randint(0, 8) for _ in range(dimensions)))
+
+
+def box_points(box):
+    return set() if box is None else set(product(*(range(start, end) for start, end in box)))
+
+
+def assert_normalised(numbers):
+    """ Sorted, disjoint, non-empty and coalesced intervals. """
+    intervals = numbers.intervals
+    assert all(start < end for start, end in intervals)
+    assert all(previous[1] < start for previous, (start, _) in zip(intervals, intervals[1:]))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_interval_set_operations(seed):
+    rng = random.Random(seed)
+    a, b = random_intervals(rng), random_intervals(rng)
+    first, second = IntervalSet(a), IntervalSet(b)
+    assert coalesce(a) == first.intervals
+    assert points(first) == points(a)
+    assert first.size == len(points(a))
+
+    for result, expected in ((first | second, points(a) | points(b)), (first & second, points(a) & points(b)),
+                             (first - second, points(a) - points(b)), (second - first, points(b) - points(a))):
+        assert_normalised(result)
+        assert points(result) == expected
+
+    for number in range(LOW - 2, HIGH + 15):
+        assert (number in first) == (number in points(a))
+
+    threshold = rng.randint(LOW, HIGH)
+    below, above = first.split(threshold)
+    assert points(below) == {number for number in points(a) if number < threshold}
+    assert points(above) == {number for number in points(a) if number >= threshold}
+
+
+def test_interval_set_basics():
+    numbers = IntervalSet.from_lengths([(10, 3), (13, 2), (0, 0), (20, 1)])
+    assert numbers.intervals == [(10, 15), (20, 21)]
+    assert numbers == IntervalSet([(20, 21), (10, 12), (11, 15)])
+    assert numbers.min() == 10
+    assert not IntervalSet([(3, 3)])
+    with pytest.raises(ValueError):
+        IntervalSet().min()
+
+
+def random_pieces(rng):
+    return [(start, end, rng.randint(-15, 15)) for start, end in random_intervals(rng)]
+
+
+def reference_function(pieces):
+    """ The offset of the first piece, in order of start then of position, that holds a number. """
+    ordered = sorted(pieces, key=lambda piece: piece[0])
+
+    def function(number):
+        for start, end, offset in ordered:
+            if start <= number < end:
+                return number + offset
+        return number
+    return function
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_piecewise_linear(seed):
+    rng = random.Random(seed)
+    pieces = random_pieces(rng)
+    function, reference = PiecewiseLinear(pieces), reference_function(pieces)
+    for number in range(LOW - 2, HIGH + 15):
+        assert function(number) == reference(number)
+
+    # The pieces end up disjoint and sorted
+    assert all(previous[1] <= start for previous, (start, _, _) in zip(function.pieces, function.pieces[1:]))
+
+    a = random_intervals(rng)
+    image = function.image(IntervalSet(a))
+    assert_normalised(image)
+    assert points(image) == {reference(number) for number in points(a)}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_piecewise_linear_composition(seed):
+    # Pushing a set through several functions in turn, as Day 5 does with its almanac maps
+    rng = random.Random(seed)
+    functions = [PiecewiseLinear(random_pieces(rng)) for _ in range(rng.randint(1, 5))]
+    numbers = IntervalSet(random_intervals(rng))
+    expected = points(numbers)
+    for function in functions:
+        numbers = function.image(numbers)
+        expected = {function(number) for number in expected}
+    assert points(numbers) == expected
+    if expected:
+        assert numbers.min() == min(expected)
+
+
+def test_piecewise_linear_overlaps():
+    # The piece that starts first wins, and among equal starts the first one given
+    function = PiecewiseLinear([(5, 10, 100), (0, 7, 1), (0, 3, 50)])
+    assert [function(number) for number in (0, 6, 7, 9, 10)] == [1, 7, 107, 109, 10]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_boxes(seed):
+    rng = random.Random(seed)
+    dimensions = rng.randint(1, 3)
+    box, other = random_box(rng, dimensions), random_box(rng, dimensions)
+    assert box_volume(box) == len(box_points(box))
+    assert box_volume(None) == 0
+
+    assert box_points(intersect_boxes(box, other)) == box_points(box) & box_points(other)
+
+    axis, threshold = rng.randrange(dimensions), rng.randint(0, 14)
+    below, above = split_box(box, axis, threshold)
+    assert box_points(below) == {point for point in box_points(box) if point[axis] < threshold}
+    assert box_points(above) == {point for point in box_points(box) if point[axis] >= threshold}
+
+    pieces = subtract_box(box, other)
+    assert len(pieces) <= 2 * dimensions or pieces == [box]
+    covered = [box_points(piece) for piece in pieces]
+    assert sum(map(len, covered)) == len(set().union(*covered))  # disjoint
+    assert set().union(*covered) == box_points(box) - box_points(other)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_union_volume(seed):
+    rng = random.Random(seed)
+    dimensions = rng.randint(1, 3)
+    boxes = [random_box(rng, dimensions) for _ in range(rng.randint(0, 6))] + [None]
+    assert union_volume(boxes) == len(set().union(*map(box_points, boxes)))